@@ -15,22 +15,188 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import json
 import os
+import random
 import uuid
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import IO, Callable, Iterable, Iterator, Optional
+
+import cbor2
 
 from .esports.moba.champion import Champion
 from .esports.moba.generator import ChampionGenerator, MobaTeamGenerator
-from .esports.moba.mobaplayer import MobaPlayer
+from .esports.moba.mobaplayer import Lanes, MobaPlayer
 from .esports.moba.mobaregion import MobaRegion
 from .esports.moba.mobateam import MobaTeam
 from .gamestate import GameState
+from .serializable import Serializable
+from .sqlite_db import SQLiteDB
+from .utils.process_pool import create_process_pool, get_worker_context, map_bounded
+from .utils.seed import SeedTree, generate_uuid, get_rng
+
+
+@dataclass
+class MobaWorld:
+    champions: list[Champion]
+    regions: list[MobaRegion]
+    free_agents: list[MobaPlayer] = field(default_factory=list)
+
+    @property
+    def teams(self) -> list[MobaTeam]:
+        return [team for region in self.regions for team in region.teams]
+
+    @property
+    def players(self) -> list[MobaPlayer]:
+        return DB.get_moba_players_from_teams(self.teams) + self.free_agents
+
+
+class StreamFileError(Exception):
+    pass
+
+
+class EntityStreamWriter:
+    """
+    Writes serialized entities to a file one at a time, so they do not have to be
+    kept in memory until the whole file is written. The format depends on the file
+    extension: newline-delimited JSON for .ndjson and .jsonl files, and a CBOR
+    sequence (one CBOR item after the other) for .cbor files.
+    """
+
+    JSON_EXTENSIONS = [".ndjson", ".jsonl"]
+    CBOR_EXTENSIONS = [".cbor"]
+
+    def __init__(self, filepath: Path):
+        if filepath.suffix not in self.JSON_EXTENSIONS + self.CBOR_EXTENSIONS:
+            raise StreamFileError(f"Unsupported stream file: {filepath}")
+
+        self.filepath = filepath
+        self.count = 0
+        self.fp: Optional[IO] = None
+
+    @classmethod
+    def encode(cls, data: dict, extension: str) -> bytes:
+        if extension in cls.CBOR_EXTENSIONS:
+            return cbor2.dumps(data)
+
+        return json.dumps(data, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    def open(self) -> None:
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self.fp = self.filepath.open("wb")
+
+    def write(self, data: dict) -> None:
+        self.write_encoded(self.encode(data, self.filepath.suffix))
+
+    def write_encoded(self, data: bytes, count: int = 1) -> None:
+        """
+        Writes entities that were already encoded, e.g. by a worker process.
+        """
+        self.fp.write(data)
+        self.count += count
+
+    def close(self) -> None:
+        if self.fp is not None:
+            self.fp.close()
+            self.fp = None
+
+    def __enter__(self) -> "EntityStreamWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def read_entity_stream(filepath: Path) -> Iterator[dict]:
+    """
+    Reads the entities of a file written by EntityStreamWriter one at a time.
+    """
+    if filepath.suffix in EntityStreamWriter.CBOR_EXTENSIONS:
+        with filepath.open("rb") as fp:
+            decoder = cbor2.CBORDecoder(fp)
+            while True:
+                try:
+                    yield decoder.decode()
+                except cbor2.CBORDecodeEOF:
+                    return
+    elif filepath.suffix in EntityStreamWriter.JSON_EXTENSIONS:
+        with filepath.open("r", encoding="utf-8") as fp:
+            for line in fp:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        raise StreamFileError(f"Unsupported stream file: {filepath}")
+
+
+def generate_region(
+    region: dict, seed: int, amount_champions: int = 0
+) -> tuple[MobaRegion, list[MobaPlayer]]:
+    """
+    Generates a region, its teams and its free agents from the region's seed. This
+    runs inside the worker processes, which get the champions and player names as
+    their context.
+
+    Besides the region file, a region definition may have the team definitions in
+    "teams", an amount of "free_agents" and their "nationality".
+
+    Each region has its own player generator, so nicknames are unique within a
+    region, but players of different regions may share a nickname.
+    """
+    champions, player_names = get_worker_context()
+    db = DB()
+    rng = random.Random(seed)
+    team_gen = MobaTeamGenerator(
+        champions, player_names, rng=rng, amount_champions=amount_champions
+    )
+    teams = [team_gen.generate(team) for team in db.get_team_definitions(region)]
+    amount_free_agents = region.get("free_agents", 0)
+    free_agents = team_gen.player_gen.generate_many(
+        amount_free_agents,
+        rng.choices(list(Lanes), k=amount_free_agents),
+        region.get("nationality"),
+        amount_champions=amount_champions,
+    )
+    return db.generate_moba_region(region, teams, rng), free_agents
+
+
+@dataclass
+class EncodedRegion:
+    teams: bytes
+    players: bytes
+    region: bytes
+    amount_teams: int
+    amount_players: int
+
+
+def encode_region(
+    region: dict, seed: int, extension: str, amount_champions: int = 0
+) -> EncodedRegion:
+    """
+    Generates a region and encodes its entities for a stream file inside the worker
+    process, so the main process only has to write them.
+    """
+    moba_region, free_agents = generate_region(region, seed, amount_champions)
+    players = DB.get_moba_players_from_teams(moba_region.teams) + free_agents
+    encode = EntityStreamWriter.encode
+    return EncodedRegion(
+        b"".join(encode(team.serialize(), extension) for team in moba_region.teams),
+        b"".join(encode(player.serialize(), extension) for player in players),
+        encode(moba_region.serialize(), extension),
+        len(moba_region.teams),
+        len(players),
+    )
 
 
 class DB:
+    def __init__(self, database: Optional[SQLiteDB] = None):
+        self.database = database
+
     def generate_moba_champions(
-        self, champion_defs: list[dict[str, str | int]]
+        self,
+        champion_defs: list[dict[str, str | int]],
+        rng: Optional[random.Random] = None,
     ) -> list[Champion]:
-        champion_gen = ChampionGenerator()
+        champion_gen = ChampionGenerator(rng)
         return [champion_gen.generate(champion_def) for champion_def in champion_defs]
 
     def generate_moba_teams(
@@ -38,8 +204,9 @@ class DB:
         player_names: list[dict[str, dict[str, str | int]]],
         champions_list: list[Champion],
         teams_def: list[dict[str, str | int]],
+        rng: Optional[random.Random] = None,
     ) -> list[MobaTeam]:
-        team_gen = MobaTeamGenerator(champions_list, player_names)
+        team_gen = MobaTeamGenerator(champions_list, player_names, rng=rng)
         return [team_gen.generate(team_def) for team_def in teams_def]
 
     def get_moba_region_definitions(
@@ -55,10 +222,13 @@ class DB:
         return regions
 
     def generate_moba_region(
-        self, region: dict[str, str], teams: list[MobaTeam]
+        self,
+        region: dict[str, str],
+        teams: list[MobaTeam],
+        rng: Optional[random.Random] = None,
     ) -> MobaRegion:
         return MobaRegion(
-            uuid.uuid4(),
+            generate_uuid(get_rng(rng)),
             region["id"],
             region["name"],
             region["short_name"],
@@ -70,24 +240,105 @@ class DB:
         region: dict[str, str],
         champions: list[Champion],
         player_names: list[dict[str, dict[str, str | int]]],
+        rng: Optional[random.Random] = None,
     ) -> list[MobaTeam]:
+        teams_list = self.get_team_definitions(region)
+        return self.generate_moba_teams(player_names, champions, teams_list, rng)
+
+    @staticmethod
+    def get_team_definitions(region: dict) -> list[dict[str, str | int]]:
+        if "teams" in region:
+            return region["teams"]
+
         team_file = Path(region["filename"])
         with team_file.open("r", encoding="utf-8") as fp:
-            teams_list = json.load(fp)
-        return self.generate_moba_teams(player_names, champions, teams_list)
+            return json.load(fp)
 
     def extract_regions_from_region_file(
         self,
         regions: list[dict[str, str]],
         champions: list[Champion],
         player_names: list[dict[str, dict[str, str | int]]],
+        seed_tree: Optional[SeedTree] = None,
+        max_workers: Optional[int] = None,
     ) -> list[MobaRegion]:
-        return [
-            self.generate_moba_region(
-                region, self.extract_teams_from_region(region, champions, player_names)
+        """
+        Generates the regions in a process pool. Each region gets its own seed,
+        derived from its ID, and the regions are returned in the same order as the
+        definitions, so the result does not depend on the amount of workers.
+        """
+        return list(
+            self.iter_moba_regions(
+                regions, champions, player_names, seed_tree, max_workers
             )
+        )
+
+    def iter_moba_regions(
+        self,
+        regions: list[dict[str, str]],
+        champions: list[Champion],
+        player_names: list[dict[str, dict[str, str | int]]],
+        seed_tree: Optional[SeedTree] = None,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[MobaRegion]:
+        """
+        Same as extract_regions_from_region_file, but yields each region as soon as
+        it is generated.
+        """
+        for region, _ in self.map_regions(
+            generate_region, regions, champions, player_names, seed_tree, max_workers
+        ):
+            yield region
+
+    @staticmethod
+    def map_regions(
+        function: Callable,
+        regions: list[dict[str, str]],
+        champions: list[Champion],
+        player_names: list[dict[str, dict[str, str | int]]],
+        seed_tree: Optional[SeedTree] = None,
+        max_workers: Optional[int] = None,
+        *args,
+    ) -> Iterator:
+        """
+        Calls the function with each region, its seed and the extra arguments in a
+        process pool, and yields the results in the order of the regions. Only a few
+        regions are in flight at a time, so memory does not grow with the world.
+        """
+        if seed_tree is None:
+            seed_tree = SeedTree(random.getrandbits(64))
+        tasks = (
+            (region, seed_tree.spawn("region", region["id"]).seed, *args)
             for region in regions
-        ]
+        )
+        with create_process_pool((champions, player_names), max_workers) as executor:
+            yield from map_bounded(executor, function, tasks, max_workers)
+
+    def generate_moba_world(
+        self,
+        champion_defs: list[dict[str, str | int]],
+        regions: list[dict[str, str]],
+        player_names: list[dict[str, dict[str, str | int]]],
+        seed_tree: Optional[SeedTree] = None,
+        max_workers: Optional[int] = None,
+    ) -> MobaWorld:
+        """
+        Generates the champions and every region of a new game from the same master
+        seed. Champions are generated first, since all regions share them.
+        """
+        if seed_tree is None:
+            seed_tree = SeedTree(random.getrandbits(64))
+        champions = self.generate_moba_champions(
+            champion_defs, seed_tree.spawn("champions").get_rng()
+        )
+        world = MobaWorld(champions, [])
+        for region, free_agents in self.map_regions(
+            generate_region, regions, champions, player_names, seed_tree, max_workers
+        ):
+            world.regions.append(region)
+            world.free_agents.extend(free_agents)
+
+        return world
 
     @staticmethod
     def get_moba_players_from_teams(teams_list: list[MobaTeam]) -> list[MobaPlayer]:
@@ -124,11 +375,20 @@ class DB:
         return {region.region_id.hex: region.serialize() for region in regions_list}
 
     def generate_moba_file(
-        self, filepath: Path, serialized_data: dict[str, dict[str, str | list[str]]]
+        self,
+        filepath: Path,
+        serialized_data: dict[str, dict[str, str | list[str]]],
+        pretty: bool = False,
     ) -> None:
         filepath.parent.mkdir(parents=True, exist_ok=True)
         with open(filepath, "w", encoding="utf-8") as fp:
-            json.dump(serialized_data, fp, indent=4, ensure_ascii=False, sort_keys=True)
+            json.dump(
+                serialized_data,
+                fp,
+                indent=4 if pretty else None,
+                ensure_ascii=False,
+                sort_keys=True,
+            )
 
     def generate_moba_files(
         self,
@@ -140,22 +400,151 @@ class DB:
         teams_list: list[MobaTeam],
         regions: list[MobaRegion],
         players_list: list[MobaPlayer],
+        pretty: bool = False,
     ) -> None:
         serialized_champions = self.serialize_champions(champions_list=champions_list)
         serialized_teams = self.serialize_teams(teams_list=teams_list)
         serialized_players = self.serialize_players(players_list=players_list)
         serialized_regions = self.serialize_regions(regions_list=regions)
 
-        self.generate_moba_file(champions_file, serialized_champions)
-        self.generate_moba_file(teams_file, serialized_teams)
-        self.generate_moba_file(players_file, serialized_players)
-        self.generate_moba_file(regions_file, serialized_regions)
+        self.generate_moba_file(champions_file, serialized_champions, pretty)
+        self.generate_moba_file(teams_file, serialized_teams, pretty)
+        self.generate_moba_file(players_file, serialized_players, pretty)
+        self.generate_moba_file(regions_file, serialized_regions, pretty)
+
+    @staticmethod
+    def write_moba_stream(filepath: Path, entities: Iterable[Serializable]) -> int:
+        """
+        Writes the entities to a stream file while they are consumed from the
+        iterable. Returns the amount of entities written.
+        """
+        with EntityStreamWriter(filepath) as writer:
+            for entity in entities:
+                writer.write(entity.serialize())
+
+        return writer.count
+
+    def generate_moba_world_streams(
+        self,
+        champion_defs: list[dict[str, str | int]],
+        regions: list[dict[str, str]],
+        player_names: list[dict[str, dict[str, str | int]]],
+        champions_file: Path,
+        teams_file: Path,
+        players_file: Path,
+        regions_file: Path,
+        seed_tree: Optional[SeedTree] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Streaming version of generate_moba_world followed by generate_moba_files.
+        The workers encode each region's teams and players, which are written as
+        soon as the region is ready, so only the champions and the few regions in
+        flight are kept in memory. The world is the same one generate_moba_world
+        returns for the same seed.
+        """
+        if seed_tree is None:
+            seed_tree = SeedTree(random.getrandbits(64))
+        champions = self.generate_moba_champions(
+            champion_defs, seed_tree.spawn("champions").get_rng()
+        )
+        self.write_moba_world_streams(
+            champions,
+            regions,
+            player_names,
+            champions_file,
+            teams_file,
+            players_file,
+            regions_file,
+            seed_tree,
+            max_workers,
+        )
+
+    def write_moba_world_streams(
+        self,
+        champions: list[Champion],
+        regions: list[dict],
+        player_names: list[dict[str, dict[str, str | int]]],
+        champions_file: Path,
+        teams_file: Path,
+        players_file: Path,
+        regions_file: Path,
+        seed_tree: Optional[SeedTree] = None,
+        max_workers: Optional[int] = None,
+        amount_champions: int = 0,
+    ) -> None:
+        """
+        Writes the champions, then generates the regions and writes their teams,
+        players and free agents. amount_champions sets the size of every player's
+        champion pool, or a random size if it is 0.
+        """
+        files = [champions_file, teams_file, players_file, regions_file]
+        if len({file.suffix for file in files}) != 1:
+            raise StreamFileError("Every stream file must have the same format!")
+
+        self.write_moba_stream(champions_file, champions)
+        with (
+            EntityStreamWriter(teams_file) as teams_writer,
+            EntityStreamWriter(players_file) as players_writer,
+            EntityStreamWriter(regions_file) as regions_writer,
+        ):
+            for region in self.map_regions(
+                encode_region,
+                regions,
+                champions,
+                player_names,
+                seed_tree,
+                max_workers,
+                teams_file.suffix,
+                amount_champions,
+            ):
+                teams_writer.write_encoded(region.teams, region.amount_teams)
+                players_writer.write_encoded(region.players, region.amount_players)
+                regions_writer.write_encoded(region.region)
 
     def load_moba_teams(self) -> list[MobaTeam]:
-        pass
+        if self.database is None:
+            return []
+
+        return self.database.get_teams()
 
     def get_gamestate(self) -> GameState:
         pass
 
     def load_from_gamestate(self, gamestate: GameState):
-        pass
+        """
+        Fills the database with the champions, players, teams and regions of the
+        game state. Nothing is loaded if there is no database.
+        """
+        if self.database is None:
+            return
+
+        champions = [
+            Champion.get_from_dict(champion)
+            for champion in gamestate.champions.values()
+        ]
+        players = {
+            player_id: MobaPlayer.get_from_dict(player)
+            for player_id, player in gamestate.players.items()
+        }
+        teams = {
+            uuid.UUID(hex=team_id): MobaTeam(
+                uuid.UUID(hex=team_id),
+                team["name"],
+                team["nationality"],
+                [players[player_id] for player_id in team["roster"]],
+            )
+            for team_id, team in gamestate.teams.items()
+        }
+        regions = [
+            MobaRegion.get_from_dict(
+                region, [teams[uuid.UUID(int=team_id)] for team_id in region["teams"]]
+            )
+            for region in gamestate.regions.values()
+        ]
+        self.database.insert_world(champions, regions, players.values())
+
+        region_teams = {team.team_id for region in regions for team in region.teams}
+        self.database.insert_teams(
+            team for team_id, team in teams.items() if team_id not in region_teams
+        )
@@ -0,0 +1,79 @@
+#      eSports Manager - free and open source eSports Management game
+#      Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import uuid
+from collections.abc import Iterable, Iterator
+from types import MappingProxyType
+from typing import Optional
+
+from .champion import Champion
+from .moba_definitions import Lanes
+
+
+class ChampionRegistryError(Exception):
+    pass
+
+
+class ChampionRegistry:
+    """
+    Read-only collection of champions with dense integer IDs.
+
+    Champions are numbered from 0 in the order they are registered, and every lane
+    lists the IDs of the champions with a lane multiplier of 1.0 on it. A registry
+    is never changed after it is created, so one registry can be shared by any
+    number of drafts, threads or processes without copying the champions.
+    """
+
+    __slots__ = ("champions", "indexes", "lanes")
+
+    def __init__(self, champions: Iterable[Champion]):
+        champions = tuple(champions)
+        indexes = {}
+        for index, champion in enumerate(champions):
+            if champion.champion_id in indexes:
+                raise ChampionRegistryError(
+                    f"Champion {champion.champion_id} is registered twice!"
+                )
+            indexes[champion.champion_id] = index
+
+        lanes = {
+            lane: tuple(
+                index
+                for index, champion in enumerate(champions)
+                if champion.lanes[lane] == 1.0
+            )
+            for lane in Lanes
+        }
+        object.__setattr__(self, "champions", champions)
+        object.__setattr__(self, "indexes", MappingProxyType(indexes))
+        object.__setattr__(self, "lanes", MappingProxyType(lanes))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __reduce__(self):
+        return self.__class__, (self.champions,)
+
+    def __len__(self) -> int:
+        return len(self.champions)
+
+    def __iter__(self) -> Iterator[Champion]:
+        return iter(self.champions)
+
+    def __getitem__(self, index: int) -> Champion:
+        return self.champions[index]
+
+    def get_index(self, champion_id: uuid.UUID) -> Optional[int]:
+        return self.indexes.get(champion_id)
@@ -15,52 +15,113 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import random
 import uuid
+from datetime import datetime
+from typing import Optional
 
-from esm.core.esports.moba.mobamatch import MobaMatch
-from esm.core.esports.moba.simulation.mobamatchsimulation import MobaMatchSimulation
+from esm.core.esports.moba.mobamatch import InvalidTeamId, MobaMatch
+from esm.core.esports.moba.mobateam import MobaTeam
+from esm.core.utils.seed import generate_uuid, get_rng
 
 
 class Championship:
     def __init__(
-        self, name: str, championship_id: uuid.UUID, country: str, teams: list
+        self,
+        name: str,
+        championship_id: uuid.UUID,
+        country: str,
+        teams: list[MobaTeam],
+        rng: Optional[random.Random] = None,
     ):
         self.name = name
         self.championship_id = championship_id
         self.country = country
         self.teams = teams
-        self.matches = []
+        self.matches: list[MobaMatch] = []
+        self.matches_by_id: dict[uuid.UUID, MobaMatch] = {}
         self.points_per_win = 3
+        self.points: dict[uuid.UUID, int] = {team.team_id: 0 for team in self.teams}
+        self.rng = get_rng(rng)
 
-    def schedule_matches(self):
+    def schedule_matches(self, date: Optional[datetime] = None):
         """
         Very naive implementation of match scheduling. This will make teams face off twice
         in the championship. This should work for now.
         """
+        if date is None:
+            date = datetime.now()
+
         self.matches.clear()
         for team in self.teams:
             opp_teams = self.teams.copy()
             opp_teams.remove(team)
-            random.shuffle(opp_teams)
+            self.rng.shuffle(opp_teams)
             for opp_team in opp_teams:
                 self.matches.append(
-                    MobaMatchSimulation(
-                        MobaMatch(uuid.uuid4(), self.championship_id, team, opp_team),
-                        show_commentary=False,
-                        simulation_delay=False,
+                    MobaMatch(
+                        generate_uuid(self.rng),
+                        self.championship_id,
+                        team,
+                        opp_team,
+                        date,
                     )
                 )
 
-        random.shuffle(self.matches)
+        self.rng.shuffle(self.matches)
+        self.matches_by_id = {match.game_id: match for match in self.matches}
+
+    def get_rounds(self) -> list[list[MobaMatch]]:
+        """
+        Groups the matches that were not played yet into rounds where no team plays
+        more than once. Each team's matches keep the order they were scheduled in.
+        """
+        rounds: list[list[MobaMatch]] = []
+        teams_per_round: list[set[uuid.UUID]] = []
+        last_round: dict[uuid.UUID, int] = {}
+        for match in self.matches:
+            if match.victorious_team is not None:
+                continue
+
+            teams = {match.team1.team_id, match.team2.team_id}
+            first_round = max(last_round.get(team_id, -1) for team_id in teams) + 1
+            for index in range(first_round, len(rounds)):
+                if not teams & teams_per_round[index]:
+                    break
+            else:
+                index = len(rounds)
+                rounds.append([])
+                teams_per_round.append(set())
+
+            rounds[index].append(match)
+            teams_per_round[index] |= teams
+            for team_id in teams:
+                last_round[team_id] = index
+
+        return rounds
+
+    def get_match(self, game_id: uuid.UUID) -> MobaMatch:
+        return self.matches_by_id[game_id]
+
+    def apply_result(self, game_id: uuid.UUID, victorious_team_id: uuid.UUID):
+        match = self.get_match(game_id)
+        if victorious_team_id == match.team1.team_id:
+            match.victorious_team = match.team1
+        elif victorious_team_id == match.team2.team_id:
+            match.victorious_team = match.team2
+        else:
+            raise InvalidTeamId("Team cannot be the victorious team in this match!")
+
+        self.points[victorious_team_id] += self.points_per_win
 
     def reset_championship(self):
         for match in self.matches:
-            match.reset_match()
+            match.victorious_team = None
+        self.points = {team.team_id: 0 for team in self.teams}
 
     def count_matches_per_team(self):
         matches_per_team = []
 
         for team in self.teams:
-            count = sum(team in match.game.teams for match in self.matches)
+            count = sum(team in [match.team1, match.team2] for match in self.matches)
             matches_per_team.append([team, count])
 
         return matches_per_team
@@ -0,0 +1,120 @@
+#      eSports Manager - free and open source eSports Management game
+#      Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from ...utils.process_pool import create_process_pool, get_worker_context, map_bounded
+from ...utils.seed import SeedTree
+from .champion import Champion
+from .champion_registry import ChampionRegistry
+from .championship import Championship
+from .mobamatch import MobaMatch, MobaMatchResult
+from .mobaplayer import Lanes, MobaPlayerSimulation
+from .mobateam import MobaTeam, MobaTeamSimulation
+from .simulation.moba_sim_match import MobaSimMatch
+from .simulation.picksbans import PicksBans
+
+
+class ChampionshipExecutorError(Exception):
+    pass
+
+
+def get_team_simulation(team: MobaTeam) -> MobaTeamSimulation:
+    players = [
+        MobaPlayerSimulation(player, lane) for lane, player in zip(Lanes, team.roster)
+    ]
+    return MobaTeamSimulation(team, players, False)
+
+
+def simulate_match(
+    match: MobaMatch, seed: int, champions: Optional[ChampionRegistry] = None
+) -> MobaMatchResult:
+    """
+    Drafts and simulates a single match. This runs inside the worker processes, so
+    it only returns the result and never changes the championship.
+    """
+    if champions is None:
+        champions = get_worker_context()
+
+    rng = random.Random(seed)
+    team1 = get_team_simulation(match.team1)
+    team2 = get_team_simulation(match.team2)
+    PicksBans(champions, team1, team2, rng=rng).run()
+    match_simulation = MobaSimMatch(match, team1, team2, history_size=0, rng=rng)
+    match_simulation.run()
+
+    victorious_team = team1 if team2.nexus == 0 else team2
+    return MobaMatchResult(
+        match.game_id,
+        victorious_team.team.team_id,
+        match_simulation.simulation_engine.clock,
+        match_simulation.simulation_engine.event_log.to_bytes(),
+    )
+
+
+class ChampionshipExecutor:
+    """
+    Simulates the scheduled matches of a championship round by round.
+
+    Matches of the same round are independent, since no team plays twice in a
+    round, so each round is simulated in a process pool. Every match has its own
+    seed derived from its ID, and results are applied in the order the matches were
+    scheduled, so the outcome does not depend on the amount of workers.
+    """
+
+    def __init__(
+        self,
+        championship: Championship,
+        champions: list[Champion] | ChampionRegistry,
+        seed_tree: Optional[SeedTree] = None,
+        max_workers: Optional[int] = None,
+    ):
+        if not champions:
+            raise ChampionshipExecutorError("Champion list is empty")
+
+        self.championship = championship
+        if not isinstance(champions, ChampionRegistry):
+            champions = ChampionRegistry(champions)
+        self.champions = champions
+        if seed_tree is None:
+            seed_tree = SeedTree(championship.rng.getrandbits(64))
+        self.seed_tree = seed_tree.spawn(championship.championship_id.hex)
+        self.max_workers = max_workers
+
+    def get_match_seed(self, match: MobaMatch) -> int:
+        return self.seed_tree.spawn("match", match.game_id.hex).seed
+
+    def run_round(
+        self, executor: ProcessPoolExecutor, matches: list[MobaMatch]
+    ) -> list[MobaMatchResult]:
+        seeds = [self.get_match_seed(match) for match in matches]
+        results = list(
+            map_bounded(executor, simulate_match, zip(matches, seeds), self.max_workers)
+        )
+        for result in results:
+            self.championship.apply_result(result.game_id, result.victorious_team_id)
+
+        return results
+
+    def run(self) -> list[MobaMatchResult]:
+        results = []
+        # Champions are sent once to each worker process instead of with every match
+        with create_process_pool(self.champions, self.max_workers) as executor:
+            for matches in self.championship.get_rounds():
+                results.extend(self.run_round(executor, matches))
+
+        return results
@@ -0,0 +1,169 @@
+#      eSports Manager - free and open source eSports Management game
+#      Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+from uuid import UUID
+
+from ...utils.process_pool import create_process_pool, get_worker_context, map_bounded
+from ...utils.seed import SeedTree
+from .champion import Champion
+from .champion_registry import ChampionRegistry
+from .championship_executor import get_team_simulation
+from .moba_definitions import Lanes
+from .mobateam import MobaTeam, MobaTeamSimulation
+from .simulation.picksbans import PicksBans
+
+
+class DraftExecutorError(Exception):
+    pass
+
+
+@dataclass
+class DraftStatistics:
+    """
+    Pick, ban and lane counters of a batch of drafts, keyed by champion ID.
+
+    Drafts are counted as they finish and never stored, and statistics of
+    different batches can be merged, so any amount of drafts uses the same memory.
+    Every draft has two teams, so a champion picked in every draft by either team
+    has a pick rate of 1.0.
+    """
+
+    drafts: int = 0
+    picks: Counter[UUID] = field(default_factory=Counter)
+    bans: Counter[UUID] = field(default_factory=Counter)
+    lanes: dict[UUID, Counter[Lanes]] = field(default_factory=dict)
+
+    def add_draft(self, team1: MobaTeamSimulation, team2: MobaTeamSimulation) -> None:
+        self.drafts += 1
+        for team in [team1, team2]:
+            self.bans.update(champion.champion_id for champion in team.bans)
+            for player in team.players:
+                champion_id = player.champion.champion_id
+                self.picks[champion_id] += 1
+                self.lanes.setdefault(champion_id, Counter())[player.lane] += 1
+
+    def merge(self, other: "DraftStatistics") -> None:
+        self.drafts += other.drafts
+        self.picks.update(other.picks)
+        self.bans.update(other.bans)
+        for champion_id, lanes in other.lanes.items():
+            self.lanes.setdefault(champion_id, Counter()).update(lanes)
+
+    def get_pick_rate(self, champion_id: UUID) -> float:
+        return self.picks[champion_id] / self.drafts if self.drafts else 0.0
+
+    def get_ban_rate(self, champion_id: UUID) -> float:
+        return self.bans[champion_id] / self.drafts if self.drafts else 0.0
+
+    def get_lane_distribution(self, champion_id: UUID) -> dict[Lanes, float]:
+        lanes = self.lanes.get(champion_id, Counter())
+        total = sum(lanes.values())
+        return {lane: lanes[lane] / total if total else 0.0 for lane in Lanes}
+
+
+def simulate_drafts(
+    team1: MobaTeam,
+    team2: MobaTeam,
+    seeds: list[int],
+    champions: Optional[ChampionRegistry] = None,
+) -> DraftStatistics:
+    """
+    Runs one draft per seed between the two teams. The team simulations are reused
+    and cleared after each draft, so only the counters are kept.
+    """
+    if champions is None:
+        champions = get_worker_context()
+
+    statistics = DraftStatistics()
+    team1_simulation = get_team_simulation(team1)
+    team2_simulation = get_team_simulation(team2)
+    for seed in seeds:
+        PicksBans(
+            champions, team1_simulation, team2_simulation, rng=random.Random(seed)
+        ).run()
+        statistics.add_draft(team1_simulation, team2_simulation)
+        team1_simulation.reset_draft()
+        team2_simulation.reset_draft()
+
+    return statistics
+
+
+class DraftExecutor:
+    """
+    Runs batches of drafts between pairs of teams in a process pool.
+
+    Every draft has its own seed derived from its matchup and draft number, and the
+    counters of each chunk are summed, so the statistics do not depend on the
+    amount of workers or the chunk size.
+    """
+
+    def __init__(
+        self,
+        champions: list[Champion] | ChampionRegistry,
+        matchups: list[tuple[MobaTeam, MobaTeam]],
+        drafts: int,
+        seed_tree: Optional[SeedTree] = None,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 100,
+    ):
+        if not champions:
+            raise DraftExecutorError("Champion list is empty")
+        if not matchups:
+            raise DraftExecutorError("Matchup list is empty")
+        if drafts <= 0 or chunk_size <= 0:
+            raise DraftExecutorError(
+                "The amount of drafts and the chunk size must be greater than zero!"
+            )
+
+        if not isinstance(champions, ChampionRegistry):
+            champions = ChampionRegistry(champions)
+        self.champions = champions
+        self.matchups = matchups
+        self.drafts = drafts
+        if seed_tree is None:
+            seed_tree = SeedTree(random.getrandbits(64))
+        self.seed_tree = seed_tree.spawn("drafts")
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+
+    def get_draft_seed(self, matchup: int, draft: int) -> int:
+        return self.seed_tree.spawn(matchup, draft).seed
+
+    def get_chunks(self) -> list[tuple[MobaTeam, MobaTeam, list[int]]]:
+        chunks = []
+        for matchup, (team1, team2) in enumerate(self.matchups):
+            for start in range(0, self.drafts, self.chunk_size):
+                end = min(start + self.chunk_size, self.drafts)
+                seeds = [
+                    self.get_draft_seed(matchup, draft) for draft in range(start, end)
+                ]
+                chunks.append((team1, team2, seeds))
+
+        return chunks
+
+    def run(self) -> DraftStatistics:
+        statistics = DraftStatistics()
+        # Champions are sent once to each worker process instead of with every batch
+        with create_process_pool(self.champions, self.max_workers) as executor:
+            for result in map_bounded(
+                executor, simulate_drafts, self.get_chunks(), self.max_workers
+            ):
+                statistics.merge(result)
+
+        return statistics
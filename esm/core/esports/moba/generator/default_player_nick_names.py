@@ -13,5463 +13,16 @@
 #
 #      You should have received a copy of the GNU General Public License
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from functools import cache
 
+from ....utils import get_default_nick_names_file
 
-def get_default_player_nick_names() -> list:
-    return [
-        ".Ark",
-        "04",
-        "123",
-        "13abyKnight",
-        "1437",
-        "19teen",
-        "23savage",
-        "290",
-        "2GD",
-        "2hoi",
-        "33",
-        "343",
-        "444",
-        "458",
-        "4dr",
-        "5up",
-        "633",
-        "7e",
-        "820",
-        "876",
-        "897",
-        "9pasha",
-        "@dogf1ghts",
-        "A35",
-        "ABomB",
-        "AGIANTSMURF",
-        "AK",
-        "ALF",
-        "ALOHADANCE",
-        "ALWAYSWANNAFLY",
-        "ASD",
-        "ATL",
-        "Ab1ng",
-        "Abat",
-        "Abbadon",
-        "Abed",
-        "Abeng",
-        "Aberr",
-        "Abver",
-        "Abyss",
-        "AcE",
-        "AcE",
-        "AcRo",
-        "Accel",
-        "Accell",
-        "Ace",
-        "Ace",
-        "Acil",
-        "Acou",
-        "Action",
-        "ActionJesuz",
-        "Acupuncture",
-        "Adebisi",
-        "Adelscott",
-        "Adios",
-        "Admiration",
-        "Adonminus",
-        "Adrian",
-        "Adzantick",
-        "Aegwynn",
-        "Aelith",
-        "Aero",
-        "Afoninje",
-        "AfrOmoush",
-        "AfterLife",
-        "Agh",
-        "Agitator",
-        "Agony",
-        "Agressif",
-        "Agrippa",
-        "Ahilles",
-        "Ahjit",
-        "Aicy",
-        "Ailuj",
-        "Ainkrad",
-        "Air",
-        "Aires",
-        "Airu",
-        "Akane",
-        "Akke",
-        "Akki",
-        "AlaCrity",
-        "AlaStOr",
-        "Albatross",
-        "Albion",
-        "Alcm\u00c3\u00a8ne",
-        "Alex007",
-        "AlexCMoi",
-        "Algost",
-        "Alicia",
-        "Alien",
-        "AlisoN",
-        "AllHailLulu!",
-        "Alluton",
-        "Alopex",
-        "Amazon",
-        "Ambush",
-        "Ame",
-        "AnNyeong",
-        "AnNyeong",
-        "Andrej Porjazovski",
-        "Andromeda",
-        "Anfield",
-        "Angon",
-        "Angry",
-        "Animus",
-        "Annihilator",
-        "Anomoly",
-        "Antis",
-        "AntonyZerg",
-        "Aory",
-        "Apemother",
-        "Aphrodite",
-        "Apocalypse",
-        "Apollo",
-        "Apple",
-        "Aq",
-        "AqueroN",
-        "ArT",
-        "Aramis",
-        "Archaic",
-        "Arctur",
-        "Ares",
-        "Arew",
-        "Argo",
-        "AriA",
-        "Aria",
-        "Arise",
-        "Aristeo",
-        "Aristori",
-        "Arium",
-        "Ariunbolor",
-        "Arkthelegend",
-        "Armani",
-        "Armax",
-        "Armel",
-        "Arms",
-        "Arnovic",
-        "ArrOw",
-        "Arrogance",
-        "Arrogfire",
-        "Arsenal",
-        "Arteezy",
-        "Artemis",
-        "Artes",
-        "Arthur",
-        "Artist",
-        "Artosis",
-        "AsTeR",
-        "Ascarecrow",
-        "Ashbringer",
-        "Ashtart",
-        "AskJoshy",
-        "Aspect",
-        "Aspis",
-        "Astraea",
-        "Astral",
-        "Astrea",
-        "Asuna",
-        "Asura",
-        "Atalanta",
-        "Athena",
-        "Atilla",
-        "Attacker",
-        "Attero",
-        "Atun",
-        "Atze",
-        "AuRora",
-        "Audacity",
-        "August",
-        "Aui_2000",
-        "AureS",
-        "Automatic",
-        "Avekatten",
-        "Avenge",
-        "Avenger",
-        "Aventador",
-        "Aville",
-        "Avokado",
-        "Awers",
-        "Awoke",
-        "Ax.Mo",
-        "Axe",
-        "Axe-man",
-        "Axeltoss",
-        "Axslav",
-        "Axypa",
-        "Ayo",
-        "Azael",
-        "Azrael",
-        "Azur4",
-        "Azure",
-        "AzureRush",
-        "Azz",
-        "B",
-        "B7 NexT LeveL",
-        "BBi",
-        "BBi",
-        "BBoongBBoong",
-        "BDz",
-        "BEYOND",
-        "BLACKARXANGEL",
-        "BLord",
-        "BOOM",
-        "BSJ",
-        "BYB",
-        "Baal",
-        "Baby",
-        "BabyKnight",
-        "BabyMarine",
-        "BabyToss",
-        "Baga",
-        "Bails",
-        "Ball",
-        "Ballistic",
-        "Balloon",
-        "Balrog",
-        "Balsam",
-        "Baltimore",
-        "BanBans",
-        "BanBans",
-        "BanKs",
-        "Bane",
-        "Bang",
-        "Banshee",
-        "BarabaNN",
-        "Barash",
-        "Barbarian",
-        "Barbarossa",
-        "Barbie",
-        "Barbie-USAGI",
-        "Baroness",
-        "BarrackS",
-        "Barry",
-        "Bashruk",
-        "Basilisk",
-        "Basior",
-        "Basset",
-        "BattleB",
-        "Battleaxe",
-        "BaxteR",
-        "Bbyong",
-        "Bdiz",
-        "BeNSeN",
-        "BeSt",
-        "BeaSt",
-        "Bear",
-        "Beastyqt",
-        "Bee",
-        "Beesa",
-        "Beguile",
-        "Behemoth",
-        "BelAir",
-        "Believe",
-        "Believe",
-        "Belladonna",
-        "Belle Starr",
-        "BelleNOiR",
-        "Bellona",
-        "Ben",
-        "Bender",
-        "Benhur",
-        "Benjaz",
-        "Bensoy",
-        "Beretta",
-        "Berna",
-        "Berra",
-        "Berserk",
-        "Bfl",
-        "Bhm",
-        "Big Papa",
-        "Bignum",
-        "Billhook",
-        "Billowy",
-        "Billy the Butcher",
-        "Bimbo",
-        "BinGo",
-        "Bioice",
-        "Biphy",
-        "Biryu",
-        "BisAnG",
-        "Bischu",
-        "Bistork",
-        "Bisu",
-        "BitByBit",
-        "Bitten",
-        "Biver",
-        "Black Beauty",
-        "Black Mamba",
-        "BlackKniGhT",
-        "Black^",
-        "Blackcidy",
-        "Blade",
-        "Blask",
-        "Blaze",
-        "Blaze",
-        "Blazemon",
-        "Bleak",
-        "Bleed",
-        "Blight",
-        "BlinG",
-        "BlizzarD",
-        "Blizzy",
-        "Blood",
-        "Blood",
-        "Bloody Nine",
-        "BluE",
-        "Bludgeon",
-        "BlueCheese",
-        "Bly",
-        "Blysk",
-        "BoBoKa",
-        "Boar",
-        "Bobruha",
-        "Bodybag",
-        "Bok",
-        "Bombad1l",
-        "Bomber",
-        "Bomber",
-        "Bombi",
-        "Bombilla",
-        "Bone",
-        "Bones",
-        "Boombacs",
-        "Boombox",
-        "Boomslang",
-        "Booster",
-        "BoraNija",
-        "Boris",
-        "Botvinnik",
-        "Boudica",
-        "Bouli",
-        "Bowman",
-        "Bowser",
-        "BoxeR",
-        "Boxi",
-        "Boyo",
-        "BrAvO",
-        "BrEEzE",
-        "Brain",
-        "Brass",
-        "Brass Knuckle",
-        "Brat_OK",
-        "Brave",
-        "Brave",
-        "Brax",
-        "BrayaNt",
-        "Breach",
-        "Breach",
-        "Breaker",
-        "BreakingGG",
-        "Bridge",
-        "BrightSide",
-        "Broadsword",
-        "Brown",
-        "Bruise",
-        "Bryle",
-        "BsK",
-        "BuRning",
-        "Bubbles",
-        "Bullet",
-        "Bullet-Proof",
-        "Bullwhip",
-        "Bumblebee",
-        "BungsellRotee",
-        "Bunny",
-        "Bunny",
-        "Buster",
-        "ButAlways",
-        "ButterflyEffect",
-        "ButterflyEffect",
-        "Buugi",
-        "ByRada",
-        "ByuL",
-        "ByuN",
-        "CENSURE",
-        "CNProtoss",
-        "COSMOS",
-        "CPU",
-        "CURRY",
-        "CaVaLieR",
-        "Cacia",
-        "CadenZa",
-        "Caiobex",
-        "Cak3z",
-        "Calamity Jane",
-        "CalebAracous",
-        "Caliber",
-        "Calm",
-        "Calt",
-        "Caltrop",
-        "Calvin",
-        "Calypso",
-        "Camden",
-        "Canata",
-        "Candyloon",
-        "Cannon",
-        "Cannon",
-        "Capoch",
-        "Caprice",
-        "Carbine",
-        "Carbon",
-        "Cargo",
-        "Carmel",
-        "Carmel",
-        "Carn",
-        "Cascade",
-        "Castaway",
-        "CatYou",
-        "CatZ",
-        "Catch-22",
-        "Catechin",
-        "CauthonLuck",
-        "CealeR",
-        "Ceb",
-        "CecilSunkure",
-        "Celia",
-        "Cell",
-        "Cella",
-        "CemaTheSlayer",
-        "Center",
-        "Centerfire",
-        "Cerberus",
-        "Ceyler",
-        "Cezanne",
-        "ChAnCe",
-        "ChYuan",
-        "Chabby",
-        "Chains",
-        "Chainsaw",
-        "Chakey",
-        "Chalice",
-        "Cham",
-        "ChanKiM",
-        "Chance",
-        "Chao",
-        "ChaoYue",
-        "Chappie",
-        "Chappy",
-        "Charade",
-        "CharlieDota",
-        "Charybdis",
-        "Chase",
-        "Chasm",
-        "Chavi",
-        "Chawy",
-        "Check",
-        "Check",
-        "CheeseKing",
-        "CheesyJunk",
-        "Cheetos",
-        "Chess",
-        "Chessie",
-        "Chi",
-        "ChiOt",
-        "Chibix",
-        "Chicanery",
-        "Chick",
-        "ChickenCombo",
-        "Chief",
-        "Chill",
-        "Chipmunk",
-        "Choa",
-        "Choya",
-        "Chrillee",
-        "Chris Luck",
-        "ChuaN",
-        "Chubz",
-        "Chuvash",
-        "Ciara",
-        "Civi",
-        "Cladorhiza",
-        "Clannad",
-        "Classic",
-        "Classic",
-        "Classic",
-        "Clavie",
-        "Claw",
-        "Claymore",
-        "Clem",
-        "Clencher",
-        "Cleo",
-        "Clickit",
-        "Clide",
-        "Clink",
-        "ClouD",
-        "Cloudy",
-        "ClsClassiC",
-        "Club",
-        "Clutch",
-        "CoCa",
-        "Cobra",
-        "CocoA",
-        "Coffee",
-        "ColaGirl",
-        "Colada",
-        "ColdScars",
-        "Colestah",
-        "Collapse",
-        "Colt",
-        "CombatEX",
-        "ComeWithMe",
-        "Comet",
-        "Comm",
-        "Complain",
-        "Conn.Si",
-        "Conqueror",
-        "Cookie bear",
-        "CoolTea",
-        "Cooman",
-        "Coppii",
-        "Corey",
-        "Corybantic",
-        "Cosma",
-        "Costabile",
-        "Cougar",
-        "Couguar",
-        "Countess",
-        "Courage",
-        "Cowman",
-        "Cptnfingers",
-        "Cr1t-",
-        "Crabushek",
-        "Crafty",
-        "CranK",
-        "Crane",
-        "Craniax",
-        "Crank",
-        "Crazed",
-        "Crazy",
-        "Crazy",
-        "Crazylegs",
-        "CrazymoviNG",
-        "CreamCake",
-        "Creator",
-        "Creature",
-        "Creed",
-        "Creep",
-        "CreightonOlsen",
-        "CriMsoN",
-        "Crimson",
-        "Crio_J",
-        "CripSeil",
-        "Crossbow",
-        "Crow",
-        "Crowley",
-        "Crown Heights",
-        "CrucialNug",
-        "Crucible",
-        "CrunCher",
-        "Crusher",
-        "Crydasia",
-        "Crystallis",
-        "Crystallize",
-        "Cty",
-        "Cube",
-        "Cubert",
-        "Cuddlebear",
-        "CupCake",
-        "Cure",
-        "Curio",
-        "Curious",
-        "Cut",
-        "CuteZerg",
-        "Cutlass",
-        "Cutter",
-        "Cy",
-        "CyNiCaL",
-        "Cyan",
-        "Cyclops",
-        "Cyrus",
-        "Cytoplasm",
-        "D4574N-SG",
-        "DAVIT",
-        "DBS",
-        "DD",
-        "DDR",
-        "DDX-",
-        "DD\u00e6\u2013\u00a9\u00e9\u00a6\u2013",
-        "DIMAGA",
-        "DJ",
-        "DM",
-        "DRGLing",
-        "DS",
-        "DaBoO",
-        "DaNa",
-        "DaSakura",
-        "DaZe",
-        "Daemon",
-        "Dagger",
-        "Daisy",
-        "DakkoN",
-        "Dale",
-        "Damaroo",
-        "Damned",
-        "Damrud",
-        "Dandy",
-        "DarK",
-        "DarKFoRcE",
-        "Daredevil",
-        "Dark",
-        "DarkCell",
-        "DarkHydra",
-        "DarkUnnamed",
-        "Darkmago",
-        "Darkness",
-        "Darko",
-        "Darkomicron",
-        "Darroweve",
-        "DasDuelon",
-        "Dashiz",
-        "Dastan",
-        "Datbb",
-        "Daxak",
-        "Day[9]",
-        "Daydream",
-        "Daydreamer",
-        "Dayfly",
-        "Dayfly",
-        "Dayshi",
-        "DdoRo",
-        "DeMusliM",
-        "DeParture",
-        "DeViL",
-        "Dear",
-        "DeathAngel",
-        "Deathfate",
-        "Deathstalker",
-        "Decay",
-        "Deceit",
-        "Deception",
-        "DeeDan",
-        "DeeMo",
-        "Deity",
-        "Delirious",
-        "Delphi",
-        "Delusion",
-        "Demented",
-        "Dementor",
-        "Demi",
-        "Demise",
-        "Demolition",
-        "Demonizer",
-        "Dendi",
-        "Denver",
-        "Deny",
-        "Derange",
-        "Derp",
-        "Destiny",
-        "Destrice",
-        "Destroyer",
-        "DestroyerTT",
-        "Deth",
-        "Detroit",
-        "Dev1ce",
-        "Devi",
-        "Deviant",
-        "Diablo",
-        "Die-hard",
-        "DieStar",
-        "Diffe",
-        "Diggity",
-        "Dihya",
-        "Diord",
-        "Dirty Dirty",
-        "DisK",
-        "DisReSpeCT",
-        "Dismay",
-        "Dissent",
-        "Ditya Ra",
-        "Divinesia",
-        "Django",
-        "Djorjx",
-        "DkFogas",
-        "DmC",
-        "Dmega",
-        "DnS",
-        "DoA",
-        "Doctor",
-        "Dolan",
-        "Doll",
-        "DominiC",
-        "Domorin",
-        "DongRaeGu",
-        "Doom",
-        "Dos",
-        "DouDou",
-        "Dove",
-        "DowaQ",
-        "Downtown Baby",
-        "Dox",
-        "Dracula",
-        "Draft",
-        "Drager",
-        "Dragon",
-        "Dragon",
-        "Dragon",
-        "DreAm",
-        "Dream",
-        "Dream",
-        "DreamizEr",
-        "Dreamocel",
-        "DreamyU",
-        "Drew",
-        "Drewbie",
-        "Drikett",
-        "Drima",
-        "Dronehard",
-        "Drug",
-        "Drughead",
-        "Drunkenboi",
-        "Dstones",
-        "Duchess",
-        "Duggi",
-        "Dukalis",
-        "Dulashtr",
-        "Dunha1",
-        "DurpDurp",
-        "Dust",
-        "Duster",
-        "Dutch",
-        "Dutch_Freak",
-        "Dux",
-        "Dy",
-        "DynaMite",
-        "Dysix",
-        "DyyS",
-        "EF",
-        "EGG",
-        "EGM",
-        "EJK",
-        "ELVIS",
-        "ENZA",
-        "EON",
-        "ETpwnHome",
-        "EX",
-        "Eagle",
-        "Early",
-        "Ecnart",
-        "EdgE",
-        "Edge",
-        "Eeel",
-        "EffOrt",
-        "EffkA",
-        "Egomania",
-        "Eifer",
-        "Eiki",
-        "Ein",
-        "Eixn",
-        "Elazer",
-        "Elbegast",
-        "ElhayM",
-        "Eliminator",
-        "Elmo",
-        "Elroye",
-        "Elusory",
-        "Emil",
-        "Emo",
-        "Emperor",
-        "Empress",
-        "EnChant",
-        "EnDerr",
-        "Enchantress",
-        "EndOfLine",
-        "Engyn",
-        "EnigmA",
-        "Enigma",
-        "Enki",
-        "Enmity",
-        "Enpo",
-        "Ensnare",
-        "Ensnare",
-        "Enyo",
-        "EonBlu",
-        "Eosin",
-        "Epic",
-        "Era",
-        "Erebus",
-        "Ergon",
-        "Erica",
-        "Erice",
-        "Erik",
-        "Eskillz",
-        "Espada",
-        "EterNaL",
-        "EternaLEnVy",
-        "Eternity",
-        "Eternity",
-        "Eurus",
-        "Evaner",
-        "Eve",
-        "Eve",
-        "Eve",
-        "Everize",
-        "Evire",
-        "Ewe",
-        "ExE",
-        "Exalted",
-        "Excavator",
-        "Executioner",
-        "Exia",
-        "Exist",
-        "Exostriker",
-        "Exotic_Deer",
-        "ExpecT",
-        "Exterminator",
-        "Eyescar",
-        "Ezrc",
-        "F91",
-        "FIGARO",
-        "FLUFFNSTUFF",
-        "FaN",
-        "Facehugger",
-        "Fade",
-        "Fagballs",
-        "FaiLo",
-        "Fairy",
-        "Fairy",
-        "Faith",
-        "Faith",
-        "Faith_bian",
-        "Fake",
-        "Fake",
-        "Falchion",
-        "Falcon",
-        "FallY",
-        "Fallenger",
-        "FanTaSy",
-        "Fanatic",
-        "Fang",
-        "Fantasy",
-        "Fargo",
-        "Fata",
-        "Fate",
-        "Fazer",
-        "Fbz",
-        "FeaR",
-        "Fear",
-        "Fearless",
-        "Feast",
-        "Feero",
-        "Feimao",
-        "Feint",
-        "FelixCiaoBa",
-        "Femme Fatale",
-        "Fender",
-        "Fenix",
-        "Fenix",
-        "Fenner",
-        "Fenrir",
-        "Ferrari_430",
-        "Fervian",
-        "Fester",
-        "Fey",
-        "Fezor",
-        "FightingFrog",
-        "Figment",
-        "Filho",
-        "Filthy",
-        "Finisher",
-        "Fire Lance",
-        "Fire-Bred",
-        "FireCake",
-        "FireFlyHugs",
-        "FireFoX",
-        "FireZerg",
-        "Firecracker",
-        "Firefly",
-        "Firestorm",
-        "First",
-        "Fishbone",
-        "Fisheye",
-        "Fishman",
-        "Fist",
-        "Fist",
-        "Fitzyhere",
-        "Five",
-        "Flack",
-        "Flash",
-        "Flash",
-        "FlatLine",
-        "Flint",
-        "Flood",
-        "Flow",
-        "Flower",
-        "Fly",
-        "Fly",
-        "Fly.",
-        "Fly100%",
-        "Flying",
-        "Flying Claw",
-        "FlyingZebra",
-        "Flysolo",
-        "Flywin",
-        "Fmtc",
-        "FoCuS",
-        "Focus",
-        "Fonte",
-        "Footslam",
-        "ForGG",
-        "ForJumy",
-        "Force",
-        "Forev",
-        "Forever",
-        "Forsen",
-        "Forte",
-        "Fortune",
-        "FoxeR",
-        "Foxx",
-        "Foxy",
-        "FrancisLee",
-        "Frank",
-        "Freak",
-        "Freaky",
-        "FreeSaGa",
-        "FreeSaGa",
-        "Freedom",
-        "FreedomTH",
-        "Freeeedom",
-        "Freizya",
-        "FremAN",
-        "Frenzy",
-        "Friend",
-        "Fright",
-        "Frigoleet",
-        "FrisK",
-        "Frodan",
-        "Froogoss",
-        "Frost",
-        "Frozen",
-        "FruitDealer",
-        "FruitDealer",
-        "Frustration",
-        "FuRy",
-        "Fuego",
-        "FuelY",
-        "Fujikura",
-        "Fun",
-        "FunK",
-        "FunKaDeliC",
-        "FunNv",
-        "Funn1k",
-        "Funzii",
-        "Furor",
-        "Fury",
-        "Fury",
-        "Future",
-        "Future",
-        "Fuzer",
-        "Fyruna",
-        "FzFz",
-        "G",
-        "GAMETIME",
-        "GARIMTO",
-        "GGS",
-        "GGaeMo",
-        "GGanDoL",
-        "GGwpLanaya",
-        "GH",
-        "GOD_Z",
-        "Gabbi",
-        "Gambler",
-        "Gambler",
-        "Gambling",
-        "GamerRichy",
-        "Gamja",
-        "GanZi",
-        "GanZi",
-        "Gannicus",
-        "Garder",
-        "Gargoyle",
-        "Garitos",
-        "Garnet",
-        "Garrot",
-        "Gash",
-        "Gatciy",
-        "Gatling",
-        "Gatored",
-        "Gauntlet",
-        "GeNieS",
-        "Gedrox",
-        "Gee'za",
-        "Geeden",
-        "Geisha",
-        "Gemini",
-        "Gemini",
-        "GeneRaL",
-        "Genius",
-        "GenjiTakiya",
-        "Gerald",
-        "Gerbil",
-        "Geronimo",
-        "Gerrard",
-        "GhosTa",
-        "Ghost",
-        "GhostHell",
-        "Ghosti",
-        "Ghostik",
-        "Ghoul",
-        "GiGA",
-        "GiangNeo",
-        "Giantt",
-        "Gibkiy",
-        "Gilgir",
-        "Gimme",
-        "Gintoki",
-        "Gio",
-        "Gladius",
-        "Glide",
-        "Glock",
-        "Glon",
-        "Glow",
-        "Gnaw",
-        "GoAudio",
-        "GoOdy",
-        "Goddess",
-        "Godot",
-        "GogojOey",
-        "Golden",
-        "Golem",
-        "Gon",
-        "Gon",
-        "Gorec",
-        "Gorgc",
-        "Gorgon",
-        "Goshawk",
-        "Goswser",
-        "GraVe",
-        "Grant",
-        "Graphix",
-        "Grave",
-        "GrayWarden",
-        "Great",
-        "GreatTeacher",
-        "Greedy",
-        "Greenert",
-        "Gremory",
-        "Gretorp",
-        "Grid",
-        "Grim",
-        "Grimzx",
-        "Grip",
-        "Grizine",
-        "Grizzly",
-        "Grubby",
-        "Grudge",
-        "GruntarTV",
-        "GuMiho",
-        "Gudii",
-        "GuemChi",
-        "Guilty",
-        "GuineaPig",
-        "GuineaPig",
-        "Guitarcheese",
-        "GunGFuBanDa",
-        "Gunnar",
-        "Gunner",
-        "Gurin",
-        "Guru",
-        "Gut",
-        "Guvara",
-        "Gwin",
-        "H4nn1",
-        "HANNAH_MONTANA",
-        "HDstarcraft",
-        "HEADHUNTER",
-        "HHH",
-        "HHQuanTa",
-        "HTOMario",
-        "HaNfy",
-        "HaPe",
-        "Hack",
-        "Hajinsun",
-        "Half Pint",
-        "HalfBreed",
-        "HammEr",
-        "Hammer",
-        "Hanbin",
-        "Handsken",
-        "Hannah",
-        "Hannibal",
-        "Hannibal",
-        "Hansin",
-        "Hao",
-        "Happiness",
-        "Happy",
-        "Happy",
-        "Happy",
-        "HappyDyurara",
-        "HappyZerg",
-        "Harlem",
-        "Harpner",
-        "Harpoon",
-        "Harrier",
-        "Harrier",
-        "Harstem",
-        "Has",
-        "HasHe",
-        "Hash",
-        "Hashtag",
-        "Haspe",
-        "HasuObs",
-        "Hatchet",
-        "HateMe",
-        "Haunter",
-        "Hauteur",
-        "Hawk",
-        "HayprO",
-        "Hazed",
-        "Hazzard",
-        "HeRoMaRinE",
-        "Head-Knocker",
-        "Healer",
-        "Heart",
-        "Heavens",
-        "Hell-Raiser",
-        "Hellcat",
-        "Hellraiser",
-        "HeltEn",
-        "HerO",
-        "Hero",
-        "Heroin",
-        "Heromu",
-        "Herzogin",
-        "HesteJoe-Rotten",
-        "Hickok",
-        "Hitman",
-        "Hitter",
-        "Hjax",
-        "Hmx",
-        "HoBBiT",
-        "HoeJJa",
-        "Hollowman",
-        "HolyHit",
-        "HomerJ",
-        "Honeybear",
-        "HongUn",
-        "Honor",
-        "HooNji",
-        "Hook-",
-        "Hoon",
-        "Hope",
-        "Hopt",
-        "Horang2",
-        "Hornet",
-        "Horror",
-        "HorussTV",
-        "Hostility",
-        "Hot_Bid",
-        "Howitzer",
-        "Htz",
-        "HuK",
-        "HuShang",
-        "HuT",
-        "Hua Mulan",
-        "Hui",
-        "HuiHui",
-        "Hunta",
-        "HunteR",
-        "Hunter",
-        "Hunterxx",
-        "Huppey",
-        "Hupsaiya",
-        "Hurricane",
-        "Hurricane",
-        "Hush",
-        "Husky",
-        "Husky",
-        "Hustla",
-        "HuySolo",
-        "HwaRanG",
-        "HwangSin",
-        "Hy",
-        "Hyac",
-        "Hyde",
-        "Hydra",
-        "Hydra",
-        "Hyko",
-        "Hym",
-        "Hymy",
-        "HyoLyn",
-        "Hyperdub",
-        "Hyperdub",
-        "Hyperion",
-        "HyuN",
-        "Hyuk",
-        "ID",
-        "ID",
-        "ILuSionClocK",
-        "INnoVation",
-        "ISI",
-        "Ian",
-        "IcaruS",
-        "Ice",
-        "Ice",
-        "IceCream",
-        "Iceberg",
-        "Icho",
-        "Icy",
-        "IdrA",
-        "IdrALing",
-        "IeZaeL",
-        "IefNaij",
-        "Ifr1t!",
-        "Ifrit",
-        "Ignite",
-        "IlPrincipino",
-        "Illusion",
-        "Illusion",
-        "ImReady",
-        "Imba4",
-        "Immersion",
-        "Impact",
-        "InCa",
-        "InJuly",
-        "InZaNe",
-        "Indominus",
-        "Indra",
-        "Indy",
-        "Inferno",
-        "Infi",
-        "Infinity",
-        "Inkvizitor",
-        "InsaNe",
-        "Insomnia",
-        "Insur",
-        "Insurgent",
-        "Intricacy",
-        "IntuitioN",
-        "Ire",
-        "Iris",
-        "Iron Heart",
-        "Iron-Cut",
-        "Ironclad",
-        "Ironsides",
-        "IsSuE",
-        "IsSuE",
-        "Ishtar",
-        "Isis",
-        "Ivy",
-        "J",
-        "JEROS",
-        "JG",
-        "JIN",
-        "JKS",
-        "JKS",
-        "JSL",
-        "JT-",
-        "JUST",
-        "JYP",
-        "JaBiTo",
-        "JaCkky",
-        "JaKaTaK",
-        "Jabbz",
-        "Jabz",
-        "JackO",
-        "Jackal",
-        "Jacko",
-        "Jade",
-        "Jaedong",
-        "Jagelius",
-        "Jaguar",
-        "Jakebake",
-        "Jamesy",
-        "JangBi",
-        "January",
-        "Jardozer",
-        "Jarppi",
-        "Jason",
-        "Jaunuel",
-        "Javelin",
-        "Jawbone",
-        "Jaxx",
-        "JazBas",
-        "JeaL",
-        "JeeF",
-        "Jeimari",
-        "Jenkins",
-        "JerAx",
-        "Jericho",
-        "Jesse James",
-        "Jessica",
-        "JessieVash",
-        "JesusSt1ck",
-        "Jeyo",
-        "Jhocam",
-        "Jhonny",
-        "Jhoven",
-        "JiaJia",
-        "Jieang",
-        "Jieshi",
-        "Jig",
-        "Jila",
-        "Jim",
-        "JimRising",
-        "Jimpo",
-        "Jinro",
-        "Jixing",
-        "Jjun",
-        "Jjun",
-        "JoCeLyN",
-        "JoHnNy",
-        "JoJo",
-        "JoRoSaR",
-        "Joe",
-        "Jogginghose",
-        "JonSnow",
-        "Jona",
-        "JongMi",
-        "JongMi",
-        "JonnyREcco",
-        "Joraal",
-        "Journey",
-        "Jowj",
-        "Jst",
-        "JuNi",
-        "Jubei",
-        "July",
-        "July",
-        "Julz",
-        "JunO",
-        "Junbo",
-        "June",
-        "Juno",
-        "Junwi",
-        "Junwi",
-        "JusticeSimon",
-        "JyC",
-        "JyJ",
-        "JyU",
-        "K-9",
-        "K0str0",
-        "K1",
-        "KDY",
-        "KJ",
-        "KNife",
-        "KSi",
-        "KYumer",
-        "KYumer",
-        "KaHT",
-        "KaNG",
-        "KaaZ",
-        "Kadium",
-        "Kaelaris",
-        "Kafka",
-        "Kahina",
-        "Kai",
-        "Kaka",
-        "Kalin",
-        "Kamikaze",
-        "Kamker",
-        "Kamma",
-        "Kane",
-        "Kare",
-        "Karl",
-        "Kas",
-        "Kashim",
-        "KassiA",
-        "Katana",
-        "Katar",
-        "KawaiiRice",
-        "Kazl",
-        "Kazz",
-        "Kebap",
-        "Kecik Imba",
-        "KeeN",
-        "KeePing",
-        "Kefka",
-        "Keiras",
-        "Kelazhur",
-        "Ken",
-        "KenZy",
-        "Kenji",
-        "Kevin Knocke",
-        "KevinLiu",
-        "Kevlar",
-        "KeyaNo",
-        "Keyser",
-        "Khaldor",
-        "Khan",
-        "KheZu",
-        "Khezcute",
-        "KiFirE",
-        "KiToO",
-        "KiWiKaKi",
-        "Kibbelz",
-        "Kid",
-        "Kidaro",
-        "Kieds",
-        "Kikoni",
-        "Killer",
-        "Killomancer",
-        "KinG",
-        "KingCobra",
-        "KingJ",
-        "KingKong",
-        "KingR",
-        "KingSlayer",
-        "Kingrd",
-        "Kingteka",
-        "Kitrak",
-        "KleeneX",
-        "Klotz22",
-        "Kneecap",
-        "KnowMe",
-        "Knuckles",
-        "KoMA",
-        "KoNtiNuE",
-        "Kodos",
-        "Koka",
-        "KomCorx",
-        "Kong",
-        "Kop",
-        "Korok",
-        "Koshkii",
-        "Kowi",
-        "Kozan",
-        "Kozan",
-        "Kraken",
-        "KrasS",
-        "Kreos",
-        "Krr",
-        "Krystianer",
-        "Kuku",
-        "Kuma",
-        "Kurafi",
-        "KuroKy",
-        "KvH",
-        "Kxy",
-        "KySarr",
-        "KyT",
-        "Kyhol",
-        "Kyo",
-        "Kyrix",
-        "Kyrix",
-        "Kyuubi",
-        "Kyzer",
-        "L.A.",
-        "L0lik_O",
-        "LIGHTWEIGHT",
-        "LaLuSh",
-        "LaNm",
-        "LabyRinth",
-        "Ladabaz",
-        "Laejten",
-        "Lambo",
-        "Lanaro",
-        "Lance",
-        "Lance",
-        "Lapiz",
-        "Larry",
-        "Lash",
-        "Last",
-        "Last",
-        "Last",
-        "LastHero",
-        "LastShadow",
-        "LastSurprise",
-        "Lau",
-        "Laukyo",
-        "Law",
-        "LeBronDota",
-        "LeComplete",
-        "LeFaucheur",
-        "Leaf",
-        "LeeLee",
-        "Leenock",
-        "Legacy",
-        "LegalMind",
-        "Legend",
-        "Legendk",
-        "Legendkiller",
-        "Legionnaire",
-        "Lelis",
-        "Lemon",
-        "Leo",
-        "LeoRusher",
-        "LeoStyle-",
-        "Leon",
-        "Leonidas",
-        "Lero",
-        "Lesserblue",
-        "Leta",
-        "Leviathan",
-        "Levin",
-        "Libero",
-        "Libero",
-        "Life",
-        "Light",
-        "Light",
-        "Light",
-        "Light_VIP",
-        "Lightning",
-        "Lightning",
-        "Lil",
-        "LilSusie",
-        "Lil_kin6",
-        "Lilbow",
-        "Lillekanin",
-        "Limmp",
-        "Lin",
-        "Lind",
-        "Lindsey Sporrer",
-        "Link",
-        "LionaX",
-        "Lirik",
-        "Lisandro",
-        "Lithium",
-        "LittleBoy",
-        "LittleBoy",
-        "LittleWolf",
-        "LiveForever",
-        "LiveForever",
-        "LiveZerg",
-        "Livibee",
-        "Livinpink",
-        "LoLvsxD",
-        "LoWeLy",
-        "Lobo",
-        "Loch",
-        "Lockback",
-        "Lodine",
-        "LokarN",
-        "Lolita",
-        "Loner",
-        "LongDD",
-        "Longbow",
-        "Lopata",
-        "Lorenof",
-        "Loseyourself",
-        "Losira",
-        "Loski",
-        "Lots",
-        "Lotus",
-        "Louder",
-        "Loup",
-        "LoveCD",
-        "LoveTt",
-        "Lowko",
-        "LsEbA",
-        "LuLu^^",
-        "Lubby",
-        "Luciano",
-        "LucifroN",
-        "Lucky",
-        "Lucky",
-        "LuckyFool",
-        "Lucoda",
-        "Luffy",
-        "Luk",
-        "Luke",
-        "LunaSea",
-        "Luneth",
-        "Luolis",
-        "Luvsic",
-        "Lww",
-        "Lwy",
-        "Lycan",
-        "Lyn",
-        "Lynch",
-        "LzGaMeR",
-        "MATUMBAMAN",
-        "MC",
-        "MCanning",
-        "MISERY",
-        "MJW",
-        "MMA",
-        "MMY!",
-        "MODEUS",
-        "MP",
-        "MS-Joy",
-        "MSS",
-        "MTD",
-        "MYSmoon",
-        "MaDFroG",
-        "MaFia",
-        "MaGoma",
-        "MaNa",
-        "MaNia",
-        "MaSa",
-        "MaSsan",
-        "MaTa",
-        "Mac",
-        "MacSed",
-        "Mace",
-        "Machete",
-        "Machine",
-        "Mackintac",
-        "Mad",
-        "Mad Dog",
-        "Mad Max",
-        "MadBull",
-        "Madals",
-        "Madam",
-        "Madara",
-        "Madara",
-        "MaddeLisk",
-        "Mademoiselle",
-        "Maden",
-        "Madness",
-        "MafiA",
-        "MagE-",
-        "Mage",
-        "MagicaL",
-        "Majestic",
-        "Majesty",
-        "Maka",
-        "Maker",
-        "Makouni",
-        "Malcolm",
-        "Malevolence",
-        "Malice",
-        "Malik",
-        "Mamba",
-        "Mamba",
-        "Mambos",
-        "Mamuri",
-        "Mandy",
-        "Mango_Banana",
-        "Mania",
-        "Maniac",
-        "Manic",
-        "Mannequin",
-        "ManoManolo",
-        "Mantaza",
-        "Manticore",
-        "Mantis",
-        "Maplez",
-        "MapuTV",
-        "Marc",
-        "March",
-        "MariK",
-        "Mariachi",
-        "MarineKing",
-        "MarineLorD",
-        "Marquess",
-        "Marsman",
-        "MartijnMumbles",
-        "Maru",
-        "MasTeR",
-        "Masakary",
-        "Masaros",
-        "Masher",
-        "Masoku",
-        "Masquerade",
-        "Massacre",
-        "MasterVasya",
-        "Mastermind",
-        "Mastery",
-        "Matchlock",
-        "Matino",
-        "Matiz",
-        "Matrim",
-        "Matrix",
-        "Matthew",
-        "Matvey",
-        "Maul",
-        "MaxPax",
-        "Maximus",
-        "MaximusBlack",
-        "Maybe Next Time",
-        "Maynarde",
-        "Mayuki",
-        "McKinley",
-        "McMonroe",
-        "Medb",
-        "Mekar",
-        "Meliodas",
-        "Melle",
-        "MelodyLovers",
-        "Menace",
-        "Mentalist",
-        "MeomaikA",
-        "Meracle",
-        "Mercenary",
-        "Mercury",
-        "MiCrOLiFe",
-        "MiHawk",
-        "MiLAN",
-        "MiNiMaTh",
-        "Michael-",
-        "MidOne",
-        "Midday",
-        "Midnight",
-        "MightyKiwi",
-        "Mihai",
-        "MikOeL",
-        "Mikey",
-        "Mikoto",
-        "Milka",
-        "MilkiCow",
-        "Milla",
-        "Milz",
-        "MimeronVex",
-        "Min",
-        "MinD_ContRoL",
-        "MinSeOK",
-        "Minatoeh",
-        "Mind",
-        "MindelVK",
-        "Minerva",
-        "Mini",
-        "Mini",
-        "Minigun",
-        "Miniraser",
-        "Minotaur",
-        "Minx",
-        "Miposhka",
-        "Miracle-",
-        "Mirage",
-        "Mirakel",
-        "Mirzo",
-        "MisS",
-        "Misaki",
-        "Misha",
-        "Miso",
-        "Miss Fortune",
-        "MisterL",
-        "Miszu",
-        "Mitch",
-        "Mix",
-        "Mixu",
-        "Miya",
-        "Miyako",
-        "Mnz",
-        "MoMaN",
-        "MoOk",
-        "MoRiArTy",
-        "MoZuN",
-        "Modesty",
-        "Mofi",
-        "MogarFNSMASH",
-        "Moja",
-        "Moletrap",
-        "Mondragon",
-        "Monet",
-        "MonstR",
-        "Montante",
-        "MonteCristo",
-        "Monty",
-        "Moo",
-        "MooffinMan",
-        "Moogy",
-        "Moon",
-        "Moon",
-        "MoonMeander",
-        "Moonlight",
-        "Moosegills",
-        "Morgue",
-        "Mori",
-        "MorroW",
-        "Mortar",
-        "Mothman",
-        "Motive",
-        "MotoK",
-        "MouLou",
-        "Movie",
-        "MperorM",
-        "Mr. Blonde",
-        "Mr. Chae",
-        "Mr. Jeans",
-        "MrBitter",
-        "Ms",
-        "MtR",
-        "Mu",
-        "Muf",
-        "Mujuk",
-        "Mushi",
-        "Mutant",
-        "Mvp",
-        "MyPro",
-        "MygraiN",
-        "Mynuts",
-        "MystiC",
-        "MysticMuse",
-        "Mysticism",
-        "Mystik",
-        "Myth",
-        "Myth",
-        "MythiC",
-        "MyuNgSiK",
-        "Myuu",
-        "N0tail",
-        "NAKSEO",
-        "NAKSEO",
-        "NEQROMAN",
-        "NOTAKON",
-        "NO_Chanc3",
-        "NS-ART",
-        "NT-",
-        "NTT",
-        "NXZ",
-        "NYC",
-        "NYK",
-        "NaDa",
-        "NaDa",
-        "NaNiwa",
-        "NaRa",
-        "NaTuRal",
-        "NaXin",
-        "NaYa",
-        "Naama",
-        "Nado",
-        "Nafari",
-        "Nail",
-        "Naive-",
-        "NaiveZerg",
-        "NajzMajs",
-        "NalZa",
-        "Nameless",
-        "NamhciR",
-        "Namshar",
-        "NanMan",
-        "Nando",
-        "NaniKawaii",
-        "NapaleoshQa",
-        "Napoleon",
-        "Narcissus",
-        "Narcotic",
-        "NarutO",
-        "NasisNazty",
-        "Nathanias",
-        "Natsumi-",
-        "Naugrim",
-        "Navi",
-        "Nazgul",
-        "NeO",
-        "NeOAnGeL",
-        "NeaR",
-        "Nedbone",
-        "Neeb",
-        "Nefertiti",
-        "Nefrit",
-        "Negi",
-        "Neige",
-        "Neks",
-        "Nerazim",
-        "Nerchio",
-        "NerdSwagger",
-        "Nerski",
-        "Nerve",
-        "NesTea",
-        "Net",
-        "Nettie",
-        "Nettie",
-        "Neuro",
-        "Neutrals",
-        "NeverEnd",
-        "New",
-        "Newsham",
-        "Nexus",
-        "Nice",
-        "Nicoract",
-        "Nifi",
-        "Night Terror",
-        "NightCloNe",
-        "NightEnD",
-        "NightMare",
-        "NightWarrior",
-        "Nightmare",
-        "Nightshade",
-        "Nikko",
-        "Nikobaby",
-        "Nina",
-        "Nine",
-        "Ninja",
-        "Ninja",
-        "NinjaToss",
-        "Niqua",
-        "Niroxs",
-        "Nisha",
-        "Nistic",
-        "Niteshade",
-        "Nitix",
-        "Nix",
-        "Nj",
-        "No!ob",
-        "NoLimit",
-        "NoRegreT",
-        "Noblesse",
-        "Nofear",
-        "Nogard",
-        "Noia",
-        "NonY",
-        "Noname",
-        "Nono",
-        "Noone",
-        "Notah",
-        "NothingToSay",
-        "Noticimus",
-        "Nova",
-        "NovaWar",
-        "NuBrGNi",
-        "NucleaR",
-        "NukeLar",
-        "Numi",
-        "NutZ",
-        "Nux",
-        "Nycro",
-        "Nzs",
-        "O'Doyle",
-        "Oasis",
-        "Obliterator",
-        "Oceania",
-        "OdiN",
-        "Odin",
-        "Offak",
-        "Ohaiyo",
-        "Oli",
-        "Olimoley",
-        "OmegaPwner",
-        "Omen",
-        "Op",
-        "OpTiKzErO",
-        "Operator",
-        "Optimus",
-        "Oracle",
-        "Oreo",
-        "Organ",
-        "Ori",
-        "OriOn",
-        "Origami",
-        "Origine",
-        "Orly",
-        "Orthros",
-        "Oscar",
-        "Osho",
-        "Ostojiy",
-        "Otaker",
-        "Ouker",
-        "Ourk",
-        "OutSide",
-        "Overtaker",
-        "Overthrow",
-        "Owa",
-        "OxygeN",
-        "Oz",
-        "PAADA",
-        "PAPI",
-        "PCT",
-        "POX",
-        "PSM",
-        "PSiArc",
-        "Pablo",
-        "Pacomike",
-        "Padre",
-        "PainUser",
-        "Pajkatt",
-        "Pakazs",
-        "Palantimos",
-        "Palos",
-        "Panda",
-        "PandaBearMe",
-        "PandaTank",
-        "Pandaego",
-        "Panic",
-        "Panther",
-        "Papita",
-        "PappiJoe",
-        "Paradise",
-        "ParalyzE",
-        "Paramour",
-        "ParanOid",
-        "ParkJongHyuk",
-        "Parkson",
-        "PartinG",
-        "PatSoul",
-        "Patience",
-        "Patos",
-        "PattyMac",
-        "Peace",
-        "Pearl Heart",
-        "Pedroca",
-        "Peksu",
-        "PengWin",
-        "PenguiN",
-        "Peppy",
-        "Percival",
-        "Perfect",
-        "Personal",
-        "Pet",
-        "Petraeus",
-        "Petru44o",
-        "Pezz",
-        "Phamut",
-        "Phantasm",
-        "Phantom",
-        "Phobia",
-        "PhoeNix",
-        "Phoenix",
-        "Phog",
-        "PiG",
-        "PiLiPiLi",
-        "PiNoY",
-        "Piao",
-        "Pigbaby",
-        "Pigeon",
-        "PikA",
-        "Pikachu",
-        "Pikachu",
-        "Pike",
-        "Pile Driver",
-        "Pinder",
-        "Pingvincek",
-        "Pio",
-        "PlayHard",
-        "PlaymatE",
-        "Plecto",
-        "Pluto",
-        "PoYo",
-        "Poison",
-        "Poizon",
-        "Pokebunny",
-        "Poker",
-        "Poleaxe",
-        "Poloson",
-        "Polt",
-        "Pomf",
-        "Pomf et Thud",
-        "Pomi",
-        "Pooh",
-        "Poseidon",
-        "Potiguar",
-        "Power Train",
-        "Pox",
-        "PracticeX",
-        "Prada",
-        "Prebs",
-        "PredY",
-        "Predator",
-        "PrettyHaw",
-        "Primelot",
-        "Prince",
-        "PrintSc",
-        "Pro7ecT",
-        "ProAnnn",
-        "Probe",
-        "Prodigy",
-        "Prosper",
-        "Protoss",
-        "Protosser",
-        "Prototype",
-        "PsY",
-        "PsiOniC",
-        "PsinSin",
-        "Psych",
-        "Psycho",
-        "Ptak",
-        "PtitDrogo",
-        "PuMa",
-        "PuPu",
-        "PuReBall",
-        "PuberrrR",
-        "Puer tea",
-        "Pughy",
-        "Pumps",
-        "Punisher",
-        "Punisher",
-        "Punk",
-        "Puppey",
-        "Pure",
-        "Pure",
-        "PureLegacy",
-        "Pursuit",
-        "Puzzle",
-        "Puzzler",
-        "Pyre",
-        "Pyue",
-        "Pyw",
-        "Q",
-        "QAZ",
-        "QO",
-        "QYQX",
-        "Qike",
-        "Quantel",
-        "Quarterstaff",
-        "QueenE",
-        "Quiet",
-        "Quinn",
-        "Qupe",
-        "QwisTa",
-        "QzDdb",
-        "R7",
-        "RAI",
-        "RAMZES666",
-        "RAPiD",
-        "RMC",
-        "RR",
-        "RaNgeD",
-        "Rabbit",
-        "Rabid",
-        "Raddow",
-        "Radical",
-        "Rage",
-        "Raggy",
-        "RagnaroK",
-        "Rail",
-        "Railgan",
-        "Rain",
-        "Rain",
-        "RainBOw",
-        "RainBOw",
-        "Rajjix",
-        "Rakuzan",
-        "Ram",
-        "Ramolito",
-        "Ramz",
-        "Ran",
-        "Rancor",
-        "Ranger",
-        "Ranger",
-        "Rap Rap",
-        "Rapy",
-        "Rari",
-        "Ratchet",
-        "Raven",
-        "Raven",
-        "Raykill",
-        "Raylalisa",
-        "Raze",
-        "RazerBlader",
-        "Razor",
-        "RdO",
-        "ReQuiem",
-        "ReSpOnSe",
-        "ReWhite",
-        "ReaL",
-        "ReaLaxXx",
-        "Ready",
-        "Ready",
-        "Reality",
-        "Reaper",
-        "Reaper",
-        "ReasN",
-        "ReasoN",
-        "Reave",
-        "Reaves",
-        "Rebel",
-        "Rebellion",
-        "Red",
-        "Red",
-        "RedArchon",
-        "RedPanda",
-        "Redeye",
-        "Reelo",
-        "Reesion",
-        "Reinca",
-        "Reisen",
-        "Renegade",
-        "Rengen",
-        "RenieHouR",
-        "Replicant",
-        "Resin",
-        "Resolut1on",
-        "Ret",
-        "Retribution",
-        "Revenant",
-        "Revenge",
-        "Revival",
-        "Revolution",
-        "Revolution",
-        "Revolver",
-        "Rex",
-        "Rex",
-        "Reynor",
-        "Rhizer",
-        "Rhoust",
-        "RiChY",
-        "RiSky",
-        "Rifkin",
-        "Rigs",
-        "Rikytan",
-        "Rilakkuma",
-        "Rime",
-        "Rimfire",
-        "RinKokonoe",
-        "Rine",
-        "Ripley",
-        "Riquiz",
-        "Riser",
-        "Ritsu",
-        "RivaL",
-        "Riveter",
-        "Rize",
-        "Rmdx",
-        "RoRrO",
-        "Roadkill",
-        "Rob",
-        "Rob Simpson",
-        "Robin",
-        "Robo-Z",
-        "Robzki",
-        "Rock",
-        "Rockletz",
-        "Roddgeee",
-        "RodjER",
-        "Rodzyn",
-        "RogerDodger",
-        "Rogue",
-        "Rogue",
-        "Roll",
-        "Rom",
-        "Romson",
-        "Rong",
-        "Ronin",
-        "Rookie",
-        "Roon",
-        "RorO",
-        "Rose",
-        "Rossi",
-        "Rot",
-        "Rotab",
-        "Rote",
-        "RotterdaM",
-        "Roulette",
-        "Route",
-        "Roy",
-        "Royal",
-        "RuFF",
-        "Rubble",
-        "Ruin",
-        "Ruiner",
-        "Ruiyichi",
-        "RunA",
-        "RunaMoK",
-        "Runec",
-        "Running Eagle",
-        "RusZerg",
-        "Rushcrazy",
-        "Rushi",
-        "Rusman",
-        "Ryan",
-        "Ryan",
-        "RyoO",
-        "Ryosis",
-        "Ryoya",
-        "Ryu",
-        "RyuUboruZ",
-        "Ryung",
-        "Ryuya",
-        "Ryze",
-        "Ryze",
-        "SCBoy",
-        "SCripted",
-        "SKillous",
-        "SLeet",
-        "SLiCKz",
-        "SLiDeR",
-        "SLoG",
-        "SLush",
-        "SOhY",
-        "SSanaEE",
-        "SSanaEE",
-        "SSeoni",
-        "SSul",
-        "STABA",
-        "STX",
-        "SUGGY",
-        "SUPERSTAR",
-        "SUPERSTAR",
-        "SVG",
-        "SaLemandr",
-        "SaSe",
-        "SabeRLight-",
-        "Saber",
-        "SaberAltoria",
-        "Sabotage",
-        "Saboteur",
-        "SacDeFromage",
-        "Sacred",
-        "Sacsri",
-        "Saga",
-        "Sage",
-        "Saik0u",
-        "Saiko",
-        "SaintDeLucaz",
-        "Sakata",
-        "Saksa",
-        "Sakura",
-        "Sakya",
-        "Salmosa",
-        "SaltTheWound",
-        "Sam_H",
-        "Sammyboy",
-        "Samsam",
-        "San",
-        "Sanddbox",
-        "SangSang",
-        "Santa",
-        "SantaSam",
-        "SarenS",
-        "SaroVati",
-        "Sasori",
-        "Sasquatch",
-        "Sasquatch",
-        "SatO",
-        "Satiini",
-        "Satu",
-        "Satyr",
-        "Savage",
-        "Save",
-        "Save-",
-        "ScaM",
-        "Scab",
-        "Scalp",
-        "Scandal",
-        "Scar",
-        "Scarlett",
-        "Sccc",
-        "Scheme",
-        "Schizo",
-        "Schnitzel",
-        "Schnitzel",
-        "Scimitar",
-        "Scofield",
-        "Scorpion",
-        "Scream",
-        "Sculp",
-        "Sculp",
-        "Scythe",
-        "Sea",
-        "Seal",
-        "Seal",
-        "Seala",
-        "Sealkid",
-        "Sedoy",
-        "Seed",
-        "Sefirofe",
-        "Sehny",
-        "Seigifried",
-        "Sein",
-        "Seiplo",
-        "Seither",
-        "Sekhmet",
-        "SeleCT",
-        "SeleCT",
-        "Seleri",
-        "Selkie",
-        "Seltzer",
-        "Semmlertheriot",
-        "Semper",
-        "Sen",
-        "SenSei",
-        "SengKun",
-        "Senin",
-        "SeoHyeon",
-        "September",
-        "Sepulcher",
-        "Seracis",
-        "Seri",
-        "Seriously",
-        "Serral",
-        "ServaNT",
-        "Setsu",
-        "Sever",
-        "SexyBamboe",
-        "Sexyfat",
-        "ShaDoWn",
-        "Shachlo",
-        "Shad",
-        "Shadow",
-        "Shaft",
-        "Shaker",
-        "Shaking",
-        "Shalko",
-        "Shame",
-        "Shana",
-        "Shanks",
-        "Shark",
-        "Sharky",
-        "Sharp",
-        "Shase",
-        "Shellbee",
-        "Sheth",
-        "Shew",
-        "Shieldmaiden",
-        "Shiibbyy",
-        "Shiki",
-        "Shine",
-        "Shine",
-        "Shining",
-        "Shino",
-        "ShinyStar",
-        "ShinymF",
-        "Shiro",
-        "Shiro",
-        "Shiver",
-        "ShoWTimE",
-        "Shoeless",
-        "Shout",
-        "Shovel",
-        "Shriek",
-        "Shuttle",
-        "Shuttle",
-        "Sh\u00c3\u02dcwT",
-        "SiKaRi",
-        "Sia",
-        "Sickness",
-        "Siddhartha",
-        "Siege",
-        "Sifla",
-        "Silent",
-        "Silky",
-        "Silky",
-        "Silver",
-        "SingSing",
-        "Sinner",
-        "Sinok",
-        "Sioras",
-        "Siphonn",
-        "SirRobin",
-        "SirScoots",
-        "Sirc",
-        "Siren",
-        "Sirius",
-        "Sirius",
-        "Siumang",
-        "Siw",
-        "Sjaak",
-        "SjoW",
-        "Skadilicious",
-        "Skeleton",
-        "Skew",
-        "Skinner",
-        "Skit",
-        "Skruffy",
-        "Skull Crusher",
-        "Sky",
-        "Sky",
-        "SkyLark",
-        "Skyler",
-        "Slam",
-        "Slammer",
-        "Slander",
-        "SlashStrike",
-        "Slasher",
-        "Slaughter",
-        "Slayer",
-        "Sledgehammer",
-        "Sleep",
-        "Slungshot",
-        "SlyCrab",
-        "Sm1Ley",
-        "SmAsH",
-        "Small",
-        "Smiling Knight",
-        "Smix",
-        "Snake",
-        "Snake",
-        "Sneyking",
-        "Sniper",
-        "Sniper",
-        "Snitchables",
-        "Snoopy",
-        "Snow",
-        "Snoxtar",
-        "Snute",
-        "SoLotic",
-        "SoN",
-        "SoNNeikO",
-        "Sober",
-        "SocceR",
-        "Socke",
-        "Socket",
-        "SodoN",
-        "Soe",
-        "SolO",
-        "Solar",
-        "Solarian",
-        "Solen",
-        "Soleus",
-        "Solitude",
-        "Solo",
-        "Somnus\u00e4\u00b8\u00b6M",
-        "SonG",
-        "SonGDuri",
-        "SonKiE",
-        "Sonagi",
-        "Sonder",
-        "Sonic",
-        "Sooths",
-        "Sopia",
-        "Sopia",
-        "Sora",
-        "Sorry",
-        "SortOf",
-        "Sottorks",
-        "SouLeer",
-        "SoulSpirit",
-        "Soularium",
-        "Soulkey",
-        "Soulman",
-        "Sound",
-        "Sound",
-        "Soundwave",
-        "Soyhi",
-        "SpaceMarine",
-        "Spades",
-        "Spanishiwa",
-        "Sparrow",
-        "Sparta",
-        "Spatz",
-        "Spazymazy",
-        "SpeCial",
-        "Spear",
-        "Spear",
-        "Spectre",
-        "Spectrum",
-        "SpeeD",
-        "Spin",
-        "Spite",
-        "Spitefulness",
-        "Splendid",
-        "Splicko",
-        "Spunky",
-        "Spunky",
-        "Spy",
-        "Spyte",
-        "Squirtle",
-        "Sr Colter",
-        "Srf",
-        "SryFox",
-        "SsQ",
-        "SsaSpartan",
-        "Ssemi",
-        "Ssoja",
-        "Stabber",
-        "Stalife",
-        "Stallion",
-        "Stan King",
-        "Star",
-        "StarDust",
-        "StarEagle",
-        "StarNaN",
-        "Starbuck",
-        "Starmaster",
-        "State",
-        "State21",
-        "StatiC",
-        "Stats",
-        "Stay",
-        "Steadfast",
-        "Steel",
-        "Steel Foil",
-        "Steel Forge",
-        "Steelshot",
-        "Steffstyle",
-        "StekepaNNe",
-        "Stephano",
-        "Sterling",
-        "Stiletto",
-        "Sting",
-        "Sting",
-        "StingeR",
-        "Stizer",
-        "StoicWilly",
-        "Stomanen1",
-        "Stork",
-        "Storm",
-        "Stormstormer",
-        "Strangby",
-        "Strange",
-        "Strelok",
-        "StriKE",
-        "StrifeCro",
-        "Strike Eagle",
-        "StrinterN",
-        "Stripe",
-        "StuN",
-        "SuGoSu",
-        "SuHoSin",
-        "SubZero",
-        "Subversion",
-        "Sugar",
-        "Suleiman",
-        "SumaiL",
-        "Summer",
-        "Sun",
-        "SunCow",
-        "SunSet",
-        "Sunlight",
-        "Sunokasuri",
-        "Super",
-        "Super",
-        "Super",
-        "SuperNova",
-        "Supernovamaniac",
-        "Suppy",
-        "Supream^",
-        "Supreme",
-        "Supreme",
-        "Surge",
-        "Sushilicious",
-        "Swagger",
-        "Swagger",
-        "Swift",
-        "Swiftending",
-        "Swifty",
-        "Sword",
-        "Syeonix",
-        "Sylar",
-        "Sylla",
-        "Sylvanas",
-        "Symbol",
-        "Sync",
-        "Sythe",
-        "T-Back",
-        "TABRIS",
-        "TAGurPRGNANT",
-        "TANGTANG",
-        "TANNER",
-        "TAiLS",
-        "TC",
-        "TEKCOR",
-        "TH000",
-        "THERIDDLER",
-        "TIME",
-        "TKL",
-        "TLO",
-        "TMjpg",
-        "TORONTOTOKYO",
-        "TREME",
-        "TRUE",
-        "TT1",
-        "TTLK",
-        "TY",
-        "TaKe",
-        "TaeJa",
-        "Taiga",
-        "TakeCare",
-        "TanDongHo",
-        "Tanit",
-        "Tankboy",
-        "Tankboy",
-        "TargA",
-        "Tarki",
-        "Tarrantius",
-        "Tarson",
-        "Tassadar",
-        "Tasteless",
-        "Tattoo",
-        "TcUltimate",
-        "TechFour",
-        "TeebuL",
-        "Teehee",
-        "Tefel",
-        "Temp0",
-        "Temperance",
-        "Tempest",
-        "Tenshi",
-        "Tequila",
-        "Terminator",
-        "Terminator",
-        "TerrOr",
-        "TerraN",
-        "Terror",
-        "Terror",
-        "Tesla",
-        "Teuta",
-        "The Unholy",
-        "TheArgie",
-        "TheBest",
-        "TheBest",
-        "TheChosenOne",
-        "TheGunrun",
-        "TheMista",
-        "TheMusZero",
-        "TheStC",
-        "TheWinD",
-        "TheWinD",
-        "TheZergLord",
-        "The_apathy",
-        "Theo",
-        "TheoRy",
-        "Therence",
-        "Thiolicor",
-        "ThisIsJimmy",
-        "Thor",
-        "ThorZaIN",
-        "Thorminator",
-        "Thrasher",
-        "ThuG",
-        "ThuNdeR",
-        "Thud",
-        "Thunderbird",
-        "Thundertoss",
-        "ThuocLao",
-        "Tible",
-        "Tible",
-        "TidesofTime",
-        "Tiffany",
-        "Tiger",
-        "Tiger Claw",
-        "Tigger",
-        "Tile\u00c3\u00a4",
-        "Timado",
-        "Time",
-        "Time2Die",
-        "Timorus",
-        "Tims",
-        "Tino",
-        "TitaN",
-        "Titanium",
-        "Tito",
-        "ToD",
-        "ToSsGirL",
-        "Toast",
-        "Tobi",
-        "Tocon",
-        "Today",
-        "Toei",
-        "Tomcat",
-        "TomikuS",
-        "Tone",
-        "Tonho",
-        "TooDming",
-        "TooFuckingGood",
-        "Tooth",
-        "Top",
-        "TopClass",
-        "TopClass",
-        "TopRush",
-        "Topson",
-        "Torch",
-        "Torpedo",
-        "Torque",
-        "Tosyad",
-        "TotalBiscuit",
-        "Towelie",
-        "Trace",
-        "Tralf",
-        "Trap",
-        "Trencher",
-        "Trend",
-        "TriMaster",
-        "TricKsteR",
-        "Trick",
-        "Trifax",
-        "Trip",
-        "Trixi",
-        "Trooper",
-        "Troumen",
-        "Troumen",
-        "True",
-        "True",
-        "Trump",
-        "Trust",
-        "Truth",
-        "Try",
-        "TuTu",
-        "TuZeR",
-        "TubbyTheFat",
-        "Tudi",
-        "Tulex",
-        "Tulimeri",
-        "Tumba",
-        "Tunico",
-        "TurN",
-        "TurN",
-        "Turbo",
-        "TurkeyDano",
-        "Turuk",
-        "Tusk",
-        "Tweek",
-        "Twine",
-        "Ty",
-        "Tzy",
-        "USH",
-        "USHUSHUSH",
-        "Uhen",
-        "Ukko",
-        "UkraineStar",
-        "Ultimate",
-        "Ultimate",
-        "Ultra",
-        "UnderShock",
-        "Underdark",
-        "UngNim",
-        "Uniden",
-        "Universe",
-        "Universe",
-        "Unix",
-        "Unstoppable",
-        "Upakowka",
-        "Uply",
-        "Uprising",
-        "Uproar",
-        "Upsurge",
-        "Uzikoti",
-        "V",
-        "V-Tune",
-        "VANSKOR",
-        "VINES",
-        "VINES",
-        "VOJ",
-        "Vaalix",
-        "Vainglory",
-        "Vaisravana",
-        "Valdes",
-        "Valkyrie",
-        "Valor",
-        "ValuE",
-        "Van",
-        "Vanity",
-        "Vanya",
-        "Varen",
-        "Variance",
-        "Variant",
-        "Varizh",
-        "Vasacast",
-        "Vein",
-        "Velo",
-        "Velvet",
-        "VeniVidiVins",
-        "Venom",
-        "Venom",
-        "Venus",
-        "Venus",
-        "Ver",
-        "Veralynn",
-        "Vex",
-        "ViBE",
-        "VicentiN",
-        "Vicoros",
-        "Vigoss",
-        "Vile",
-        "Villain",
-        "Vindicta",
-        "Viper",
-        "Virium",
-        "Virtual",
-        "Virus",
-        "Virus",
-        "Visery",
-        "Vivian",
-        "Vivid",
-        "Vixen",
-        "Vlaicu",
-        "Void",
-        "VoidRay",
-        "Voltacus",
-        "Voodoo",
-        "VortiX",
-        "Voyager",
-        "Vriska",
-        "Vulture",
-        "W1sh-",
-        "WP",
-        "WPz",
-        "WaKa",
-        "Waii",
-        "Waixi",
-        "Wake",
-        "Wally",
-        "Wanderer",
-        "Wanderer",
-        "WannaBeByuN",
-        "Wannabecool",
-        "Wanted",
-        "War Hammer",
-        "Warbattle",
-        "Wardi",
-        "Wardon",
-        "Warlog",
-        "WarreN",
-        "WayTeh",
-        "Waylay",
-        "Waytosexy",
-        "Webz",
-        "Weekend",
-        "Weekend",
-        "Welmu",
-        "Welp",
-        "Wendigo",
-        "Wenn",
-        "Whale",
-        "Whiplash",
-        "White",
-        "White Tights",
-        "White-Ra",
-        "Whitemon",
-        "Wibu",
-        "Wicked",
-        "Widow",
-        "Wij",
-        "WildGame",
-        "Wildcat",
-        "Wilko",
-        "WinDraE",
-        "Wind",
-        "Windx",
-        "Winter",
-        "Winter",
-        "Winter",
-        "Wisper",
-        "Wizard",
-        "Wolf",
-        "Wolf",
-        "Wolf",
-        "Wolverine",
-        "WoodedMicrob",
-        "Woon",
-        "Wracker",
-        "Wraith",
-        "Wraith",
-        "Wrath",
-        "Wrecker",
-        "Wrench",
-        "Wu",
-        "WyScion",
-        "X-Skull",
-        "X-Treme",
-        "X-hibit",
-        "XCJ",
-        "XDD",
-        "XSvamp1Re",
-        "XY",
-        "XaKoH",
-        "Xcalibur",
-        "XemistrY",
-        "Xenocider",
-        "Xenon",
-        "Xenon",
-        "Xepher",
-        "Xi",
-        "XiGua",
-        "Xiami",
-        "XiaoXiaoSala",
-        "Xiaose",
-        "Xibbe",
-        "XinQ",
-        "XionS",
-        "XlorD",
-        "XluoS",
-        "Xm",
-        "XtinC",
-        "Xxs",
-        "Xyz",
-        "YRG",
-        "YYF",
-        "YaTa",
-        "Yabyoo",
-        "Yadomi",
-        "YamateH",
-        "YanXII",
-        "Yang",
-        "YangSongE",
-        "YaphetS",
-        "YapzOr",
-        "Yarder",
-        "Yasy",
-        "YawaR",
-        "Yds.",
-        "Yeah",
-        "Yekke",
-        "Yel",
-        "YellOw",
-        "YenFu",
-        "Yif",
-        "Yin",
-        "YoDa",
-        "YoGer",
-        "YoGo",
-        "Yong",
-        "YongHwa",
-        "YoonYJ",
-        "Yopaj",
-        "Yoshi Kirishima",
-        "YouNai",
-        "YoungJoo",
-        "YoungJoo",
-        "YoungStar",
-        "YoungYakov",
-        "Yourosia",
-        "Yours",
-        "Yowe",
-        "Yp",
-        "Ysaera",
-        "YuMe",
-        "YugiOh",
-        "ZAiN",
-        "ZERGTV",
-        "ZSMJ",
-        "Zacky",
-        "Zan",
-        "ZanDarke",
-        "Zanster",
-        "Zanubis",
-        "Zayac",
-        "Zazu",
-        "ZeNa",
-        "Zeal",
-        "Zeal",
-        "Zealot",
-        "Zedd",
-        "ZeeRaX",
-        "Zelniq",
-        "Zenigata",
-        "Zenio",
-        "Zepph",
-        "ZerO",
-        "ZergGirl",
-        "Zerghamdi",
-        "Zero",
-        "Zero",
-        "ZeroPerfect",
-        "Zervas",
-        "Zest",
-        "Zeth",
-        "ZeuS",
-        "Zeweig",
-        "Zfreek",
-        "Zhou",
-        "ZhuGeLiang",
-        "Ziggy",
-        "Ziktomini",
-        "Zinho",
-        "Ziomek",
-        "Zion",
-        "ZipperTheFly",
-        "Zitraks",
-        "Zizou",
-        "Znow",
-        "Zoia",
-        "ZombieGrub",
-        "Zoun",
-        "ZpuX",
-        "Ztok",
-        "Zweihander",
-        "ZyM",
-        "Zycart",
-        "Zyd",
-        "Zyzz",
-        "Zzq",
-        "[T]SA",
-        "aCtive",
-        "aGaham",
-        "aGiLe",
-        "aLive",
-        "aRaimaiRu",
-        "aabBAA",
-        "actioN",
-        "agressive child",
-        "ah fu",
-        "ana",
-        "anypro",
-        "anypro",
-        "ar3a1234",
-        "asd",
-        "asd",
-        "avilo",
-        "b1kA",
-        "bLink",
-        "bLuR",
-        "bOne7",
-        "baNhwA",
-        "balla",
-        "bardo",
-        "biGs",
-        "binski",
-        "black.z",
-        "blowyourbrain",
-        "bobo",
-        "boombell",
-        "bowbowbow",
-        "breek",
-        "brent",
-        "brink",
-        "btmn",
-        "bubu",
-        "cArn",
-        "cOre",
-        "cOre",
-        "cYso",
-        "canceL^^",
-        "carrot",
-        "cas158",
-        "chorocarlo",
-        "chshrct",
-        "ck",
-        "cml",
-        "control",
-        "control",
-        "craNich",
-        "csj",
-        "cypher",
-        "dOpa",
-        "dabeliuteef",
-        "daisuki",
-        "danran",
-        "dark",
-        "dayvie",
-        "ddc",
-        "dde",
-        "ddz",
-        "deL",
-        "desRow",
-        "destiny",
-        "deth",
-        "dice",
-        "djWHEAT",
-        "dnz",
-        "domickc",
-        "doodle",
-        "dream",
-        "dreamertt",
-        "dreamertt",
-        "duckdeok",
-        "duckdeok",
-        "eGGz",
-        "eGo",
-        "eL lisasH",
-        "eLeVeN",
-        "eMotion",
-        "effecto",
-        "eine",
-        "eins",
-        "ekSi",
-        "elcoco",
-        "elemental",
-        "elfi",
-        "elizae",
-        "elizae",
-        "envious",
-        "epileptick1d",
-        "erL",
-        "eresloco",
-        "expertX",
-        "eyyou",
-        "f(x)",
-        "feardragon",
-        "firebathero",
-        "flo",
-        "flyfly",
-        "fn",
-        "fng",
-        "fozzy",
-        "fraer",
-        "free",
-        "frozz",
-        "fubb",
-        "fullheart",
-        "fy",
-        "garter",
-        "german player",
-        "ggod",
-        "ggod",
-        "ghost",
-        "giX",
-        "gnoji",
-        "goblin",
-        "goddam",
-        "goking",
-        "gotquail",
-        "gpk",
-        "guanzo",
-        "gyulzzing",
-        "hAze",
-        "hFn",
-        "hG",
-        "hOpe",
-        "hOpe",
-        "hellokitty",
-        "hendralisk",
-        "herO",
-        "hero",
-        "hex0r",
-        "hinO",
-        "hiohu",
-        "hitmaN",
-        "ho8ot",
-        "horror",
-        "hyhy",
-        "hyvaa",
-        "iAnnihilate",
-        "iAsonu",
-        "iLLusionisT",
-        "iLTW",
-        "iNSaNiA",
-        "iNSoLeNCE",
-        "iNcontroL",
-        "iNkA",
-        "iaguz",
-        "iceice",
-        "iceiceice",
-        "iceiceice",
-        "ilLogic",
-        "illias",
-        "illusion",
-        "ima_sheep(sux)",
-        "inFeZa",
-        "inNirvana",
-        "inYourdreaM",
-        "indy",
-        "inori",
-        "inori",
-        "intense",
-        "inuh",
-        "itmeJP",
-        "ixmike88",
-        "j4",
-        "jAM3S",
-        "jEcho",
-        "jdh",
-        "jeysen",
-        "jheffe",
-        "jigglebilly",
-        "jjakji",
-        "jjonga",
-        "jonassomfan",
-        "jookTo",
-        "justfake",
-        "justin",
-        "k",
-        "kAra",
-        "kAsyu",
-        "kAsyu",
-        "kYxY",
-        "kabyraGe",
-        "kacor",
-        "kaidou",
-        "kaitlyn",
-        "kaozfate",
-        "kauP",
-        "kellyMILKIES",
-        "kickeed",
-        "kiwian",
-        "kiyj",
-        "knutzi",
-        "kokijjom",
-        "kpii",
-        "krylat",
-        "kurOa",
-        "lightless",
-        "lil pleb",
-        "lil sorry",
-        "ling",
-        "longb",
-        "lordboonz",
-        "loveyouloveme",
-        "lowkez",
-        "lt",
-        "luway",
-        "mOOnGLaDe",
-        "mOoNan",
-        "mOoNan",
-        "maiki",
-        "mak0z",
-        "maomao",
-        "marSu",
-        "marlin",
-        "mason",
-        "mdL",
-        "meLes",
-        "mellojul",
-        "merz",
-        "miCKe",
-        "miGGel",
-        "mianmian",
-        "miggeL.Z",
-        "miku",
-        "miou",
-        "miso",
-        "monchi",
-        "monkeys-forever",
-        "mool",
-        "mooyong",
-        "msrm",
-        "murdOc",
-        "nLghosT",
-        "nanO",
-        "nazomen",
-        "nemphy",
-        "nemuke",
-        "niceq",
-        "ninjaboogie",
-        "nirvAnA",
-        "nongrata",
-        "oDin",
-        "oRioN",
-        "okcya",
-        "old chicken",
-        "oldWhite",
-        "omgabanana",
-        "orb",
-        "pYung",
-        "paS",
-        "pal",
-        "perhark",
-        "picur",
-        "pieliedie",
-        "piglet",
-        "pio65",
-        "plAnet",
-        "plato",
-        "ploguidice",
-        "plov",
-        "ppd",
-        "prabuty",
-        "printf",
-        "prodiG",
-        "profheadshot",
-        "pwN",
-        "qianqian",
-        "qojqva",
-        "qualitY",
-        "qxc",
-        "r1sk",
-        "r5r5",
-        "rANDY",
-        "rare",
-        "repoduck",
-        "rin",
-        "roof",
-        "row",
-        "rsvp",
-        "ryOyr",
-        "s2",
-        "s4",
-        "sC",
-        "sKyHigh",
-        "sLh",
-        "sLivko",
-        "sOs",
-        "sSak",
-        "sWs",
-        "sYz",
-        "sad protoss",
-        "sad tomat",
-        "sanyaquez",
-        "sayuw",
-        "shatan",
-        "shinyA",
-        "sigh",
-        "sjokz",
-        "skem",
-        "skiter",
-        "sl4d1n-",
-        "slahser",
-        "smulgullig",
-        "so bad",
-        "soO",
-        "souL",
-        "spacy",
-        "sprEEEzy",
-        "sss",
-        "stakimaN",
-        "starkiller",
-        "strawberry",
-        "sugar baby",
-        "symetricaL",
-        "tatakae",
-        "tavo",
-        "tgun",
-        "theognis",
-        "tmt",
-        "tnt",
-        "tomve",
-        "trOt",
-        "twiSta",
-        "uThermal",
-        "ubah",
-        "ufir",
-        "unicornxoxo",
-        "uzer",
-        "velheor",
-        "viOLet",
-        "viPro",
-        "vtF\u00ce\u00b1ded",
-        "w33",
-        "wejustzik",
-        "whiteBeard",
-        "whiteant",
-        "wiNgiAN",
-        "wwieWambo",
-        "xD",
-        "xFreedom",
-        "xKawaiian",
-        "xLucky",
-        "xMusiCa",
-        "xNova",
-        "xRag",
-        "xannii",
-        "xiaOt",
-        "xiangzai",
-        "xiaofu",
-        "xixi",
-        "xuan",
-        "xy-",
-        "yAj",
-        "yChen",
-        "y`",
-        "yaha",
-        "yamich",
-        "yatoro",
-        "yoky-",
-        "yol",
-        "yoona",
-        "young G",
-        "yryf",
-        "yxb",
-        "yxm",
-        "yy",
-        "zUP",
-        "zai",
-        "zc",
-        "zhi!",
-        "zxc",
-        "\u00c3\u2013ssy",
-        "ActScene",
-        "Alive",
-        "Art",
-        "Athena",
-        "BAeKHo",
-        "BaeMe",
-        "Balkhan",
-        "Ben",
-        "Bigfafa",
-        "Blanc",
-        "Blossom",
-        "Bono",
-        "Brush",
-        "Candy",
-        "Chaser",
-        "Chei",
-        "CheonGo",
-        "Clever",
-        "CloudTemplar",
-        "Coco",
-        "Comet",
-        "Cover",
-        "Cpt Jack",
-        "Crazy",
-        "Crown",
-        "Crush",
-        "dade",
-        "Dara",
-        "DoRaoN",
-        "Duke",
-        "Easyhoon",
-        "Emperor",
-        "Expect",
-        "Fenix",
-        "FireRain",
-        "Flame",
-        "Focus",
-        "Frozen",
-        "Gamsu",
-        "Gangbong",
-        "Gari",
-        "Ggamza",
-        "GimGoon",
-        "GorillA",
-        "GuGer",
-        "H0R0",
-        "Haru",
-        "Helios",
-        "Hojin",
-        "Homme",
-        "Ian",
-        "ikssu",
-        "Iloveoov",
-        "Imp",
-        "Irean",
-        "Jinoo",
-        "Jisu",
-        "Jjun",
-        "Justice",
-        "KaKAO",
-        "Keane",
-        "Keshi",
-        "Aluka",
-        "BadeMan",
-        "Casual",
-        "Cat",
-        "Changhong",
-        "Chaox",
-        "chen9",
-        "Chenlun17",
-        "Cloud",
-        "Cola",
-        "Condi",
-        "Cool",
-        "Corn",
-        "Crescent",
-        "Duan",
-        "Fenfen",
-        "Fireloli",
-        "FZZF",
-        "GodLike",
-        "GODV",
-        "Gogoing",
-        "Guoguo",
-        "illuSioN",
-        "Jiekou",
-        "Kid",
-        "Killua",
-        "Kitties",
-        "Letme",
-        "Ley",
-        "Lies",
-        "LoveLing",
-        "Magic",
-        "Memory",
-        "Misaya",
-        "Mitsuki",
-        "Mlxg",
-        "Mouse",
-        "Moyu",
-        "NaMei",
-        "Pyl",
-        "san",
-        "Sks",
-        "Smlz",
-        "U",
-        "Uzi",
-        "Vasilii",
-        "WeiXiao",
-        "Wings",
-        "World6",
-        "xiaohan",
-        "XiaoWeiXiao",
-        "XiaoXiao",
-        "XinMo",
-        "XuanXuanPi",
-        "Xx",
-        "Youdang",
-        "YourRiver",
-        "ZWuJi",
-        "Zz1tai",
-        "Pierre",
-        "InKos",
-        "Atlanta",
-        "bit1",
-        "BocaJR",
-        "Duclou",
-        "esA",
-        "Fitz",
-        "Freire",
-        "Kami",
-        "LEP",
-        "Professor",
-        "Revolta",
-        "Riyev",
-        "Sarkis",
-        "Shini",
-        "takeshi",
-        "Thurizao",
-        "tockers",
-        "Yang",
-        "Zantins",
-        "Zuao",
-        "Altec",
-        "Bigfatlp",
-        "Biofrost",
-        "bobqin",
-        "Cake",
-        "Call Lin",
-        "Duoking",
-        "Engo",
-        "Evolved",
-        "Hard",
-        "Kubz",
-        "Maplestreet",
-        "Mist",
-        "Raheen",
-        "Rodov",
-        "Sheep",
-        "Shiphtur",
-        "Tuesday",
-        "Pride",
-        "Skeeto",
-        "Slow",
-        "Zealot",
-        "Zeypher",
-        "Acerola",
-        "IchiGod",
-        "Shade",
-        "Jirall",
-        "Peluchin",
-        "Akunma",
-        "Manu",
-        "Prelude",
-        "Adrian",
-        "Allorim",
-        "AndyBendy",
-        "Apollo",
-        "Arcsecond",
-        "Balls",
-        "Brandini",
-        "BunnyFuFuu",
-        "Cao",
-        "Chauster",
-        "DarkWings",
-        "Deftly",
-        "Dyrus",
-        "Fill",
-        "Flaresz",
-        "Fragas",
-        "Hakuho",
-        "Imaqtpie",
-        "KiWiKiD",
-        "Lautemortis",
-        "LemonNation",
-        "MaGeRdAnGeR",
-        "mancloud",
-        "MegaZero",
-        "Meteos",
-        "MikeYeung",
-        "OmarGod",
-        "Patoy",
-        "Phantoml0rd",
-        "Remilia",
-        "Rhino",
-        "Rikara",
-        "Saintvicious",
-        "scarra",
-        "Shady",
-        "Sun",
-        "Tempos",
-        "TheRainMan",
-        "wingsofdeathx",
-        "Xeno",
-        "Xmithie",
-        "Xpecial",
-        "xSojin",
-        "Zeyzal",
-        "Zikz",
-        "Zuna",
-        "MANTARRAYA",
-        "Xypherz",
-        "Crumbz",
-        "Relic",
-        "Bobo",
-        "Inition",
-        "Wardain",
-        "Ardes",
-        "BarneyD",
-        "Belgianbeast",
-        "ImSoFresh",
-        "Krepo",
-        "Lenny",
-        "Mytheos",
-        "wewillfailer",
-        "Dany",
-        "Kenapil",
-        "Naelynn",
-        "Nardeus",
-        "Robocop",
-        "Rufus",
-        "Sawyor",
-        "Sirinox",
-        "Vasked",
-        "Ashanome",
-        "Bloody",
-        "Brosak",
-        "Cabochard",
-        "Fraid",
-        "Hantera",
-        "Hyami",
-        "hyrqBot",
-        "Sardoche",
-        "ShLaYa",
-        "Skyyart",
-        "Spontexx",
-        "TraYtoN",
-        "Yuuki60",
-        "Zaboutine",
-        "Broeki",
-        "CandyPanda",
-        "dexter",
-        "Don Arts",
-        "Envy Carry",
-        "Exile",
-        "ForellenLord",
-        "hammann",
-        "Jaeger",
-        "Kerp",
-        "LaMiaZeaLoT",
-        "Mafab",
-        "Mellisan",
-        "MoMa",
-        "Nyph",
-        "Phrenic",
-        "Saizo",
-        "Sedrion",
-        "ShadowmaRe",
-        "sLiM5h4dY",
-        "Tolkin",
-        "Uloper",
-        "Yellowpete",
-        "BB Muffin",
-        "Blaise",
-        "Moo",
-        "Jinsh",
-        "Axecitement",
-        "Barrage",
-        "CozQ",
-        "Crines",
-        "Crit Hero",
-        "Dipsy",
-        "Hachiman",
-        "Jhinsane",
-        "Kitty",
-        "Masterwork",
-        "Metalx",
-        "Mke",
-        "Morsu",
-        "Ripi",
-        "Sebs",
-        "Shook",
-        "Soulah",
-        "Special",
-        "Tabzz",
-        "Vamir",
-        "Vizility",
-        "Witsyy",
-        "YallaSafSaf",
-        "Airwaks",
-        "Bando",
-        "Afflict",
-        "Caedrel",
-        "Eragon",
-        "Fax",
-        "Governor",
-        "Jakamaka",
-        "Joekerism",
-        "Kamil",
-        "Rowelly",
-        "Shacker",
-        "Shikari",
-        "Shogun",
-        "Snoopeh",
-        "Snuggli",
-        "Sof",
-        "Yusa",
-        "Achuu",
-        "Doss",
-        "Doxy",
-        "Fittle",
-        "FlayStation",
-        "Froggen",
-        "Guubi",
-        "MrRalleZ",
-        "Nisbeth",
-        "Obvious",
-        "Priskornet",
-        "Soren",
-        "Taxer",
-        "TheTess",
-        "Urban",
-        "Vayu",
-        "Wendelbo",
-        "Wickd",
-        "Wolf",
-        "Zorozero",
-        "Arin",
-        "Azitor",
-        "Bella",
-        "Cyanide",
-        "Igloo",
-        "Imbi",
-        "Jonsonny",
-        "Merza",
-        "Sairusq",
-        "Selfway",
-        "Taikki",
-        "Wolvyz",
-        "Yameru",
-        "Zytan",
-        "AlphaCloud",
-        "Energy",
-        "k0u",
-        "NicoThePico",
-        "Nomi",
-        "nukeduck",
-        "Pjush",
-        "Quixeth",
-        "Sharp",
-        "Stratospanda",
-        "aesthetic",
-        "Baloo",
-        "BetongJocke",
-        "Betsy",
-        "Cathrine",
-        "Cookie",
-        "cowTard",
-        "Denzel",
-        "FatMamma",
-        "Fox",
-        "G0DFRED",
-        "Jree",
-        "Jwaow",
-        "Kanin",
-        "KRP",
-        "Malice",
-        "Malunoo",
-        "Mimer",
-        "Mirror",
-        "Muvert",
-        "POILK",
-        "Quinncidence",
-        "Rawbin",
-        "Skeden",
-        "Svensson",
-        "Thebausffs",
-        "Twiizt",
-        "Xyraz",
-        "Aki",
-        "Click",
-        "DrMatt",
-        "Feint",
-        "Gabbo",
-        "Guilty",
-        "Saddy",
-        "Shadow",
-        "Lastwolf",
-        "Adryh",
-        "Araneae",
-        "DarkSide",
-        "FeeNiixZ",
-        "Homi",
-        "Lvsyan",
-        "Samux",
-        "Skain",
-        "Soul",
-        "Werlyb",
-        "BloodWater",
-        "Four",
-        "Lmzs",
-        "LUBEEENZZZ",
-        "Turanaga",
-        "Venzer",
-        "Bruno",
-        "xani",
-        "Bako",
-        "FORG1VEN",
-        "HungryPanda",
-        "IceBreaker",
-        "Mersa",
-        "Von",
-        "Vizicsacsi",
-        "ChangeName",
-        "behave",
-        "bucu",
-        "Bullet",
-        "Color",
-        "Creaton",
-        "Czajek",
-        "Czekolad",
-        "Czypsy",
-        "Dawidsonek",
-        "Dedrayon",
-        "Glebo",
-        "Gricek",
-        "Ippon",
-        "Kashtelan",
-        "Kikis",
-        "Lewus",
-        "Makler",
-        "Meleks",
-        "Melonik",
-        "niQ",
-        "Odi11",
-        "Ravea",
-        "Roison",
-        "Rybson",
-        "Selfie",
-        "Shushei",
-        "t4nky",
-        "Tabasko",
-        "Unknown",
-        "vvarion",
-        "Wysek",
-        "Zwyroo",
-        "Kaylem",
-        "Khantos",
-        "Kinn",
-        "Librid",
-        "Speedy",
-        "DoubleAiM",
-        "Klowny",
-        "Plox",
-        "Ryuzaki",
-        "Stefan",
-        "TasteLess",
-        "Wondro",
-        "Auspex",
-        "Crystal",
-        "Direnc",
-        "Dumbledoge",
-        "Elwind",
-        "Hioss",
-        "Korpse",
-        "LongB",
-        "Madness",
-        "Maximillion",
-        "Naru",
-        "Only35",
-        "Roulette",
-        "Stomaged",
-        "WaenA",
-        "Wasteee",
-        "Zeitnot",
-        "Safir",
-        "AmazingJ",
-        "Empt2y",
-        "Gear",
-        "GodKwai",
-        "Holo",
-        "Kabe",
-        "MoonBlack",
-        "SkuLL",
-        "Wh1t3zZ",
-        "TF Blade",
-        "Inori",
-        "A M U S E 4",
-        "Akasi",
-        "alleycat",
-        "Arfoad",
-        "Arumik",
-        "Astarore",
-        "Day1",
-        "Eugeo",
-        "eyes",
-        "Haretti",
-        "Keymaker",
-        "Kyon",
-        "Masyo",
-        "Meron",
-        "Nagi",
-        "Natsume",
-        "Pink",
-        "Pink Bean",
-        "Pooh",
-        "Rainbrain",
-        "Reiya",
-        "Revol",
-        "Roki",
-        "ThintoN",
-        "Uinyan",
-        "Yuki",
-        "YutoriMoyasi",
-        "Zerost",
-        "KuMaMoTo",
-        "JF",
-        "KuKu",
-        "Tak",
-        "OzoraVeki",
-        "Exosen",
-        "Hamez",
-        "BeNw",
-        "EquivocaL",
-        "HaRleLuYaR",
-        "Raven",
-        "Shinsekai",
-        "Zappy",
-        "2188",
-        "Albis",
-        "Alex",
-        "Breeze",
-        "Bruce",
-        "Bush",
-        "CaiPi",
-        "DinTer",
-        "Do1u1u",
-        "FireFox",
-        "GreenTea",
-        "K",
-        "Lilballz",
-        "MiSTakE",
-        "Morning",
-        "Mountain",
-        "RD",
-        "Stanley",
-        "Wei",
-        "WeiLun",
-        "Westdoor",
-        "Winds",
-        "wuji",
-        "Ysera",
-        "007x",
-        "Aun",
-        "Chainarin",
-        "Coldenfeet",
-        "G4",
-        "InTreso",
-        "KazeTAR",
-        "Lloyd",
-        "Rich",
-        "SunSunSun",
-        "B\u00e1\u00ba\u00afp B\u00c3\u00a0o",
-        "Celebrity",
-        "Dia1",
-        "Genza",
-        "Haise",
-        "HanYiAn",
-        "Hinn",
-        "Jisoo",
-        "Nevan",
-        "NIXWATER",
-        "Noway",
-        "Petland",
-        "Secr3t",
-        "Shaoran",
-        "Slay",
-        "SunSieu",
-        "Taurus",
-        "Venus",
-        "Victory",
-        "Warzone",
-        "YiJin",
-        "yT",
-        "Zeros",
-        "Zin",
-        "Anderu",
-        "Babip",
-        "Denian",
-        "EGym",
-        "Getback",
-        "Juves",
-        "Mac",
-        "Papryze",
-        "Raid",
-        "rare7",
-        "Rosey",
-        "Rusty",
-        "Taka",
-        "Tally",
-        "wrekt",
-        "Blinky",
-        "Azra",
-        "Endz",
-        "HeaQ",
-        "Klaabu",
-        "Lakinther",
-        "Nukes",
-        "puszu",
-        "Voidle",
-        "Blasting",
-        "Shiganari",
-        "Angush",
-        "extinkt",
-        "Hadow",
-        "Jaunatis",
-        "Optimas",
-        "Pulsas",
-        "Warden",
-        "zty",
-        "LeX",
-        "Alex Ich",
-        "Ankote",
-        "Ansva",
-        "Aoi Haru",
-        "Archie2B",
-        "Brom",
-        "Darien",
-        "Darker",
-        "Diamondprox",
-        "DiscotEkka",
-        "DREAMPYLLA",
-        "Drobovik123",
-        "FlashInTheNight",
-        "Genja",
-        "Lekcycc",
-        "Merao",
-        "Mercenary",
-        "NikSar",
-        "Phlaty",
-        "SadJesteRRR",
-        "Seigimitsu",
-        "Sidnik",
-        "Skash",
-        "Symphony",
-        "TR1GGERED",
-        "Trianna",
-        "VincentVega",
-        "VioletFairy",
-        "aMiracle",
-        "Anechek",
-        "BULBAZABP",
-        "Kirrrra",
-        "Paranoia",
-        "PvPStejos",
-        "Unho1y",
-        "Warhunter",
-        "WildHeart",
-        "huhi",
-        "pr0lly",
-        "Freeze",
-        "Abbedagge",
-        "Closer",
-        "FBI",
-        "Ryoma",
-        "poome",
-        "Tenacity",
-        "Damonte",
-        "Goldenglue",
-        "Luger",
-        "Kenvi",
-        "Cozy",
-        "Busio",
-        "FallenBandit",
-        "Goo",
-        "Instinct",
-        "Young",
-        "Elramir",
-        "Lenom",
-        "Neramin",
-        "Oncan",
-        "Sparz",
-        "stillnumb",
-        "xTyLk",
-        "Psclly",
-        "BroCColi",
-        "Hoon",
-        "Andariel",
-        "Brolia",
-        "Husky Rider",
-        "Pilter",
-        "Skewer",
-        "Umut",
-        "Dellal",
-        "komedyja",
-        "Rakyz",
-        "Lurox",
-        "Chres",
-        "Klaj",
-        "Lucker",
-        "Pyrka",
-        "Sinmivak",
-        "Hoglet",
-        "Honey",
-        "Ino",
-        "Nemoh",
-        "Reje",
-        "Skude",
-        "Eren",
-        "Noway4u",
-        "Atom",
-        "Kit",
-        "Tuomari",
-        "Bang",
-        "Cain",
-        "Dread",
-        "Fly",
-        "Kiin",
-        "Burry",
-        "BuLLDoG",
-        "Keine",
-        "Pancake",
-        "Kiefer",
-        "Zeicro",
-        "Grell",
-        "Kiy1n9",
-        "Zihan",
-        "3z",
-        "An",
-        "Apex",
-        "Boz",
-        "LOCKIE",
-        "Dom1nant",
-        "J0J0C",
-        "WouLou",
-        "kubYD",
-        "Choisix",
-        "Mayhem",
-        "WhiteKnight",
-        "Jeskla",
-        "MagiFelix",
-        "promisq",
-        "Zanzarah",
-        "Carlsen",
-        "Kadaver",
-        "Kronos",
-        "Mixsi",
-        "RotteBengi",
-        "Rylle",
-        "Diablo",
-        "Hy\u00c3\u00b4rai",
-        "Lingwi",
-        "Deidara",
-        "Tonerre",
-        "Seaz",
-        "Karim kt",
-        "SLT",
-        "Keduii",
-        "Navio",
-        "Reeker",
-        "Epic",
-        "Wako",
-        "Rockky",
-        "WarL0cK",
-        "Spot",
-        "Advienne",
-        "Markoon",
-        "De\u00c3\u00a1dly",
-        "Hatrixx",
-        "Orome",
-        "Swiffer",
-        "Random",
-        "dibu",
-        "Kehvo",
-        "Seffe",
-        "mumus100",
-        "Fanatiik",
-        "Winter",
-        "APA",
-        "PCL",
-        "Dragonminkim",
-        "Quas",
-        "K2",
-        "Arashi",
-        "Eren",
-        "Azhi",
-        "Enso",
-        "Minji",
-        "Benny",
-        "Doggo",
-        "HuSha",
-        "Husky",
-        "Kino",
-        "Liang",
-        "Maoan",
-        "PK",
-        "Juuzou",
-        "Robin",
-        "I am Kees",
-        "Tide",
-        "Aiming",
-        "Kim",
-        "Biubiu",
-        "M1anhua",
-        "Mark",
-        "Meteor",
-        "Jay",
-        "Able",
-        "Kine",
-        "l3est16",
-        "DRIFTER",
-        "Frae",
-        "Chieftain",
-        "Delight",
-        "Edgar",
-        "Hena",
-        "Hoya",
-        "Bini",
-        "JeongHoon",
-        "JinO",
-        "TheKat",
-        "Akabuff",
-        "Broooock",
-        "Gariaru",
-        "RayFarky",
-        "Yuhi",
-        "Steve Murphy",
-        "Aomine",
-        "Bigkoro",
-        "Draktharr",
-        "Elio",
-        "Glory",
-        "Kuroko",
-        "TH",
-        "Archie",
-        "Artemis",
-        "EGO",
-        "LL",
-        "Ronop",
-        "Xuhao",
-        "Yado",
-        "Benji",
-        "rjs",
-        "Griffin",
-        "Hooks",
-        "Keel",
-        "Moon",
-        "Katsurii",
-        "Thien",
-        "BullyMaguire",
-        "Moo",
-        "SimSin",
-        "Valhalla",
-        "Romuka",
-        "Stepan",
-        "Brizz",
-        "BoffeN",
-        "Akeno",
-        "Calm",
-        "Cacon",
-        "Omni",
-        "Cuden",
-        "Dragku",
-        "Swathe",
-        "Vulcan",
-        "Blaber",
-        "IWillDominate",
-        "Sneaky",
-        "Zven",
-        "mithy",
-        "Perkz",
-        "Fudge",
-        "Copy",
-        "ZionSpartan",
-        "Isles",
-        "K1ng",
-        "Shernfire",
-        "CptShrimps",
-        "breezyyy",
-        "Exyu",
-        "Speedo",
-        "Wixxi",
-        "Papa Chau",
-        "HotshotGG",
-        "Smoothie",
-        "WildTurtle",
-        "Pobelter",
-        "Broxah",
-        "Finn",
-        "Lesmart",
-        "Namex",
-        "Miniduke",
-        "Rubi0o",
-        "Lebron",
-        "whiteinn",
-        "Alps",
-        "Nap",
-        "Cassin",
-        "Alchemy",
-        "Kaito",
-        "Yunika",
-        "Griffon",
-        "Jestkui Max",
-        "Likkrit",
-        "NoNHoly",
-        "Kinzu",
-        "MightyDragon",
-        "LukasNegro",
-        "Crocomux",
-        "SozPurefect",
-        "Afm",
-        "Chasy",
-        "Cow",
-        "Jool",
-        "Junmin",
-        "Ares",
-        "BeryL",
-        "Canyon",
-        "Ghost",
-        "Khan",
-        "BAO",
-        "Becca",
-        "cvMax",
-        "Destroy",
-        "Expession",
-        "Clear",
-        "Conus",
-        "Dracxar",
-        "Eign",
-        "IlllIma",
-        "Jun",
-        "Coldraa",
-        "fabFabulous",
-        "Kofte",
-        "Pbd",
-        "Typhoon",
-        "PFI",
-        "Rifty",
-        "Aria",
-        "Gaeng",
-        "Ceros",
-        "Evi",
-        "Fujimoto",
-        "Kazu",
-        "Yutapon",
-        "Kiao",
-        "Akaadian",
-        "aphromoo",
-        "Dardoch",
-        "FakeGod",
-        "Neo",
-        "Soligo",
-        "JayJ",
-        "Spawn",
-        "Lourlo",
-        "Yusui",
-        "DNA",
-        "Meech",
-        "Dragoon",
-        "King",
-        "Claire",
-        "Curtis",
-        "Gunkrab",
-        "Only",
-        "Praelus",
-        "Rippii",
-        "Cupcake",
-        "Shok",
-        "Piter Pokir",
-        "Helper",
-        "Dimonko",
-        "Argonavt",
-        "ItsCortez",
-        "Laynel",
-        "Maynter",
-        "PaSa",
-        "Hoiz",
-        "Flaxxish",
-        "Silas",
-        "D4nKa",
-        "Kxng",
-        "NoXiAK",
-        "Rocklho",
-        "Drop",
-        "Hawk",
-        "pbO",
-        "Piloto",
-        "Sephis",
-        "St1ng",
-        "Truklax",
-        "Ari",
-        "NOsFerus",
-        "Reversed",
-        "Small",
-        "Charca",
-        "Dred",
-        "JunJia",
-        "Gori",
-        "Clearlove",
-        "Flandre",
-        "Hope",
-        "Jiejie",
-        "Meiko",
-        "Nasser",
-        "Saitam",
-        "Lamabear",
-        "Pandar",
-        "StormFury",
-        "Ventair",
-        "Beyond",
-        "Xioh",
-        "Gaaloul",
-        "Bvoy",
-        "Acce",
-        "Leza",
-        "IgNar",
-        "Impact",
-        "Turtle",
-        "Mash",
-        "Danny",
-        "Kelsey Moser",
-        "Svenskeren",
-        "Jiizuke",
-        "Tony Top",
-        "Jojopyun",
-        "Contractz",
-        "Matt",
-        "TeamLuke",
-        "Mystiques",
-        "Shoryu",
-        "Tomio",
-        "Aspect",
-        "Srtty",
-        "Patrik",
-        "YoungBuck",
-        "Dan",
-        "Tore",
-        "Kryze",
-        "Unlimited",
-        "Athyz",
-        "Wylenz",
-        "BeBopBulli",
-        "Dylan Falco",
-        "Nuclearint",
-        "BrokenBlade",
-        "Gilius",
-        "LIMIT",
-        "Neon",
-        "Kynetic",
-        "nRated",
-        "Obsess",
-        "Tolerant",
-        "Yoppa",
-        "Sya",
-        "Anyyy",
-        "Damage",
-        "ST3PZ",
-        "Edward",
-        "Absolut",
-        "Goku",
-        "Ranger",
-        "RedBert",
-        "Tutsz",
-        "Pades",
-        "Asta",
-        "Blacky",
-        "Bounty",
-        "Cacah",
-        "MMD",
-        "NL",
-        "Fl4mer",
-        "Reptile",
-        "Lukezy",
-        "Dreams",
-        "Josedeodo",
-        "Johnsun",
-        "Licorice",
-        "Palafox",
-        "Voyboy",
-        "Sharkz",
-        "Diamond",
-        "Kumo",
-        "Nxi",
-        "Tomo",
-        "Phantiks",
-        "Triple",
-        "Bwipo",
-        "Nisqy",
-        "Upset",
-        "Veteran",
-        "styllEE",
-        "YamatoCannon",
-        "Hylissang",
-        "Selfmade",
-        "Bean",
-        "FEBIVEN",
-        "Pride",
-        "Chibs",
-        "Maxi",
-        "rhuckz",
-        "delord",
-        "Creon",
-        "Feedarias",
-        "Own3r",
-        "Naxxy",
-        "apaMEN",
-        "Corporal",
-        "Dasher",
-        "Doinb",
-        "Beichuan",
-        "Bo",
-        "Crisp",
-        "Lwx",
-        "Mingjing",
-        "Tian",
-        "REFRA1N",
-        "Steak",
-        "Aslan",
-        "Beenie",
-        "Bet\u00c3\u00a3o",
-        "Goot",
-        "ProDelta",
-        "Tyrin",
-        "Bugi",
-        "TopLop",
-        "Erry",
-        "Baula",
-        "Jauny",
-        "Emp",
-        "baybay",
-        "Koldo",
-        "Oscarinin",
-        "Supa",
-        "Fresskowy",
-        "Efias",
-        "GrabbZ",
-        "Caps",
-        "P1noy",
-        "Wunder",
-        "Rekkles",
-        "ocelote",
-        "Jankos",
-        "Mikyx",
-        "Bie",
-        "EasyLove",
-        "Kati",
-        "Kiaya",
-        "Levi",
-        "Style",
-        "Tinikun",
-        "Ploxy",
-        "Chapapi",
-        "Blake",
-        "Jeyrus",
-        "Pr1me",
-        "ShawiKatami",
-        "Tumay",
-        "Bolulu",
-        "Appen",
-        "Luana",
-        "Mojito",
-        "Padden",
-        "Ruvelius",
-        "Zergsting",
-        "Shiny",
-        "Jejky",
-        "Dragane",
-        "Kakan",
-        "Monk",
-        "Zvene",
-        "loulex",
-        "Prime",
-        "toucouille",
-        "Irrelevant",
-        "Ellam",
-        "Octomalus",
-        "Chreak",
-        "Dreamsu",
-        "Pak",
-        "Kirei",
-        "Innaxe",
-        "beansu",
-        "Melon",
-        "Veignorem",
-        "Jaxplank",
-        "Deluxe",
-        "Dice",
-        "Envyy",
-        "Khael",
-        "Ambition",
-        "Bdd",
-        "Clid",
-        "CuVee",
-        "Flawless",
-        "Ggoong",
-        "Karis",
-        "Nemesis",
-        "Yashiro",
-        "Th3Ant\u00c3\u00b8nio",
-        "Fix",
-        "Follow",
-        "Nate",
-        "Rod",
-        "Plugo",
-        "Quicktimer",
-        "Emtest",
-        "ZombieKungen",
-        "Newbie",
-        "Ablazeolive",
-        "Ic0nic",
-        "Niles",
-        "Stixxay",
-        "Swip3rR",
-        "Chime",
-        "Yunbee",
-        "Prismal",
-        "Solo",
-        "Pit",
-        "Consequent",
-        "Bushy",
-        "Tibor",
-        "Kanna",
-        "Cospect",
-        "Saju",
-        "Aziyah",
-        "Azus",
-        "Kyose",
-        "Nobody",
-        "Safa",
-        "Tifa",
-        "Kyanna",
-        "Baut",
-        "CaD",
-        "Cheoni",
-        "Arthur",
-        "Chovy",
-        "Deft",
-        "DuDu",
-        "Heart",
-        "Key",
-        "MnM",
-        "Wing",
-        "Chawy",
-        "B1ven",
-        "Kongyue",
-        "Patience",
-        "Rock",
-        "MeLikePanda",
-        "Meager",
-        "Aoshi",
-        "Boal",
-        "Cabu",
-        "Envy",
-        "Jockster",
-        "LynX",
-        "Maestro",
-        "micaO",
-        "Hanor",
-        "Mills",
-        "Midkid",
-        "Aku",
-        "Insanity",
-        "Revenge",
-        "Xerxe",
-        "Destiny",
-        "Raes",
-        "AnDa",
-        "Potluck",
-        "V1per",
-        "Joey",
-        "Keith",
-        "Pretty",
-        "QaspieL",
-        "Blaze",
-        "Shera",
-        "Ackerman",
-        "WhiteLotus",
-        "Cody",
-        "Soren",
-        "Arce",
-        "Renyu",
-        "SolidSnake",
-        "Buggax",
-        "Nemky",
-        "Pun1sher",
-        "fly",
-        "Baolan",
-        "Ning",
-        "Puff",
-        "Southwind",
-        "West",
-        "Wink",
-        "XUN",
-        "Snow",
-        "Phoenix",
-        "Marrow Ooze",
-        "Agentas",
-        "ChosenOne",
-        "Saulius",
-        "Xavieles",
-        "Archer",
-        "Jelly",
-        "Zerito",
-        "Shu Hari",
-        "Tierwulf",
-        "Warangelus",
-        "Seiya",
-        "Yeti",
-        "Nolan",
-        "Seelame",
-        "Vince",
-        "Backlund",
-        "Viking",
-        "Rogue",
-        "BeBe",
-        "Breaker",
-        "Hana",
-        "Lilv",
-        "M1ssion",
-        "Nestea",
-        "Rest",
-        "Woody",
-        "Kanavi",
-        "LvMao",
-        "xiye",
-        "Yagao",
-        "Zoom",
-        "Chashao",
-        "705",
-        "Matislaw",
-        "Puki style",
-        "Bruness",
-        "Kackos",
-        "Raxxo",
-        "Dipzey",
-        "KOOLBERG",
-        "Zhandia",
-        "Outlandisch",
-        "Snurmi",
-        "Tatuy",
-        "Tiara",
-        "Acorn",
-        "Doran",
-        "Dove",
-        "GIDEON",
-        "HyBriD",
-        "5Kid",
-        "Blank",
-        "Bonnie",
-        "Castle",
-        "Harp",
-        "Bardo",
-        "Mikkel",
-        "Robba",
-        "Slyv3r",
-        "Hiro",
-        "Disave",
-        "Evrot",
-        "OTTO",
-        "Baltica",
-        "QQmore",
-        "Cotopaco",
-        "Targamas",
-        "Adam",
-        "Saken",
-        "xMatty",
-        "Cinkrof",
-        "Hyoga",
-        "Klaus",
-        "Minerva",
-        "Laba",
-        "svns",
-        "Shiro",
-        "SOUPerior",
-        "Eika",
-        "Exakick",
-        "Manaty",
-        "sOAZ",
-        "YellOwStaR",
-        "Dan Dan",
-        "Nipphu",
-        "Prodigy",
-        "ottovaG",
-        "Eimy",
-        "Garvey",
-        "Yuuki",
-        "Uniboy",
-        "Xuan",
-        "Ale",
-        "icon",
-        "Iwandy",
-        "Light",
-        "Martin",
-        "Ceos",
-        "DudsTheBoy",
-        "dyNquedo",
-        "Tay",
-        "Hidan",
-        "Mewkyo",
-        "Vahvel",
-        "emelg",
-        "Guts",
-        "Incursio",
-        "Sybol",
-        "Yuzuki",
-        "Assqssin",
-        "Ben4",
-        "Catjug",
-        "Viod",
-        "Dinoricar",
-        "Kaze",
-        "Myw",
-        "Rikka",
-        "Kanji",
-        "Dawn",
-        "DoeDoii",
-        "Kaigu",
-        "Tgee",
-        "JeppeHou",
-        "Gevous",
-        "Jkalam",
-        "Looca",
-        "Defles",
-        "Jester",
-        "Krakmo",
-        "Le Roi Bisou",
-        "Narkuss",
-        "Rx Dye",
-        "Bisbo",
-        "Blazes",
-        "KemKen",
-        "Shine",
-        "Sorn",
-        "Tear",
-        "Kaas",
-        "Carzzy",
-        "Humanoid",
-        "Kaiser",
-        "Mac",
-        "Elyoya",
-        "Armut",
-        "Knighter",
-        "Alexx",
-        "Aesenar",
-        "DuaLL",
-        "Falco",
-        "Flakked",
-        "Sacre",
-        "Paolocannone",
-        "SivHD",
-        "Atlen",
-        "Gemini",
-        "JimieN",
-        "Koala",
-        "Likai",
-        "D3RK1NG155",
-        "Cboi",
-        "StenBosse",
-        "Darkchri99",
-        "Sebekx",
-        "Dinka",
-        "EvanRL",
-        "Julien",
-        "Kind",
-        "OddOrange",
-        "Wolfe",
-        "Chippys",
-        "Grisen",
-        "Kroghsen",
-        "Lunddorf",
-        "Munckizz",
-        "Raxon",
-        "Toaster",
-        "Godbro",
-        "Phaxi",
-        "bAZZILISKS",
-        "Arnax",
-        "Divider",
-        "Domas",
-        "RBM",
-        "HiRit",
-        "Denyk",
-        "Vetheo",
-        "Amazing",
-        "Crazycaps",
-        "Candyfloss",
-        "Kobbe",
-        "Razork",
-        "Enatron",
-        "Vander",
-        "Diamante",
-        "Sertuss",
-        "Agresivoo",
-        "Jactroll",
-        "Shlatan",
-        "Woolite",
-        "Air",
-        "Raxhy",
-        "Barcode",
-        "Fomko",
-        "Gate",
-        "Gralou",
-        "Zaphyr",
-        "xKenzuke",
-        "kaSing",
-        "Maxlore",
-        "Deilor",
-        "Bartiono",
-        "Raizins",
-        "Potter",
-        "Japone",
-        "Kituruken",
-        "Giyuu",
-        "Blessing",
-        "Bull",
-        "DnDn",
-        "FIESTA",
-        "HongA",
-        "euna",
-        "Artum",
-        "Yazmat",
-        "Dainank",
-        "Stanniez",
-        "Tulz",
-        "Kindless",
-        "zig",
-        "5fire",
-        "Big",
-        "Stunt",
-        "Value",
-        "Bay",
-        "Catch",
-        "Deokdam",
-        "Juhan",
-        "Kellin",
-        "Beyond",
-        "Kerberos",
-        "Chrisberg",
-        "Erixen",
-        "Touch",
-        "King Loko",
-        "MyKey",
-        "Beats",
-        "Chungy",
-        "Jayke",
-        "Spookz",
-        "AKi",
-        "cold",
-        "Eric",
-        "kRYST4L",
-        "New",
-        "Penguin",
-        "Xiyang",
-        "Y1han",
-        "Adept",
-        "Mirbs",
-        "ATRemains",
-        "Kreox",
-        "Smurf",
-        "XoNix",
-        "xPeke",
-        "Steve",
-        "Demon",
-        "Lotus",
-        "Optimus",
-        "Api",
-        "Aladoric",
-        "Halo",
-        "Kevy",
-        "Scarface",
-        "Phantomles",
-        "ItzRenifer",
-        "Kaiwing",
-        "Kartis",
-        "Unified",
-        "Hanabi",
-        "Maple",
-        "TL",
-        "Anthrax",
-        "Albetrayber",
-        "Goose",
-        "Joekie",
-        "Kruimel",
-        "BioPanther",
-        "Chazz",
-        "Pabu",
-        "Praedyth",
-        "UDYSOF",
-        "Decoy",
-        "Seb",
-        "Ren",
-        "Garo",
-        "Aegis",
-        "Avenger",
-        "Guigo",
-        "Jojo",
-        "TitaN",
-        "Hai",
-        "Ceo",
-        "Enga",
-        "Khynm",
-        "Nobody",
-        "Shadow",
-        "Aloned",
-        "Straight",
-        "MarioMe",
-        "Oddie",
-        "Careta",
-        "Aix",
-        "Cube",
-        "Hang",
-        "iBoy",
-        "Leyan",
-        "Maestro",
-        "FoFo",
-        "hachamecha",
-        "Kinatu",
-        "Rando",
-        "Recap",
-        "Nyu",
-        "bydeki",
-        "Hauz",
-        "Kusuo",
-        "Mexi",
-        "Bravado",
-        "Orre",
-        "Kektz",
-        "Jenxas",
-        "Gimliques",
-        "Keysie",
-        "Maxim",
-        "Miracle",
-        "Pooh",
-        "Balkane",
-        "Mytant",
-        "Hans sama",
-        "fredy122",
-        "Blumigan",
-        "Larssen",
-        "Inspired",
-        "Trymbi",
-        "Odoamne",
-        "Forge",
-        "Haro",
-        "HuaTian",
-        "Jiangqiao",
-        "KongMing",
-        "QiuQiu",
-        "Xuzhu",
-        "Betty",
-        "Lumerion",
-        "S1xu",
-        "Cryin",
-        "GALA",
-        "Ming",
-        "Wei",
-        "Xiaobai",
-        "Xiaohu",
-        "XLB",
-        "Tabe",
-        "Poppy",
-        "Naruterador",
-        "Pepiinero",
-        "Travanques",
-        "Cruiser",
-        "gyuvee",
-        "Howling",
-        "Kabbie",
-        "Croco",
-        "Effort",
-        "FATE",
-        "Joker",
-        "Violet",
-        "Archeny",
-        "Garp",
-        "Ordno",
-        "PiOk",
-        "Blue",
-        "Jezu",
-        "Jenax",
-        "Jesiz",
-        "TynX",
-        "Treatz",
-        "Canee",
-        "Lilipp",
-        "ZaZee",
-        "Alois",
-        "Raqo",
-        "UNF0RGIVEN",
-        "Arrietty",
-        "Bean J",
-        "Froggy",
-        "Hasmed",
-        "Taki",
-        "Shmebulock",
-        "Luskka",
-        "Nigelf",
-        "Juzinho",
-        "Nappon",
-        "Night",
-        "Zhergoth",
-        "Crash",
-        "Gango",
-        "Enty",
-        "Paz",
-        "Ramune",
-        "Tulcas",
-        "Hudie",
-        "Scarlet",
-        "Djoko",
-        "Eyliph",
-        "Steeelback",
-        "Asza",
-        "Hiiva",
-        "kev1n",
-        "Act",
-        "Aermudilos",
-        "Azure",
-        "Chalice7",
-        "Meng",
-        "Mish",
-        "Pain",
-        "Sly",
-        "Toyz",
-        "ADD",
-        "Fury",
-        "Angel",
-        "Bin",
-        "huanfeng",
-        "Jinjiao",
-        "ON",
-        "View",
-        "SofM",
-        "Rate",
-        "Kireas",
-        "Absolute",
-        "Kaori",
-        "Ksaez",
-        "Ragner",
-        "Secaf Reis",
-        "Thaldrin",
-        "Spooky",
-        "twohoyrz",
-        "Vzz",
-        "Blizer300",
-        "Canna",
-        "Clozer",
-        "Cuzz",
-        "Ellim",
-        "Faker",
-        "GBM",
-        "Gumayusi",
-        "Keria",
-        "LS",
-        "Tyler1",
-        "Bengi",
-        "Asper",
-        "Berserker",
-        "Fisher",
-        "Hoit",
-        "Haze",
-        "Huni",
-        "Spica",
-        "TheOddOne",
-        "Doublelift",
-        "Reginald",
-        "PowerOfEvil",
-        "Bjergsen",
-        "SwordArT",
-        "Lost",
-        "Peter Zhang",
-        "Cody Sun",
-        "Fizzi",
-        "Hauntzer",
-        "Hyper",
-        "Swordd",
-        "Yursan",
-        "Eclipse",
-        "Gorica",
-        "Crowno",
-        "zoiren",
-        "Haydal",
-        "Jay",
-        "Anduril",
-        "Berkan",
-        "Crumple",
-        "Fleck",
-        "Rare",
-        "Rhioni",
-        "150IQ",
-        "KTSR",
-        "Rhilech",
-        "SunShine",
-        "Jaylink",
-        "Shemek",
-        "Xico",
-        "Bluerzor",
-        "Erdote",
-        "iBo",
-        "NooB",
-        "Baba",
-        "Boomin",
-        "Dommmy",
-        "Lunar",
-        "Nightmares",
-        "Poeza",
-        "Chap",
-        "Katare",
-        "Sharkk",
-        "Tioo",
-        "Wakz",
-        "Divkid",
-        "Meliodas",
-        "Naul",
-        "Pake",
-        "Palette",
-        "Stark",
-        "Yoshino",
-        "Nite",
-        "Phones",
-        "Rabble",
-        "Visdom",
-        "Hjarnan",
-        "Hybrid",
-        "Follen",
-        "CoreJJ",
-        "Dodo",
-        "Jatt",
-        "Tactical",
-        "Alphari",
-        "Jensen",
-        "Kold",
-        "Santorin",
-        "Midbeast",
-        "Rakin",
-        "Armao",
-        "Jenkins",
-        "Yama",
-        "Yeon",
-        "Eyla",
-        "Haeri",
-        "Moopz",
-        "Boukada",
-        "Tiger",
-        "Acidy",
-        "Cdric",
-        "Nerroh",
-        "Benaset",
-        "Darlik",
-        "LaFleur",
-        "Paris",
-        "Chelly",
-        "Meight",
-        "Gotrek",
-        "DahVys",
-        "JaVaaa",
-        "Send0o",
-        "Siler",
-        "EdinPriqtel",
-        "Artifact",
-        "CBL",
-        "Coated",
-        "DNK",
-        "Eddie",
-        "KingJ",
-        "Slayder",
-        "Zica",
-        "Furuy",
-        "Noltey",
-        "Prosfair",
-        "WeiZor",
-        "AMOUR FAYA",
-        "Duke",
-        "Mephisto",
-        "Skeanz",
-        "Szygenda",
-        "Comp",
-        "Labrov",
-        "Milica",
-        "Crownshot",
-        "beishang",
-        "Breathe",
-        "Conan",
-        "Gentle",
-        "Jiumeng",
-        "Missing",
-        "Shanks",
-        "Sun",
-        "Teacherma",
-        "Migab",
-        "Froststrike",
-        "Chelizi",
-        "Teeen",
-        "Twila",
-        "Xiaopeng",
-        "369",
-        "JackeyLove",
-        "knight",
-        "yuyanjia",
-        "Karsa",
-        "WarHorse",
-        "Nille",
-        "GuYueXin",
-        "ZhuangZhou",
-        "Dreedy",
-        "Hadess",
-        "Baca",
-        "Plasma",
-        "Rafitta",
-        "H4cker",
-        "ShiauC",
-        "Cepted",
-        "Aquasonic",
-        "Genthix",
-        "Vardags",
-        "Frappii",
-        "Sheepy",
-        "AHaHaCiK",
-        "BOSS",
-        "Lodik",
-        "Nomanz",
-        "SaNTaS",
-        "Dreamer Ace",
-        "Decay",
-        "Agurin",
-        "LagsAlot",
-        "Kadir",
-        "Sleeping",
-        "Hollow",
-        "HW4NG",
-        "Ace",
-        "Awaker",
-        "cogcog",
-        "Raina",
-        "CaoMei",
-        "Sericus",
-        "6ax",
-        "CyraXx",
-        "Charger",
-        "Rein",
-        "PekiDo",
-        "Majd",
-        "Korol",
-        "Wuxx",
-        "Avoidless",
-        "Aliez",
-        "Aodi",
-        "LANGX",
-        "Mole",
-        "ping",
-        "ppgod",
-        "Weiwei",
-        "y4",
-        "Diplex",
-        "HustlinbeasT",
-        "Memento",
-        "SMILEY",
-        "Raven",
-        "Nji",
-        "Attila",
-        "Ronaldo",
-        "Kamilius",
-        "Eckas",
-        "fNb",
-        "Krastymel",
-        "Matsukaze",
-        "Wos",
-        "Yampi",
-        "Lynkez",
-        "Bendix",
-        "AnOnPsyCkO",
-        "Bananitoo",
-        "Madly",
-        "AlternativeX",
-        "Aziado",
-        "LeChase",
-        "Noma",
-        "Slayer",
-        "Xaky",
-        "Arrow",
-        "Panda",
-        "Qwacker",
-        "Daption",
-        "Winston",
-        "Dhokla",
-        "inSec",
-        "JackPoT",
-        "Unforgiven",
-        "PDD",
-        "Impaler",
-        "Findus",
-        "Nikola",
-        "Delitto",
-        "Gagai",
-        "Kyouma",
-        "Zelt",
-        "Sky0",
-        "Eden Fox",
-        "Ziv",
-        "DanDy",
-        "Lucky",
-        "Adiss",
-        "Hiro",
-        "Sacrifice",
-        "Sajator",
-        "Dragflick",
-        "Praevius",
-        "KonDziSan",
-        "Enjawve",
-        "Satorius",
-        "Pridestalkr",
-        "LIDER",
-        "Gadget",
-        "brTT",
-        "Cariok",
-        "Jukes",
-        "Robo",
-        "TinOwns",
-        "Dioud",
-        "WildPanda",
-        "Farfetch",
-        "Ferret",
-        "HolyPhoenix",
-        "Robogod",
-        "Serin",
-        "StarScreen",
-    ]
+
+@cache
+def get_default_player_nick_names() -> tuple[str, ...]:
+    """
+    Loads the default nicknames from the resource file the first time they are
+    needed. The file has one nickname per line.
+    """
+    with get_default_nick_names_file().open("r", encoding="utf-8") as fp:
+        return tuple(dict.fromkeys(line.strip() for line in fp if line.strip()))
@@ -18,6 +18,7 @@ import random
 import uuid
 from typing import Optional
 
+from ....utils.seed import generate_uuid, get_rng
 from ..champion import Champion, ChampionDifficulty, ChampionType
 from ..mobaplayer import LaneMultipliers, Lanes
 from .default_champion_defs import get_default_champion_names
@@ -29,25 +30,34 @@ class ChampionGeneratorError(Exception):
 
 
 class ChampionGenerator(GeneratorInterface):
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
         self.random = False
         self.random_names: Optional[list[str]] = None
+        self.random_names_round = 0
+        self.rng = get_rng(rng)
 
     def generate_champion_id(self) -> uuid.UUID:
-        return uuid.uuid4()
+        return generate_uuid(self.rng)
 
     def _get_random_champion_name(self) -> str:
-        if self.random_names is None:
+        """
+        Draws a default champion name that was not used yet. Once every name was
+        used, names are drawn again with the round number added to the end.
+        """
+        if not self.random_names:
             self.random_names = get_default_champion_names()
-        name = random.choice(self.random_names)
+            self.random_names_round += 1
+        name = self.rng.choice(self.random_names)
         self.random_names.remove(name)
+        if self.random_names_round > 1:
+            return f"{name} {self.random_names_round}"
         return name
 
     def generate_champion_name(self, champion_def: Optional[dict]) -> str:
         return self._get_random_champion_name() if self.random else champion_def["name"]
 
     def generate_champion_scaling(self) -> float:
-        return round(random.random(), 2)
+        return round(self.rng.random(), 2)
 
     def generate_champion_lanes(self, champion_def: Optional[dict]) -> LaneMultipliers:
         lanes = {}
@@ -56,14 +66,14 @@ class ChampionGenerator(GeneratorInterface):
                 if lane.name in champion_def["lanes"]:
                     lanes[lane] = 1.0
                 else:
-                    lanes[lane] = round(random.randrange(1, 75) / 100, 2)
+                    lanes[lane] = round(self.rng.randrange(1, 75) / 100, 2)
         else:
-            main_lane = random.choice(list(Lanes))
+            main_lane = self.rng.choice(list(Lanes))
             for lane in Lanes:
                 if lane == main_lane:
                     lanes[lane] = 1.0
                 else:
-                    lanes[lane] = round(random.randrange(1, 75) / 100, 2)
+                    lanes[lane] = round(self.rng.randrange(1, 75) / 100, 2)
 
         return LaneMultipliers.get_from_dict(lanes)
 
@@ -71,10 +81,10 @@ class ChampionGenerator(GeneratorInterface):
         """
         Generates the time when the scaling reaches its peak and the champion stops growing.
         """
-        return random.randrange(15, 30)
+        return self.rng.randrange(15, 30)
 
     def generate_champion_skill(self) -> int:
-        return random.randrange(1, 100)
+        return self.rng.randrange(1, 100)
 
     def generate_champion_difficulty(
         self, difficulty: Optional[dict] = None
@@ -85,7 +95,7 @@ class ChampionGenerator(GeneratorInterface):
             except KeyError:
                 pass
 
-        return random.choice(list(ChampionDifficulty))
+        return self.rng.choice(list(ChampionDifficulty))
 
     def generate_champion_type(
         self, ch_type: Optional[dict] = None, used_type: ChampionType = None
@@ -109,11 +119,11 @@ class ChampionGenerator(GeneratorInterface):
 
         ch_types = list(ChampionType)
         if used_type:
-            is_there_second_type = random.randint(0, 1)
+            is_there_second_type = self.rng.randint(0, 1)
             if is_there_second_type == 0:
                 return None
             ch_types.remove(used_type)
-        return random.choice(ch_types)
+        return self.rng.choice(ch_types)
 
     def generate(self, champion_def: Optional[dict] = None) -> Champion:
         if champion_def is None:
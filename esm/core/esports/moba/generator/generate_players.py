@@ -16,10 +16,13 @@
 
 import random
 import uuid
+from dataclasses import dataclass
 from datetime import date, timedelta
+from itertools import islice
 from typing import Optional
 
 from ....utils import get_nations
+from ....utils.seed import generate_uuid, get_rng
 from ..champion import Champion
 from ..mobaplayer import (
     ChampionMastery,
@@ -37,66 +40,80 @@ from ..mobaplayer import (
 from .default_player_nick_names import get_default_player_nick_names
 from .generator import GeneratorInterface
 
+# Probability of each ChampionMastery level in a generated champion pool
+MASTERY_WEIGHTS = [0.0, 0.5, 0.2, 0.01, 0.005, 0.0005, 0.0005]
 
-def generate_attribute_value(mu, sigma) -> int:
-    return abs(int(random.gauss(mu, sigma)))
+
+def generate_attribute_value(mu, sigma, rng: random.Random) -> int:
+    return abs(int(rng.gauss(mu, sigma)))
 
 
 class MobaPlayerGeneratorError(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class PlayerRegion:
+    first_names: tuple[str, ...]
+    surnames: tuple[str, ...]
+    mu: int
+    sigma: int
+
+
 class MobaPlayerAttributesGeneratorError(Exception):
     pass
 
 
 class MobaPlayerAttributesGenerator(GeneratorInterface):
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = get_rng(rng)
+
     def generate_offensive_attributes(
         self, mu: int = 40, sigma: int = 10
     ) -> OffensiveAttributes:
         return OffensiveAttributes(
-            generate_attribute_value(mu, sigma),
-            generate_attribute_value(mu, sigma),
-            generate_attribute_value(mu, sigma),
+            generate_attribute_value(mu, sigma, self.rng),
+            generate_attribute_value(mu, sigma, self.rng),
+            generate_attribute_value(mu, sigma, self.rng),
         )
 
     def generate_communication_attributes(
         self, mu: int = 40, sigma: int = 10
     ) -> CommunicationAttributes:
         return CommunicationAttributes(
-            generate_attribute_value(mu, sigma),
-            generate_attribute_value(mu, sigma),
-            generate_attribute_value(mu, sigma),
+            generate_attribute_value(mu, sigma, self.rng),
+            generate_attribute_value(mu, sigma, self.rng),
+            generate_attribute_value(mu, sigma, self.rng),
         )
 
     def generate_knowledge_attributes(
         self, mu: int = 40, sigma: int = 10
     ) -> KnowledgeAttributes:
         return KnowledgeAttributes(
-            generate_attribute_value(mu, sigma),
-            generate_attribute_value(mu, sigma),
-            generate_attribute_value(mu, sigma),
+            generate_attribute_value(mu, sigma, self.rng),
+            generate_attribute_value(mu, sigma, self.rng),
+            generate_attribute_value(mu, sigma, self.rng),
         )
 
     def generate_mechanics_attributes(
         self, mu: int = 40, sigma: int = 10
     ) -> MechanicsAttributes:
         return MechanicsAttributes(
-            generate_attribute_value(mu, sigma),
-            generate_attribute_value(mu, sigma),
-            generate_attribute_value(mu, sigma),
-            generate_attribute_value(mu, sigma),
-            generate_attribute_value(mu, sigma),
-            generate_attribute_value(mu, sigma),
+            generate_attribute_value(mu, sigma, self.rng),
+            generate_attribute_value(mu, sigma, self.rng),
+            generate_attribute_value(mu, sigma, self.rng),
+            generate_attribute_value(mu, sigma, self.rng),
+            generate_attribute_value(mu, sigma, self.rng),
+            generate_attribute_value(mu, sigma, self.rng),
         )
 
     def generate_utility_attributes(
         self, mu: int = 40, sigma: int = 10
     ) -> UtilityAttributes:
         return UtilityAttributes(
-            generate_attribute_value(mu, sigma),
-            generate_attribute_value(mu, sigma),
-            generate_attribute_value(mu, sigma),
+            generate_attribute_value(mu, sigma, self.rng),
+            generate_attribute_value(mu, sigma, self.rng),
+            generate_attribute_value(mu, sigma, self.rng),
         )
 
     def generate(self, mu: int, sigma: int, lane: Lanes) -> MobaPlayerAttributes:
@@ -123,6 +140,54 @@ class MobaPlayerAttributesGenerator(GeneratorInterface):
             offensive, communication, mechanics, knowledge, utility
         )
 
+    @staticmethod
+    def get_attribute_parameters(
+        mu: int, sigma: int, lane: Lanes
+    ) -> list[tuple[int, int]]:
+        """
+        Returns the mu and sigma of each attribute, in the order used by
+        generate_many, following the same rules as generate.
+        """
+        default = (40, 10)
+        player = (mu, sigma)
+        if lane in [Lanes.JNG, Lanes.SUP]:
+            groups = [default, player, default, player, default]
+        elif lane in [Lanes.MID, Lanes.TOP]:
+            groups = [player, player, player, player, default]
+        else:
+            groups = [player, player, player, default, default]
+
+        # offensive, communication, mechanics, knowledge and utility
+        sizes = [3, 3, 6, 3, 3]
+        return [group for group, size in zip(groups, sizes) for _ in range(size)]
+
+    def generate_many(
+        self, mus: list[int], sigmas: list[int], lanes: list[Lanes]
+    ) -> list[MobaPlayerAttributes]:
+        """
+        Generates the attributes of many players at once. All values are drawn in a
+        single pass, and then split into the attribute groups.
+        """
+        gauss = self.rng.gauss
+        parameters = {}
+        attributes = []
+        for mu, sigma, lane in zip(mus, sigmas, lanes):
+            key = (mu, sigma, lane)
+            if key not in parameters:
+                parameters[key] = self.get_attribute_parameters(mu, sigma, lane)
+            values = [abs(int(gauss(m, s))) for m, s in parameters[key]]
+            attributes.append(
+                MobaPlayerAttributes(
+                    OffensiveAttributes(*values[0:3]),
+                    CommunicationAttributes(*values[3:6]),
+                    MechanicsAttributes(*values[6:12]),
+                    KnowledgeAttributes(*values[12:15]),
+                    UtilityAttributes(*values[15:18]),
+                )
+            )
+
+        return attributes
+
 
 class MobaPlayerGenerator(GeneratorInterface):
     """
@@ -136,35 +201,56 @@ class MobaPlayerGenerator(GeneratorInterface):
         today: date = date.today(),
         min_age: int = 16,
         max_age: int = 25,
+        rng: Optional[random.Random] = None,
     ):
         self.nationalities = get_nations(names)
         self.nick_names = get_default_player_nick_names()
+        self.available_nick_names = list(self.nick_names)
+        self.used_nick_names: set[str] = set()
 
         if min_age > max_age:
             raise MobaPlayerGeneratorError(
                 "Minimum age cannot be higher than maximum age!"
             )
 
-        self.attribute_gen = MobaPlayerAttributesGenerator()
+        self.rng = get_rng(rng)
+        self.attribute_gen = MobaPlayerAttributesGenerator(self.rng)
         self.min_age = min_age
         self.max_age = max_age
         self.td = today  # used to calculate the date of birth. Varies according to the current season calendar
         self.champions_list = champions_list
         self.names = names
+        self.lane_champions: dict[Lanes, tuple[Champion, ...]] = {
+            lane: tuple(
+                champion
+                for champion in champions_list
+                if champion.lanes.get_best_attribute() == lane
+            )
+            for lane in Lanes
+        }
+        self.regions = {
+            region["region"]: PlayerRegion(
+                tuple(region["male"]),
+                tuple(region["surnames"]),
+                region["mu"],
+                region["sigma"],
+            )
+            for region in names
+        }
 
-    @staticmethod
-    def generate_id() -> uuid.UUID:
-        return uuid.uuid4()
+    def generate_id(self) -> uuid.UUID:
+        return generate_uuid(self.rng)
 
     def get_nationality(self) -> str:
         """
         Defines players nationalities
         """
-        return random.choice(self.nationalities)
+        return self.rng.choice(self.nationalities)
 
-    def generate_dob(self) -> date:
+    def get_birthday_range(self) -> tuple[date, int]:
         """
-        Generates the player's date of birth
+        Returns the earliest possible date of birth and the amount of days after it
+        where a player's date of birth can be.
         """
         year = timedelta(seconds=31556952)  # definition of a Gregorian calendar date
 
@@ -178,51 +264,88 @@ class MobaPlayerGenerator(GeneratorInterface):
         max_year = self.td - min_age  # max date for birthday
 
         days_interval = max_year - min_year
-        rand_date = random.randrange(
-            days_interval.days
+        return min_year, days_interval.days
+
+    def generate_dob(self) -> date:
+        """
+        Generates the player's date of birth
+        """
+        min_year, days = self.get_birthday_range()
+        rand_date = self.rng.randrange(
+            days
         )  # chooses a random date from the max days interval
         return min_year + timedelta(days=rand_date)  # assigns date of birth
 
-    def generate_champions(
-        self, lane: Lanes, amount: int = 0
-    ) -> list[MobaPlayerChampion]:
+    def choose_champions(self, lane: Lanes, amount: int = 0) -> list[Champion]:
         """
-        Generates champion skill level for each player.
-        Chooses a random amount of champions to generate.
+        Chooses the champions of a player's champion pool.
+        Chooses a random amount of champions if no amount is given.
         """
-        champs = []
-        for champion in self.champions_list:
-            best_lane = champion.lanes.get_best_attribute().value
-            if lane == best_lane:
-                champs.append(champion)
-
+        champs = self.lane_champions[lane]
         if not champs:
             return []
 
-        player_champions = []
         if amount == 0:
-            amount = random.randrange(1, len(champs))
-
-        for _ in range(amount):
-            ch = random.choice(champs)
-            champs.remove(ch)
-            champion_mastery = random.choices(
-                list(ChampionMastery), [0.0, 0.5, 0.2, 0.01, 0.005, 0.0005, 0.0005]
-            )[0]
-            moba_player_champ = MobaPlayerChampion(
-                ch.champion_id, champion_mastery, 0.0
-            )
-            player_champions.append(moba_player_champ)
+            amount = self.rng.randint(1, len(champs))
 
-        return player_champions
+        return self.rng.sample(champs, min(amount, len(champs)))
 
-    def get_nationality_skill(self, nationality: str) -> tuple[int, int]:
-        for nat in self.names:
-            if nat["region"] == nationality:
-                mu = nat["mu"]
-                sigma = nat["sigma"]
+    def choose_many_champions(
+        self, lanes: list[Lanes], amount: int = 0
+    ) -> list[list[Champion]]:
+        """
+        Chooses the champion pools of many players, one for each lane. The pool
+        sizes and champions of all players of a lane are drawn in a single pass. A
+        champion that is already in the player's pool is drawn again, so each pool
+        is still a random sample without repeated champions.
+        """
+        rng = self.rng
+        pools: list[list[Champion]] = [[] for _ in lanes]
+        lane_players: dict[Lanes, list[int]] = {}
+        for player, lane in enumerate(lanes):
+            lane_players.setdefault(lane, []).append(player)
+
+        for lane, players in lane_players.items():
+            champs = self.lane_champions[lane]
+            if not champs:
+                continue
+
+            total = len(champs)
+            if amount == 0:
+                amounts = rng.choices(range(1, total + 1), k=len(players))
+            else:
+                amounts = [min(amount, total)] * len(players)
+            indexes = iter(rng.choices(range(total), k=sum(amounts)))
+            for player, size in zip(players, amounts):
+                chosen = set()
+                for index in islice(indexes, size):
+                    while index in chosen:
+                        index = rng.randrange(total)
+                    chosen.add(index)
+                    pools[player].append(champs[index])
+
+        return pools
+
+    def generate_champions(
+        self, lane: Lanes, amount: int = 0
+    ) -> list[MobaPlayerChampion]:
+        """
+        Generates champion skill level for each player.
+        Chooses a random amount of champions to generate.
+        """
+        champions = self.choose_champions(lane, amount)
+        masteries = self.rng.choices(
+            list(ChampionMastery), MASTERY_WEIGHTS, k=len(champions)
+        )
+        return [
+            MobaPlayerChampion(champion.champion_id, mastery, 0.0)
+            for champion, mastery in zip(champions, masteries)
+        ]
 
-                return mu, sigma
+    def get_nationality_skill(self, nationality: str) -> tuple[int, int]:
+        region = self.regions.get(nationality)
+        if region is not None:
+            return region.mu, region.sigma
 
     def generate_attributes(
         self, mu: int, sigma: int, lane: Lanes
@@ -232,31 +355,82 @@ class MobaPlayerGenerator(GeneratorInterface):
         """
         return self.attribute_gen.generate(mu, sigma, lane)
 
+    def get_region(self, nationality: str) -> PlayerRegion:
+        try:
+            return self.regions[nationality]
+        except KeyError:
+            raise MobaPlayerGeneratorError("Invalid region!")
+
     def generate_first_name(self, nationality: str) -> str:
         """
         Generates the player's real name
         """
-        for name_dict in self.names:
-            if name_dict["region"] == nationality:
-                return random.choice(name_dict["male"])
-
-        raise MobaPlayerGeneratorError("Invalid region!")
+        return self.rng.choice(self.get_region(nationality).first_names)
 
     def generate_last_name(self, nationality: str) -> str:
         """
         Generates the player's real name
         """
-        for name_dict in self.names:
-            if name_dict["region"] == nationality:
-                return random.choice(name_dict["surnames"])
+        return self.rng.choice(self.get_region(nationality).surnames)
 
-        raise MobaPlayerGeneratorError("Invalid region!")
+    def get_unused_nick(self) -> Optional[str]:
+        """
+        Draws a nickname that was not used yet, or None if every nickname was used.
+        The drawn nickname is swapped with the last one and popped, so each draw
+        takes constant time.
+        """
+        nick_names = self.available_nick_names
+        while nick_names:
+            index = self.rng.randrange(len(nick_names))
+            nick_names[index], nick_names[-1] = nick_names[-1], nick_names[index]
+            nick_name = nick_names.pop()
+            if nick_name not in self.used_nick_names:
+                return nick_name
+
+        return None
 
     def generate_nick(self) -> str:
         """
-        Generates the player's nickname
+        Generates the player's nickname. Nicknames are unique for each generator,
+        not between generators: once every nickname was used, a number is added to
+        the end of a random one.
+        """
+        nick_name = self.get_unused_nick()
+        if nick_name is None:
+            base_nick = self.rng.choice(self.nick_names)
+            suffix = 2
+            nick_name = f"{base_nick}{suffix}"
+            while nick_name in self.used_nick_names:
+                suffix += 1
+                nick_name = f"{base_nick}{suffix}"
+
+        self.used_nick_names.add(nick_name)
+        return nick_name
+
+    def generate_many_nicks(self, n: int) -> list[str]:
+        """
+        Generates the nicknames of n players, following the same rules as
+        generate_nick. The unused nicknames are drawn in a single pass: their
+        positions are sampled at once and swapped with the end of the list from the
+        highest position down, so every pop still takes constant time.
         """
-        return random.choice(self.nick_names)
+        nick_names = self.available_nick_names
+        indexes = self.rng.sample(range(len(nick_names)), min(n, len(nick_names)))
+        drawn = {}
+        for index in sorted(indexes, reverse=True):
+            nick_names[index], nick_names[-1] = nick_names[-1], nick_names[index]
+            drawn[index] = nick_names.pop()
+
+        result = []
+        for nick_name in (drawn[index] for index in indexes):
+            if nick_name in self.used_nick_names:
+                nick_name = self.generate_nick()
+            else:
+                self.used_nick_names.add(nick_name)
+            result.append(nick_name)
+
+        result.extend(self.generate_nick() for _ in range(n - len(drawn)))
+        return result
 
     def generate_multipliers(self, main_lane: Lanes) -> LaneMultipliers:
         """
@@ -271,7 +445,7 @@ class MobaPlayerGenerator(GeneratorInterface):
         """
         mult = {}
         for lane in list(Lanes):
-            multiplier = random.randrange(55, 100) / 100 if lane != main_lane else 1
+            multiplier = self.rng.randrange(55, 100) / 100 if lane != main_lane else 1
             mult[lane] = multiplier
 
         return LaneMultipliers.get_from_dict(mult)
@@ -304,3 +478,90 @@ class MobaPlayerGenerator(GeneratorInterface):
             self.generate_attributes(mu, sigma, lane),
             self.generate_champions(lane, amount_champions),
         )
+
+    def generate_many(
+        self,
+        n: int,
+        lanes: Lanes | list[Lanes],
+        nationality: Optional[str] = None,
+        mu: Optional[int] = None,
+        sigma: Optional[int] = None,
+        amount_champions: int = 0,
+    ) -> list[MobaPlayer]:
+        """
+        Generates n players at once. lanes is either the lane of every player or a
+        list with the lane of each player. Each kind of value (IDs, names, dates of
+        birth, multipliers, attributes and champion masteries) is drawn for all
+        players in a single pass before the players are built.
+        """
+        if isinstance(lanes, Lanes):
+            lanes = [lanes] * n
+        if len(lanes) != n:
+            raise MobaPlayerGeneratorError("There must be one lane for each player!")
+
+        rng = self.rng
+        if not nationality or nationality not in self.nationalities:
+            nationalities = rng.choices(self.nationalities, k=n)
+        else:
+            nationalities = [nationality] * n
+
+        skills = {nat: self.get_nationality_skill(nat) for nat in set(nationalities)}
+        if mu is not None and sigma is not None:
+            skills = {nat: (mu, sigma) for nat in skills}
+
+        ids = [self.generate_id() for _ in range(n)]
+        regions = [self.get_region(nat) for nat in nationalities]
+        first_names = [rng.choice(region.first_names) for region in regions]
+        last_names = [rng.choice(region.surnames) for region in regions]
+        min_year, days = self.get_birthday_range()
+        birthdays = [min_year + timedelta(days=rng.randrange(days)) for _ in range(n)]
+        nick_names = self.generate_many_nicks(n)
+
+        # The main lane's multiplier is always 1, so only the others are drawn
+        multiplier_values = iter(rng.choices(range(55, 100), k=n * (len(Lanes) - 1)))
+        multipliers = [
+            LaneMultipliers(
+                *(
+                    1 if lane == main_lane else next(multiplier_values) / 100
+                    for lane in Lanes
+                )
+            )
+            for main_lane in lanes
+        ]
+
+        attributes = self.attribute_gen.generate_many(
+            [skills[nat][0] for nat in nationalities],
+            [skills[nat][1] for nat in nationalities],
+            lanes,
+        )
+
+        champions = self.choose_many_champions(lanes, amount_champions)
+        masteries = iter(
+            rng.choices(
+                list(ChampionMastery),
+                MASTERY_WEIGHTS,
+                k=sum(len(pool) for pool in champions),
+            )
+        )
+        champion_pools = [
+            [
+                MobaPlayerChampion(champion.champion_id, next(masteries), 0.0)
+                for champion in pool
+            ]
+            for pool in champions
+        ]
+
+        return [
+            MobaPlayer(*values)
+            for values in zip(
+                ids,
+                nationalities,
+                first_names,
+                last_names,
+                birthdays,
+                nick_names,
+                multipliers,
+                attributes,
+                champion_pools,
+            )
+        ]
@@ -0,0 +1,250 @@
+#      eSports Manager - free and open source eSports Management game
+#      Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Generates synthetic worlds of any size to be used as large fixtures in scale
+tests. It can be run from the command line, e.g.:
+
+    python -m esm.core.esports.moba.generator.generate_synthetic_world \
+        --regions 100 --teams 5000 --players 500000 --champions 1000 ./world
+"""
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from ....db import DB
+from ....utils import get_default_names_file, load_list_from_file
+from ....utils.seed import SeedTree
+from ..champion import Champion
+from ..mobaplayer import Lanes
+from .generate_champions import ChampionGenerator
+from .generator import GeneratorInterface
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+class SyntheticWorldGeneratorError(Exception):
+    pass
+
+
+@dataclass
+class SyntheticWorldSettings:
+    regions: int = 100
+    teams: int = 5000
+    players: int = 500000
+    champions: int = 1000
+    champion_pool: int = 5  # champions in each player's champion pool
+
+    @property
+    def free_agents(self) -> int:
+        """
+        Players that are not in any team's roster.
+        """
+        return self.players - self.teams * len(Lanes)
+
+    def get_region_size(self, total: int, region: int) -> int:
+        """
+        Splits the total amount of teams or players evenly between the regions.
+        """
+        size, remainder = divmod(total, self.regions)
+        return size + (1 if region < remainder else 0)
+
+
+def get_peak_memory(children: bool = False) -> Optional[int]:
+    """
+    Returns the peak resident memory in bytes of the current process, or of its
+    largest finished child process. It is None where the resource module is not
+    available.
+    """
+    if resource is None:
+        return None
+
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak_memory = resource.getrusage(who).ru_maxrss
+    # macOS reports bytes and other systems report kilobytes
+    return peak_memory if sys.platform == "darwin" else peak_memory * 1024
+
+
+def format_memory(memory: Optional[int]) -> str:
+    return f"{memory / 2**20:.2f} MiB" if memory is not None else "unavailable"
+
+
+@dataclass
+class SyntheticWorldReport:
+    settings: SyntheticWorldSettings
+    generation_time: float  # seconds
+    peak_memory: Optional[int]  # peak resident bytes of the main process
+    worker_peak_memory: Optional[int]  # peak resident bytes of the largest worker
+    output_size: int  # bytes
+
+    def __str__(self) -> str:
+        return "\n".join(
+            [
+                f"Regions: {self.settings.regions}",
+                f"Teams: {self.settings.teams}",
+                f"Players: {self.settings.players}",
+                f"Champions: {self.settings.champions}",
+                f"Champion pool: {self.settings.champion_pool}",
+                f"Generation time: {self.generation_time:.2f} s",
+                f"Peak memory: {format_memory(self.peak_memory)}",
+                f"Worker peak memory: {format_memory(self.worker_peak_memory)}",
+                f"Output size: {self.output_size / 2**20:.2f} MiB",
+            ]
+        )
+
+
+class SyntheticWorldGenerator(GeneratorInterface):
+    """
+    Generates a world with random champions, teams and players, and streams it to
+    champions, teams, players and regions files in the output directory. Champions
+    are generated first, then regions are generated in a process pool, each with a
+    seed derived from the master seed, and written as soon as they are ready.
+    """
+
+    def __init__(
+        self,
+        settings: SyntheticWorldSettings,
+        seed_tree: Optional[SeedTree] = None,
+        max_workers: Optional[int] = None,
+    ):
+        if settings.regions <= 0:
+            raise SyntheticWorldGeneratorError("There must be at least one region!")
+        if settings.champions <= 0:
+            raise SyntheticWorldGeneratorError("There must be at least one champion!")
+        if settings.free_agents < 0:
+            raise SyntheticWorldGeneratorError(
+                "There are not enough players to fill every team's roster!"
+            )
+
+        self.settings = settings
+        if seed_tree is None:
+            seed_tree = SeedTree(random.getrandbits(64))
+        self.seed_tree = seed_tree
+        self.max_workers = max_workers
+        self.player_names = load_list_from_file(get_default_names_file())
+
+    def generate_champions(self) -> list[Champion]:
+        champion_gen = ChampionGenerator(self.seed_tree.spawn("champions").get_rng())
+        return [champion_gen.generate() for _ in range(self.settings.champions)]
+
+    def get_files(self, output_dir: Path, extension: str) -> list[Path]:
+        return [
+            output_dir / f"{name}{extension}"
+            for name in ["champions", "teams", "players", "regions"]
+        ]
+
+    def get_region_definitions(self) -> list[dict]:
+        """
+        Defines every region with its teams and its amount of free agents. All of a
+        region's teams and players share the region's nationality.
+        """
+        settings = self.settings
+        regions = []
+        for region in range(settings.regions):
+            nationality = self.player_names[region % len(self.player_names)]
+            teams = [
+                {
+                    "name": f"Team {region}-{team}",
+                    "nationality": nationality["region"],
+                    "mu": nationality["mu"],
+                    "sigma": nationality["sigma"],
+                }
+                for team in range(settings.get_region_size(settings.teams, region))
+            ]
+            regions.append(
+                {
+                    "id": f"region{region}",
+                    "name": f"Region {region}",
+                    "short_name": f"R{region}",
+                    "nationality": nationality["region"],
+                    "teams": teams,
+                    "free_agents": settings.get_region_size(
+                        settings.free_agents, region
+                    ),
+                }
+            )
+        return regions
+
+    def write_world(self, output_dir: Path, extension: str) -> None:
+        DB().write_moba_world_streams(
+            self.generate_champions(),
+            self.get_region_definitions(),
+            self.player_names,
+            *self.get_files(output_dir, extension),
+            self.seed_tree,
+            self.max_workers,
+            self.settings.champion_pool,
+        )
+
+    def generate(
+        self, output_dir: Path, extension: str = ".cbor"
+    ) -> SyntheticWorldReport:
+        """
+        Writes the world and reports how long it took, the peak resident memory of
+        the main process and of the largest worker process, and the size of the
+        files.
+        """
+        start = time.perf_counter()
+        self.write_world(output_dir, extension)
+        generation_time = time.perf_counter() - start
+
+        output_size = sum(
+            file.stat().st_size for file in self.get_files(output_dir, extension)
+        )
+        return SyntheticWorldReport(
+            self.settings,
+            generation_time,
+            get_peak_memory(),
+            get_peak_memory(children=True),
+            output_size,
+        )
+
+
+def main() -> None:
+    defaults = SyntheticWorldSettings()
+    parser = argparse.ArgumentParser(
+        description="Generates a synthetic world for scale tests"
+    )
+    parser.add_argument("output_dir", type=Path)
+    parser.add_argument("--regions", type=int, default=defaults.regions)
+    parser.add_argument("--teams", type=int, default=defaults.teams)
+    parser.add_argument("--players", type=int, default=defaults.players)
+    parser.add_argument("--champions", type=int, default=defaults.champions)
+    parser.add_argument("--champion-pool", type=int, default=defaults.champion_pool)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--format", choices=[".cbor", ".ndjson"], default=".cbor", dest="extension"
+    )
+    args = parser.parse_args()
+
+    settings = SyntheticWorldSettings(
+        args.regions, args.teams, args.players, args.champions, args.champion_pool
+    )
+    seed_tree = SeedTree(args.seed) if args.seed is not None else None
+    world_gen = SyntheticWorldGenerator(settings, seed_tree, args.workers)
+    print(world_gen.generate(args.output_dir, args.extension))
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@
 #
 #      You should have received a copy of the GNU General Public License
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import random
 import uuid
 from typing import Optional
 
@@ -21,6 +22,7 @@ from esm.core.esports.moba.generator.generate_players import MobaPlayerGenerator
 from esm.core.esports.moba.generator.generator import GeneratorInterface
 from esm.core.esports.moba.mobaplayer import Lanes, MobaPlayer
 from esm.core.esports.moba.mobateam import MobaTeam
+from esm.core.utils.seed import generate_uuid, get_rng
 
 
 class MobaTeamGeneratorError(Exception):
@@ -33,18 +35,21 @@ class MobaTeamGenerator(GeneratorInterface):
         champions: list[Champion],
         player_names: list[dict[str, dict[str, str | int]]],
         players: Optional[list] = None,
+        rng: Optional[random.Random] = None,
+        amount_champions: int = 0,
     ):
         self.player_list = players
+        self.amount_champions = amount_champions
         if not champions:
             raise MobaTeamGeneratorError("Champion list is empty")
-        self.player_gen = MobaPlayerGenerator(champions, player_names)
+        self.rng = get_rng(rng)
+        self.player_gen = MobaPlayerGenerator(champions, player_names, rng=self.rng)
 
-    @staticmethod
-    def generate_id() -> uuid.UUID:
+    def generate_id(self) -> uuid.UUID:
         """
         Generates teams UUID
         """
-        return uuid.uuid4()
+        return generate_uuid(self.rng)
 
     def generate_roster(
         self, nationality: str, mu: int, sigma: int
@@ -57,7 +62,11 @@ class MobaTeamGenerator(GeneratorInterface):
 
         return [
             self.player_gen.generate(
-                lane=lane, nationality=nationality, mu=mu, sigma=sigma
+                lane=lane,
+                nationality=nationality,
+                mu=mu,
+                sigma=sigma,
+                amount_champions=self.amount_champions,
             )
             for lane in list(Lanes)
         ]
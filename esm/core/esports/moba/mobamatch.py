@@ -26,6 +26,14 @@ class InvalidTeamId(Exception):
     pass
 
 
+@dataclass
+class MobaMatchResult:
+    game_id: UUID
+    victorious_team_id: UUID
+    match_time: int
+    event_log: bytes
+
+
 @dataclass
 class MobaMatch(Serializable):
     game_id: UUID
@@ -17,7 +17,7 @@ import datetime
 import uuid
 from dataclasses import asdict, dataclass
 from enum import Enum, auto
-from typing import Optional
+from typing import ClassVar, Optional
 
 from ...serializable import Serializable
 from ..player import Player
@@ -31,12 +31,28 @@ class Attributes(Serializable):
     def get_from_dict(cls, dictionary: dict[str, int]):
         return cls(**dictionary)
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self.invalidate_overall()
+
+    def invalidate_overall(self) -> None:
+        self.__dict__["_overall"] = None
+        parent = self.__dict__.get("_parent")
+        if parent is not None:
+            parent.invalidate_overall()
+
     def serialize(self) -> dict:
         return asdict(self)
 
     def get_overall(self) -> int:
-        attrs = asdict(self)
-        return int(sum(attrs.values()) / len(attrs))
+        overall = self.__dict__.get("_overall")
+        if overall is None:
+            attrs = asdict(self)
+            overall = int(sum(attrs.values()) / len(attrs))
+            self.__dict__["_overall"] = overall
+
+        return overall
 
 
 @dataclass
@@ -79,35 +95,64 @@ class KnowledgeAttributes(Attributes):
 
 @dataclass
 class MobaPlayerAttributes(Serializable):
+    """
+    Attribute groups of a player. The overall of every lane is calculated once and
+    stored in a table, which is invalidated whenever an attribute changes.
+
+    Lane weights are applied to the overall of each group, in the order: offensive,
+    communication, mechanics, knowledge and utility.
+    """
+
     offensive: OffensiveAttributes
     communication: CommunicationAttributes
     mechanics: MechanicsAttributes
     knowledge: KnowledgeAttributes
     utility: UtilityAttributes
 
-    def get_overall(self, lane: Lanes) -> int:
-        over_sum = (
-            self.offensive.get_overall()
-            + self.communication.get_overall()
-            + self.mechanics.get_overall()
-            + self.knowledge.get_overall()
-            + self.utility.get_overall()
+    LANE_WEIGHTS: ClassVar[dict[Lanes, tuple[int, ...]]] = {
+        Lanes.TOP: (2, 2, 2, 3, 1),
+        Lanes.JNG: (1, 2, 1, 2, 4),
+        Lanes.MID: (2, 2, 2, 3, 1),
+        Lanes.ADC: (2, 3, 3, 1, 1),
+        Lanes.SUP: (1, 2, 1, 2, 4),
+    }
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if isinstance(value, Attributes):
+            value._parent = self
+            self.invalidate_overall()
+
+    def invalidate_overall(self) -> None:
+        self.__dict__["_overalls"] = None
+
+    @property
+    def groups(self) -> tuple[Attributes, ...]:
+        return (
+            self.offensive,
+            self.communication,
+            self.mechanics,
+            self.knowledge,
+            self.utility,
         )
-        if lane in [Lanes.TOP, Lanes.MID]:
-            over_sum += self.offensive.get_overall()
-            over_sum += self.mechanics.get_overall()
-            over_sum += self.communication.get_overall()
-            over_sum += 2 * self.knowledge.get_overall()
-        elif lane == Lanes.ADC:
-            over_sum += self.offensive.get_overall()
-            over_sum += 2 * self.mechanics.get_overall()
-            over_sum += 2 * self.communication.get_overall()
-        elif lane in [Lanes.JNG, Lanes.SUP]:
-            over_sum += self.communication.get_overall()
-            over_sum += self.knowledge.get_overall()
-            over_sum += 3 * self.utility.get_overall()
-        overall = over_sum / 10
-        return int(overall)
+
+    def get_overall(self, lane: Lanes) -> int:
+        overalls = self.__dict__.get("_overalls")
+        if overalls is None:
+            group_overalls = [group.get_overall() for group in self.groups]
+            overalls = {
+                lane: int(
+                    sum(
+                        weight * overall
+                        for weight, overall in zip(weights, group_overalls)
+                    )
+                    / 10
+                )
+                for lane, weights in self.LANE_WEIGHTS.items()
+            }
+            self.__dict__["_overalls"] = overalls
+
+        return overalls[lane]
 
     @classmethod
     def get_from_dict(cls, dictionary: dict[str, dict[str, int]]):
@@ -139,6 +184,17 @@ class ChampionMastery(Enum):
     GRANDMASTER = auto()
 
 
+CHAMPION_MASTERY_MULTIPLIERS = {
+    ChampionMastery.BRONZE: 1.0,
+    ChampionMastery.SILVER: 1.05,
+    ChampionMastery.GOLD: 1.10,
+    ChampionMastery.PLATINUM: 1.15,
+    ChampionMastery.DIAMOND: 1.20,
+    ChampionMastery.MASTER: 1.25,
+    ChampionMastery.GRANDMASTER: 1.30,
+}
+
+
 @dataclass
 class MobaPlayerChampion(Serializable):
     champion_id: uuid.UUID
@@ -149,24 +205,114 @@ class MobaPlayerChampion(Serializable):
     def get_from_dict(cls, dictionary: dict):
         return cls(
             uuid.UUID(hex=dictionary["champion_id"]),
-            dictionary["mastery"],
+            ChampionMastery(dictionary["mastery"]),
             dictionary["total_exp"],
         )
 
     def serialize(self) -> dict:
         return {
             "champion_id": self.champion_id.hex,
-            "mastery": self.mastery,
+            "mastery": self.mastery.value,
             "total_exp": self.total_exp,
         }
 
 
+class ChampionPool(list):
+    """
+    List of a player's champions that counts its changes, so indexes built from it
+    know when they are stale.
+    """
+
+    # Class default, since unpickling extends the list before restoring its state
+    version = 0
+
+    def _changed(self) -> None:
+        self.version += 1
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._changed()
+        return result
+
+    def __imul__(self, other):
+        result = super().__imul__(other)
+        self._changed()
+        return result
+
+    def append(self, value):
+        super().append(value)
+        self._changed()
+
+    def extend(self, values):
+        super().extend(values)
+        self._changed()
+
+    def insert(self, index, value):
+        super().insert(index, value)
+        self._changed()
+
+    def remove(self, value):
+        super().remove(value)
+        self._changed()
+
+    def pop(self, index=-1):
+        value = super().pop(index)
+        self._changed()
+        return value
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        super().reverse()
+        self._changed()
+
+
 @dataclass
 class MobaPlayer(Player, Serializable):
     lanes: LaneMultipliers
     attributes: MobaPlayerAttributes
     champion_pool: list[MobaPlayerChampion]
 
+    def __setattr__(self, name, value):
+        if name == "champion_pool" and not isinstance(value, ChampionPool):
+            value = ChampionPool(value)
+        super().__setattr__(name, value)
+        if name == "champion_pool":
+            self.__dict__["_champion_index"] = None
+
+    def get_champion_index(self) -> dict[uuid.UUID, MobaPlayerChampion]:
+        """
+        Index of the champion pool by champion ID. The champion pool counts its
+        changes, and the index is rebuilt when the pool is replaced or changed. If
+        a champion appears more than once, the first entry is used.
+        """
+        version, index = self.__dict__.get("_champion_index") or (None, None)
+        if version != self.champion_pool.version:
+            index = {}
+            for champion in self.champion_pool:
+                index.setdefault(champion.champion_id, champion)
+            self.__dict__["_champion_index"] = (self.champion_pool.version, index)
+
+        return index
+
+    def get_champion_mastery(self, champion_id: uuid.UUID) -> Optional[ChampionMastery]:
+        champion = self.get_champion_index().get(champion_id)
+        return champion.mastery if champion is not None else None
+
     @classmethod
     def get_from_dict(cls, dictionary: dict):
         return cls(
@@ -230,6 +376,22 @@ class MobaPlayerSimulation:
         self.points: int = 0
         self.champion: Optional[Champion] = champion
         self.consecutive_kills: int = 0
+        self._skill: Optional[float] = None
+        self._champion_skill: Optional[float] = None
+
+    def cache_skill(self) -> None:
+        """
+        Player and champion skill do not change during a match, so they can be
+        calculated once when the match starts. Changing the player's lane or
+        champion requires calling clear_skill_cache.
+        """
+        self.clear_skill_cache()
+        self._skill = self.skill
+        self._champion_skill = self.get_champion_skill()
+
+    def clear_skill_cache(self) -> None:
+        self._skill = None
+        self._champion_skill = None
 
     def reset_attributes(self) -> None:
         self.points = 0
@@ -251,6 +413,9 @@ class MobaPlayerSimulation:
 
     @property
     def skill(self) -> float:
+        if self._skill is not None:
+            return self._skill
+
         return (
             self.player.attributes.get_overall(self.lane)
             * self.get_curr_lane_multiplier()
@@ -259,37 +424,12 @@ class MobaPlayerSimulation:
     def get_champion_mastery_level(
         self, champion: Champion
     ) -> Optional[ChampionMastery]:
-        champion_ids = [ch.champion_id for ch in self.player.champion_pool]
-        if champion.champion_id not in champion_ids:
-            return ChampionMastery.BRONZE
-
-        for ch in self.player.champion_pool:
-            if champion.champion_id == ch.champion_id:
-                return ch.mastery
-
-        return None
+        mastery = self.player.get_champion_mastery(champion.champion_id)
+        return mastery if mastery is not None else ChampionMastery.BRONZE
 
     def get_champion_mastery_value(self, champion: Champion) -> float:
         mastery_level = self.get_champion_mastery_level(champion)
-        if mastery_level is None:
-            return 0.0
-
-        if mastery_level == ChampionMastery.BRONZE:
-            return 1.0
-        elif mastery_level == ChampionMastery.SILVER:
-            return 1.05
-        elif mastery_level == ChampionMastery.GOLD:
-            return 1.10
-        elif mastery_level == ChampionMastery.PLATINUM:
-            return 1.15
-        elif mastery_level == ChampionMastery.DIAMOND:
-            return 1.20
-        elif mastery_level == ChampionMastery.MASTER:
-            return 1.25
-        elif mastery_level == ChampionMastery.GRANDMASTER:
-            return 1.30
-
-        return 0.0
+        return CHAMPION_MASTERY_MULTIPLIERS.get(mastery_level, 0.0)
 
     def get_projected_champion_skill(self, champion: Champion) -> float:
         if champion is None:
@@ -299,6 +439,9 @@ class MobaPlayerSimulation:
         return champion.skill * mult
 
     def get_champion_skill(self) -> float:
+        if self._champion_skill is not None:
+            return self._champion_skill
+
         return self.get_projected_champion_skill(self.champion)
 
     @property
@@ -18,6 +18,7 @@ from dataclasses import dataclass
 from datetime import timedelta
 
 from ...serializable import Serializable
+from ...utils import get_seconds
 from .mobaplayer import Lanes, MobaPlayer, MobaPlayerSimulation
 
 
@@ -101,17 +102,18 @@ class MobaInhibitors:
     top: int = 1
     mid: int = 1
     bot: int = 1
-    top_respawn: timedelta = timedelta(0)
-    mid_respawn: timedelta = timedelta(0)
-    bot_respawn: timedelta = timedelta(0)
+    # Match time, in seconds, when each inhibitor respawns. Zero if it is up.
+    top_respawn: int = 0
+    mid_respawn: int = 0
+    bot_respawn: int = 0
 
     def reset(self):
         self.top = 1
         self.mid = 1
         self.bot = 1
-        self.top_respawn = timedelta(0)
-        self.mid_respawn = timedelta(0)
-        self.bot_respawn = timedelta(0)
+        self.top_respawn = 0
+        self.mid_respawn = 0
+        self.bot_respawn = 0
 
     def are_all_inhibitors_up(self) -> bool:
         return self.top == 1 and self.mid == 1 and self.bot == 1
@@ -124,32 +126,35 @@ class MobaInhibitors:
         elif lane == "bot":
             return self.bot == 1
 
-    def take_down_inhib(self, lane: str, time_taken: timedelta, cooldown: timedelta):
+    def take_down_inhib(
+        self, lane: str, time_taken: int | timedelta, cooldown: int | timedelta
+    ):
+        respawn = get_seconds(time_taken) + get_seconds(cooldown)
         if lane == "top":
             self.top = 0
-            self.top_respawn = time_taken + cooldown
+            self.top_respawn = respawn
         elif lane == "mid":
             self.mid = 0
-            self.mid_respawn = time_taken + cooldown
+            self.mid_respawn = respawn
         elif lane == "bot":
             self.bot = 0
-            self.bot_respawn = time_taken + cooldown
+            self.bot_respawn = respawn
 
-    def update_cooldown(self, time: timedelta):
-        if self.top_respawn != timedelta(0):
+    def update_cooldown(self, time: int):
+        if self.top_respawn != 0:
             if time >= self.top_respawn:
                 self.top = 1
-                self.top_respawn = timedelta(0)
+                self.top_respawn = 0
 
-        if self.mid_respawn != timedelta(0):
+        if self.mid_respawn != 0:
             if time >= self.mid_respawn:
                 self.mid = 1
-                self.mid_respawn = timedelta(0)
+                self.mid_respawn = 0
 
-        if self.bot_respawn != timedelta(0):
+        if self.bot_respawn != 0:
             if time >= self.bot_respawn:
                 self.bot = 1
-                self.bot_respawn = timedelta(0)
+                self.bot_respawn = 0
 
 
 class MobaTeamSimulation:
@@ -184,6 +189,7 @@ class MobaTeamSimulation:
         self._champion_overall: int = 0
         self._total_skill: int = 0
         self._points: int = 0
+        self.cached_aggregates: bool = False
 
     def are_all_towers_down(self) -> bool:
         return self.towers.all_down()
@@ -218,13 +224,66 @@ class MobaTeamSimulation:
         for player in self.players:
             player.get_best_lane()
 
+    def cache_aggregates(self) -> None:
+        """
+        Enables the cached-aggregate mode used during a match. Player and champion
+        skill are calculated once, and points, kills, deaths and assists are kept as
+        running totals. While the mode is on, these values must only be changed
+        through add_points, add_kill, add_death and add_assist.
+        """
+        self.clear_aggregates_cache()
+        for player in self.players:
+            player.cache_skill()
+
+        self._player_overall = self.player_overall
+        self._champion_overall = self.champion_overall
+        self._points = self.points
+        self.stats = TeamStats(self.kills, self.deaths, self.assists)
+        self.cached_aggregates = True
+
+    def clear_aggregates_cache(self) -> None:
+        self.cached_aggregates = False
+        for player in self.players:
+            player.clear_skill_cache()
+
+    def add_points(self, player: MobaPlayerSimulation, points: int) -> None:
+        player.points += points
+        self._points += points
+
+    def add_kill(self, player: MobaPlayerSimulation) -> None:
+        player.stats.kills += 1
+        player.consecutive_kills += 1
+        self.stats.kills += 1
+
+    def add_death(self, player: MobaPlayerSimulation) -> None:
+        player.stats.deaths += 1
+        player.consecutive_kills = 0
+        self.stats.deaths += 1
+
+    def add_assist(self, player: MobaPlayerSimulation) -> None:
+        player.stats.assists += 1
+        self.stats.assists += 1
+
+    def reset_draft(self) -> None:
+        self.picks = []
+        self.bans = []
+        for player in self.players:
+            player.champion = None
+            player.clear_skill_cache()
+
     def reset_values(self) -> None:
+        self.clear_aggregates_cache()
         for player in self.players:
             player.reset_attributes()
 
+        self.stats = TeamStats()
+        self._points = 0
+
         self.towers.reset()
         self.inhibitors.reset()
-        self.dragons = 0
+        self.dragons = []
+        self.grubs = 0
+        self.herald = 0
         self.ancient_drake = False
 
         self.win_prob = 0.0
@@ -232,6 +291,9 @@ class MobaTeamSimulation:
 
     @property
     def kills(self) -> int:
+        if self.cached_aggregates:
+            return self.stats.kills
+
         self.stats.kills = 0
         for player in self.players:
             self.stats.kills += player.stats.kills
@@ -240,6 +302,9 @@ class MobaTeamSimulation:
 
     @property
     def deaths(self) -> int:
+        if self.cached_aggregates:
+            return self.stats.deaths
+
         self.stats.deaths = 0
         for player in self.players:
             self.stats.deaths += player.stats.deaths
@@ -248,6 +313,9 @@ class MobaTeamSimulation:
 
     @property
     def assists(self) -> int:
+        if self.cached_aggregates:
+            return self.stats.assists
+
         self.stats.assists = 0
         for player in self.players:
             self.stats.assists += player.stats.assists
@@ -256,6 +324,9 @@ class MobaTeamSimulation:
 
     @property
     def points(self) -> int:
+        if self.cached_aggregates:
+            return self._points
+
         self._points = 0
         for player in self.players:
             self._points += player.points
@@ -267,12 +338,18 @@ class MobaTeamSimulation:
 
     @property
     def player_overall(self) -> int:
+        if self.cached_aggregates:
+            return self._player_overall
+
         self._player_overall = sum(player.skill for player in self.players)
 
         return self._player_overall
 
     @property
     def champion_overall(self) -> int:
+        if self.cached_aggregates:
+            return self._champion_overall
+
         self._champion_overall = int(
             sum(player.get_champion_skill() for player in self.players)
         )
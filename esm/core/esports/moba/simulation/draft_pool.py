@@ -0,0 +1,130 @@
+#  eSports Manager - free and open source eSports Management game
+#  Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from array import array
+from collections.abc import Iterable
+
+from esm.core.esports.moba.champion import Champion
+from esm.core.esports.moba.champion_registry import ChampionRegistry
+from esm.core.esports.moba.moba_definitions import Lanes
+from esm.core.esports.moba.mobaplayer import MobaPlayerSimulation
+
+
+class DraftError(Exception):
+    pass
+
+
+class DraftChampionPool:
+    """
+    Champions that are still available during a single draft.
+
+    Champions come from a shared ChampionRegistry, and the draft only stores one
+    status byte per champion ID, so creating a pool copies no champions and a pick
+    or ban is O(1). The caller's champion list is never changed. get_state returns
+    the statuses as bytes, which are cheap to hash and compare.
+    """
+
+    AVAILABLE = 0
+    BANNED = 1
+    PICKED = 2
+
+    def __init__(self, registry: ChampionRegistry):
+        self.registry = registry
+        self.status = bytearray(len(registry))
+        self.available = len(registry)
+
+    def __len__(self) -> int:
+        return self.available
+
+    def __contains__(self, champion: Champion) -> bool:
+        index = self.registry.get_index(champion.champion_id)
+        return index is not None and self.status[index] == self.AVAILABLE
+
+    def is_available(self, index: int) -> bool:
+        return self.status[index] == self.AVAILABLE
+
+    def get_lane_indexes(self, lane: Lanes) -> list[int]:
+        """
+        Returns the IDs of the available champions of the lane. If every champion
+        of the lane was already picked or banned, any available champion can be
+        chosen.
+        """
+        indexes = [
+            index
+            for index in self.registry.lanes[lane]
+            if self.status[index] == self.AVAILABLE
+        ]
+        if indexes:
+            return indexes
+
+        return [
+            index
+            for index, status in enumerate(self.status)
+            if status == self.AVAILABLE
+        ]
+
+    def get_lane_champions(self, lane: Lanes) -> list[Champion]:
+        champions = self.registry.champions
+        return [champions[index] for index in self.get_lane_indexes(lane)]
+
+    def set_status(self, champion: Champion, status: int) -> None:
+        index = self.registry.get_index(champion.champion_id)
+        if index is None:
+            raise DraftError(f"{champion.name} is not part of the draft!")
+        if self.status[index] != self.AVAILABLE:
+            raise DraftError(f"{champion.name} was already picked or banned!")
+
+        self.status[index] = status
+        self.available -= 1
+
+    def ban(self, champion: Champion) -> None:
+        self.set_status(champion, self.BANNED)
+
+    def pick(self, champion: Champion) -> None:
+        self.set_status(champion, self.PICKED)
+
+    def get_state(self) -> bytes:
+        return bytes(self.status)
+
+
+class ChampionSkillMatrix:
+    """
+    Projected skill of every player of a match with every champion of a registry,
+    that is the champion skill times the player's mastery multiplier.
+
+    The matrix is calculated once per match, with one row per player indexed by
+    champion ID, so drafts never calculate the same projected skill twice.
+    """
+
+    def __init__(
+        self, registry: ChampionRegistry, players: Iterable[MobaPlayerSimulation]
+    ):
+        self.registry = registry
+        self.rows: dict[MobaPlayerSimulation, array] = {
+            player: array(
+                "d",
+                (
+                    player.get_projected_champion_skill(champion)
+                    for champion in registry.champions
+                ),
+            )
+            for player in players
+        }
+
+    def get_row(self, player: MobaPlayerSimulation) -> array:
+        return self.rows[player]
+
+    def get_skill(self, player: MobaPlayerSimulation, champion: Champion) -> float:
+        return self.rows[player][self.registry.get_index(champion.champion_id)]
@@ -13,10 +13,14 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
-from datetime import timedelta
+
+import random
+from functools import cache
+from typing import Optional
 
 from ...mobateam import MobaTeamSimulation
 from ..moba_event_base import MobaEvent
+from ..moba_event_schedule import MobaEventSchedule
 from ..moba_event_type import MobaEventType
 from .moba_event_fight import MobaEventFight
 from .moba_event_inhib import MobaEventInhibAssault
@@ -34,6 +38,7 @@ def get_event_definitions() -> dict[MobaEventType, dict[str, str | int | float]]
             "cooldown": 0,
             "start_time": 0,
             "end_time": 0,
+            "duration": 10,
         },
         MobaEventType.FIGHT: {
             "points": 0,
@@ -41,6 +46,7 @@ def get_event_definitions() -> dict[MobaEventType, dict[str, str | int | float]]
             "cooldown": 0,
             "start_time": 0,
             "end_time": 0,
+            "duration": 20,
         },
         MobaEventType.JUNGLE_VOIDGRUBS: {
             "points": 15,
@@ -48,6 +54,7 @@ def get_event_definitions() -> dict[MobaEventType, dict[str, str | int | float]]
             "cooldown": 4,
             "start_time": 6,
             "end_time": 14,
+            "duration": 20,
         },
         MobaEventType.JUNGLE_HERALD: {
             "points": 15,
@@ -55,6 +62,7 @@ def get_event_definitions() -> dict[MobaEventType, dict[str, str | int | float]]
             "cooldown": 0,
             "start_time": 14,
             "end_time": 20,
+            "duration": 20,
         },
         MobaEventType.JUNGLE_BARON: {
             "points": 15,
@@ -62,6 +70,7 @@ def get_event_definitions() -> dict[MobaEventType, dict[str, str | int | float]]
             "cooldown": 5,
             "start_time": 20,
             "end_time": 0,
+            "duration": 20,
         },
         MobaEventType.JUNGLE_DRAGON: {
             "points": 15,
@@ -69,6 +78,7 @@ def get_event_definitions() -> dict[MobaEventType, dict[str, str | int | float]]
             "cooldown": 5,
             "start_time": 5,
             "end_time": 0,
+            "duration": 20,
         },
         MobaEventType.TOWER_ASSAULT: {
             "points": 15,
@@ -76,6 +86,7 @@ def get_event_definitions() -> dict[MobaEventType, dict[str, str | int | float]]
             "cooldown": 5,
             "start_time": 10,
             "end_time": 0,
+            "duration": 20,
         },
         MobaEventType.INHIB_ASSAULT: {
             "points": 10,
@@ -83,6 +94,7 @@ def get_event_definitions() -> dict[MobaEventType, dict[str, str | int | float]]
             "cooldown": 5,
             "start_time": 0,
             "end_time": 0,
+            "duration": 20,
         },
         MobaEventType.NEXUS_ASSAULT: {
             "points": 40,
@@ -90,20 +102,56 @@ def get_event_definitions() -> dict[MobaEventType, dict[str, str | int | float]]
             "cooldown": 0,
             "start_time": 0,
             "end_time": 0,
+            "duration": 10,
         },
     }
 
 
+@cache
+def get_event_schedule() -> MobaEventSchedule:
+    """
+    Returns the schedule of the default event definitions. It is compiled once per
+    process and shared by every engine, so its samplers are only built once.
+    """
+    return MobaEventSchedule(get_event_definitions())
+
+
 class MobaEventFactory:
+    def __init__(
+        self,
+        rng: Optional[random.Random] = None,
+        event_definitions: Optional[dict[MobaEventType, dict]] = None,
+    ):
+        self.rng = rng
+        if event_definitions is None:
+            event_definitions = get_event_definitions()
+        self.event_definitions = event_definitions
+
     def get_points(self, event_type: MobaEventType) -> float:
-        return get_event_definitions()[event_type]["points"]
+        return self.event_definitions[event_type]["points"]
+
+    def get_duration(self, event_type: MobaEventType) -> int:
+        return self.event_definitions[event_type]["duration"]
 
     def create_event(
         self,
         event_type: MobaEventType,
         team1: MobaTeamSimulation,
         team2: MobaTeamSimulation,
-        event_time: timedelta,
+        event_time: int,
+    ) -> MobaEvent:
+        event = self._create_event(event_type, team1, team2, event_time)
+        event.duration = self.get_duration(event_type)
+        if self.rng is not None:
+            event.rng = self.rng
+        return event
+
+    def _create_event(
+        self,
+        event_type: MobaEventType,
+        team1: MobaTeamSimulation,
+        team2: MobaTeamSimulation,
+        event_time: int,
     ) -> MobaEvent:
         if event_type == MobaEventType.NOTHING:
             return MobaEventNothing(team1, team2, event_time)
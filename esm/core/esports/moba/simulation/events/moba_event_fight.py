@@ -13,11 +13,9 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
-from datetime import timedelta
-
 from ...mobateam import MobaTeamSimulation
 from ..moba_event_base import MobaEvent, MobaEventBase, MobaEventPriority
-from ..moba_event_type import MobaEventType
+from ..moba_event_type import MobaEventOutcome, MobaEventType
 
 
 class MobaEventFight(MobaEvent, MobaEventBase):
@@ -25,7 +23,7 @@ class MobaEventFight(MobaEvent, MobaEventBase):
         self,
         team1: MobaTeamSimulation,
         team2: MobaTeamSimulation,
-        event_time: timedelta,
+        event_time: int,
         points: float,
     ):
         super().__init__(
@@ -38,4 +36,13 @@ class MobaEventFight(MobaEvent, MobaEventBase):
         )
 
     def calculate_event(self):
-        pass
+        winning_team = self.get_winning_team()
+        losing_team = self.get_opposing_team(winning_team)
+        for _ in range(self.rng.randint(1, 3)):
+            killer = self.rng.choice(winning_team.players)
+            victim = self.rng.choice(losing_team.players)
+            winning_team.add_kill(killer)
+            winning_team.add_points(killer, self.points)
+            losing_team.add_death(victim)
+
+        self.outcome = MobaEventOutcome.KILL
@@ -13,11 +13,11 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
-from datetime import timedelta
-
 from ...mobateam import MobaTeamSimulation
 from ..moba_event_base import MobaEvent, MobaEventBase, MobaEventPriority
-from ..moba_event_type import MobaEventType
+from ..moba_event_type import MobaEventOutcome, MobaEventType
+
+INHIBITOR_RESPAWN_TIME = 5 * 60  # seconds
 
 
 class MobaEventInhibAssault(MobaEvent, MobaEventBase):
@@ -25,7 +25,7 @@ class MobaEventInhibAssault(MobaEvent, MobaEventBase):
         self,
         team1: MobaTeamSimulation,
         team2: MobaTeamSimulation,
-        event_time: timedelta,
+        event_time: int,
         points: float,
     ):
         super().__init__(
@@ -38,4 +38,25 @@ class MobaEventInhibAssault(MobaEvent, MobaEventBase):
         )
 
     def calculate_event(self):
-        pass
+        attackers = [
+            team
+            for team in [self.team1, self.team2]
+            if self.get_opposing_team(team).get_exposed_inhibs()
+        ]
+        attacking_team = self.get_attacking_team(attackers)
+        if attacking_team is None:
+            self.outcome = MobaEventOutcome.NOTHING
+            return
+
+        defending_team = self.get_opposing_team(attacking_team)
+        if self.is_successful(attacking_team):
+            lane = self.rng.choice(defending_team.get_exposed_inhibs())
+            defending_team.inhibitors.take_down_inhib(
+                lane, self.event_time, INHIBITOR_RESPAWN_TIME
+            )
+            attacking_team.add_points(
+                self.rng.choice(attacking_team.players), self.points
+            )
+            self.outcome = MobaEventOutcome.TAKE_INHIB
+        else:
+            self.outcome = MobaEventOutcome.DEFEND_INHIB
@@ -13,12 +13,12 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
-from datetime import timedelta
 from enum import Enum, auto
 
+from ...moba_definitions import Lanes
 from ...mobateam import MobaTeamSimulation
 from ..moba_event_base import MobaEvent, MobaEventBase, MobaEventPriority
-from ..moba_event_type import MobaEventType
+from ..moba_event_type import MobaEventOutcome, MobaEventType
 
 
 class MobaEventJungleError(Exception):
@@ -31,7 +31,7 @@ class MobaEventJungle(MobaEvent, MobaEventBase):
         event_type: MobaEventType,
         team1: MobaTeamSimulation,
         team2: MobaTeamSimulation,
-        event_time: timedelta,
+        event_time: int,
         points: float,
     ):
         super().__init__(
@@ -43,27 +43,31 @@ class MobaEventJungle(MobaEvent, MobaEventBase):
             points,
         )
 
-    def calculate_baron(self):
+    def calculate_baron(self, team: MobaTeamSimulation):
         pass
 
-    def calculate_dragon(self):
-        pass
+    def calculate_dragon(self, team: MobaTeamSimulation):
+        team.dragons.append(self.event_time)
 
-    def calculate_voidgrubs(self):
-        pass
+    def calculate_voidgrubs(self, team: MobaTeamSimulation):
+        team.grubs += 1
 
-    def calculate_herald(self):
-        pass
+    def calculate_herald(self, team: MobaTeamSimulation):
+        team.herald += 1
 
     def calculate_event(self):
+        winning_team = self.get_winning_team()
         if self.event_type == MobaEventType.JUNGLE_VOIDGRUBS:
-            self.calculate_voidgrubs()
+            self.calculate_voidgrubs(winning_team)
         elif self.event_type == MobaEventType.JUNGLE_BARON:
-            self.calculate_baron()
+            self.calculate_baron(winning_team)
         elif self.event_type == MobaEventType.JUNGLE_DRAGON:
-            self.calculate_dragon()
+            self.calculate_dragon(winning_team)
         elif self.event_type == MobaEventType.JUNGLE_HERALD:
-            self.calculate_herald()
+            self.calculate_herald(winning_team)
 
         else:
             raise MobaEventJungleError("Invalid event type was passed to Jungle event!")
+
+        winning_team.add_points(winning_team.player_lanes[Lanes.JNG], self.points)
+        self.outcome = MobaEventOutcome.TAKE_OBJECTIVE
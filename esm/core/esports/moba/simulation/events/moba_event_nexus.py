@@ -13,11 +13,9 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
-from datetime import timedelta
-
 from ...mobateam import MobaTeamSimulation
 from ..moba_event_base import MobaEvent, MobaEventBase, MobaEventPriority
-from ..moba_event_type import MobaEventType
+from ..moba_event_type import MobaEventOutcome, MobaEventType
 
 
 class MobaEventNexusAssault(MobaEvent, MobaEventBase):
@@ -25,7 +23,7 @@ class MobaEventNexusAssault(MobaEvent, MobaEventBase):
         self,
         team1: MobaTeamSimulation,
         team2: MobaTeamSimulation,
-        event_time: timedelta,
+        event_time: int,
         points: float,
     ):
         super().__init__(
@@ -38,4 +36,22 @@ class MobaEventNexusAssault(MobaEvent, MobaEventBase):
         )
 
     def calculate_event(self):
-        pass
+        attackers = [
+            team
+            for team in [self.team1, self.team2]
+            if self.get_opposing_team(team).is_nexus_exposed()
+        ]
+        attacking_team = self.get_attacking_team(attackers)
+        if attacking_team is None:
+            self.outcome = MobaEventOutcome.NOTHING
+            return
+
+        defending_team = self.get_opposing_team(attacking_team)
+        if self.is_successful(attacking_team):
+            defending_team.nexus = 0
+            attacking_team.add_points(
+                self.rng.choice(attacking_team.players), self.points
+            )
+            self.outcome = MobaEventOutcome.TAKE_NEXUS
+        else:
+            self.outcome = MobaEventOutcome.DEFEND_NEXUS
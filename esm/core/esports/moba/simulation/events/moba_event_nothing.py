@@ -13,10 +13,9 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
-from datetime import timedelta
-
 from ...mobateam import MobaTeamSimulation
-from ..moba_event_base import MobaEvent, MobaEventBase, MobaEventPriority, MobaEventType
+from ..moba_event_base import MobaEvent, MobaEventBase, MobaEventPriority
+from ..moba_event_type import MobaEventOutcome, MobaEventType
 
 
 class MobaEventNothing(MobaEvent, MobaEventBase):
@@ -24,11 +23,11 @@ class MobaEventNothing(MobaEvent, MobaEventBase):
         self,
         team1: MobaTeamSimulation,
         team2: MobaTeamSimulation,
-        event_time: timedelta,
+        event_time: int,
     ):
         super().__init__(
             MobaEventType.NOTHING, team1, team2, MobaEventPriority.LOW, event_time, 0.0
         )
 
     def calculate_event(self):
-        pass
+        self.outcome = MobaEventOutcome.NOTHING
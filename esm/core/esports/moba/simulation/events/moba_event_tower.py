@@ -13,11 +13,9 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
-from datetime import timedelta
-
 from ...mobateam import MobaTeamSimulation
 from ..moba_event_base import MobaEvent, MobaEventBase, MobaEventPriority
-from ..moba_event_type import MobaEventType
+from ..moba_event_type import MobaEventOutcome, MobaEventType
 
 
 class MobaEventTowerAssault(MobaEvent, MobaEventBase):
@@ -25,7 +23,7 @@ class MobaEventTowerAssault(MobaEvent, MobaEventBase):
         self,
         team1: MobaTeamSimulation,
         team2: MobaTeamSimulation,
-        event_time: timedelta,
+        event_time: int,
         points: float,
     ):
         super().__init__(
@@ -37,5 +35,46 @@ class MobaEventTowerAssault(MobaEvent, MobaEventBase):
             points,
         )
 
+    @staticmethod
+    def get_tower_lanes(team: MobaTeamSimulation) -> list[str]:
+        """
+        Returns the lanes where the team's next tower can be attacked. Base towers are
+        pushed once an inhibitor is down, otherwise the most advanced lane is pushed.
+        """
+        if team.towers.base and team.are_base_towers_exposed():
+            return ["base"]
+
+        towers = {
+            lane: getattr(team.towers, lane)
+            for lane in ["top", "mid", "bot"]
+            if getattr(team.towers, lane)
+        }
+        if not towers:
+            return []
+
+        fewest_towers = min(towers.values())
+        return [lane for lane, amount in towers.items() if amount == fewest_towers]
+
     def calculate_event(self):
-        pass
+        attackers = [
+            team
+            for team in [self.team1, self.team2]
+            if self.get_tower_lanes(self.get_opposing_team(team))
+        ]
+        attacking_team = self.get_attacking_team(attackers)
+        if attacking_team is None:
+            self.outcome = MobaEventOutcome.NOTHING
+            return
+
+        defending_team = self.get_opposing_team(attacking_team)
+        if self.is_successful(attacking_team):
+            lane = self.rng.choice(self.get_tower_lanes(defending_team))
+            setattr(
+                defending_team.towers, lane, getattr(defending_team.towers, lane) - 1
+            )
+            attacking_team.add_points(
+                self.rng.choice(attacking_team.players), self.points
+            )
+            self.outcome = MobaEventOutcome.TAKE_TOWER
+        else:
+            self.outcome = MobaEventOutcome.DEFEND_TOWER
@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import random
 from abc import ABC, abstractmethod
 from datetime import timedelta
 from enum import Enum, auto
@@ -28,6 +29,21 @@ class MobaEventPriority(Enum):
     HIGH = auto()
 
 
+# Used by events that were not created by an engine with its own RNG
+DEFAULT_RNG = random.Random()
+
+
+def get_win_probability(team_skill: float, opposing_team_skill: float) -> float:
+    """
+    Probability of a team winning a contested event against the opposing team.
+    """
+    total_skill = team_skill + opposing_team_skill
+    if total_skill <= 0:
+        return 0.5
+
+    return team_skill / total_skill
+
+
 class MobaEvent(ABC):
     @abstractmethod
     def calculate_event(self):
@@ -41,7 +57,7 @@ class MobaEventBase:
         team1: MobaTeamSimulation,
         team2: MobaTeamSimulation,
         priority: MobaEventPriority,
-        event_time: timedelta,
+        event_time: int,
         points: float,
     ):
         self.event_type = event_type
@@ -51,4 +67,40 @@ class MobaEventBase:
         self.event_time = event_time
         self.points = points
         self.outcome: Optional[MobaEventOutcome] = None
-        self.duration: timedelta = timedelta(0)
+        self.acting_team: Optional[MobaTeamSimulation] = None
+        self.rng: random.Random = DEFAULT_RNG
+        self.duration: int = 0
+
+    def get_event_time(self) -> timedelta:
+        """
+        Event time and duration are stored as seconds. The timedelta is only used
+        when the event is displayed.
+        """
+        return timedelta(seconds=self.event_time)
+
+    def get_opposing_team(self, team: MobaTeamSimulation) -> MobaTeamSimulation:
+        return self.team2 if team is self.team1 else self.team1
+
+    def is_successful(self, team: MobaTeamSimulation) -> bool:
+        opposing_team = self.get_opposing_team(team)
+        prob = get_win_probability(team.total_skill, opposing_team.total_skill)
+        return self.rng.random() < prob
+
+    def get_winning_team(self) -> MobaTeamSimulation:
+        self.acting_team = self.team1 if self.is_successful(self.team1) else self.team2
+        return self.acting_team
+
+    def get_attacking_team(
+        self, attackers: list[MobaTeamSimulation]
+    ) -> Optional[MobaTeamSimulation]:
+        """
+        Chooses which team attacks an objective. If both teams are able to attack,
+        the attacker is decided by their skill.
+        """
+        if not attackers:
+            return None
+        if len(attackers) == 1:
+            self.acting_team = attackers[0]
+            return self.acting_team
+
+        return self.get_winning_team()
@@ -0,0 +1,130 @@
+#  eSports Manager - free and open source eSports Management game
+#  Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import struct
+import sys
+from array import array
+
+from ..mobateam import MobaTeamSimulation
+from .events import MobaEventFactory
+from .moba_event_base import MobaEvent
+from .moba_event_type import MobaEventOutcome, MobaEventType
+
+
+class MobaEventLogError(Exception):
+    pass
+
+
+class MobaEventLog:
+    """
+    Compact log of the events of a match.
+
+    Events are stored as parallel arrays of codes instead of MobaEvent instances:
+    the event type and outcome values (0 when there is no outcome), the event time
+    in seconds, the acting team (0 for team1, 1 for team2 and -1 for none) and the
+    event points. The log can be serialized to bytes, and the events can be rebuilt
+    when they are needed, for example to show a match report.
+    """
+
+    HEADER = struct.Struct("<I")
+
+    def __init__(self):
+        self.event_types = array("B")
+        self.event_times = array("I")
+        self.durations = array("I")
+        self.outcomes = array("B")
+        self.acting_teams = array("b")
+        self.points = array("f")
+
+    @property
+    def arrays(self) -> tuple[array, ...]:
+        return (
+            self.event_types,
+            self.event_times,
+            self.durations,
+            self.outcomes,
+            self.acting_teams,
+            self.points,
+        )
+
+    def append(self, event: MobaEvent) -> None:
+        self.event_types.append(event.event_type.value)
+        self.event_times.append(event.event_time)
+        self.durations.append(event.duration)
+        self.outcomes.append(event.outcome.value if event.outcome is not None else 0)
+        if event.acting_team is None:
+            self.acting_teams.append(-1)
+        else:
+            self.acting_teams.append(0 if event.acting_team is event.team1 else 1)
+        self.points.append(event.points)
+
+    def __len__(self) -> int:
+        return len(self.event_types)
+
+    def to_bytes(self) -> bytes:
+        data = [self.HEADER.pack(len(self))]
+        for values in self.arrays:
+            if sys.byteorder == "big":
+                values = array(values.typecode, values)
+                values.byteswap()
+            data.append(values.tobytes())
+
+        return b"".join(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "MobaEventLog":
+        if len(data) < cls.HEADER.size:
+            raise MobaEventLogError("Event log data is too short!")
+
+        (length,) = cls.HEADER.unpack_from(data)
+        event_log = cls()
+        offset = cls.HEADER.size
+        for values in event_log.arrays:
+            size = length * values.itemsize
+            if offset + size > len(data):
+                raise MobaEventLogError("Event log data is truncated!")
+            values.frombytes(data[offset : offset + size])
+            if sys.byteorder == "big":
+                values.byteswap()
+            offset += size
+
+        if offset != len(data):
+            raise MobaEventLogError("Event log data has unexpected trailing bytes!")
+
+        return event_log
+
+    def rebuild(
+        self, team1: MobaTeamSimulation, team2: MobaTeamSimulation
+    ) -> list[MobaEvent]:
+        """
+        Rebuilds the event objects of the match. The events are not calculated
+        again: their outcome and acting team come from the log.
+        """
+        event_factory = MobaEventFactory()
+        teams = [team1, team2]
+        events = []
+        for event_type, event_time, duration, outcome, acting_team, points in zip(
+            *self.arrays
+        ):
+            event = event_factory.create_event(
+                MobaEventType(event_type), team1, team2, event_time
+            )
+            event.duration = duration
+            event.outcome = MobaEventOutcome(outcome) if outcome else None
+            event.acting_team = teams[acting_team] if acting_team != -1 else None
+            event.points = points
+            events.append(event)
+
+        return events
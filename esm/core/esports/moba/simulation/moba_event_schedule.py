@@ -0,0 +1,105 @@
+#  eSports Manager - free and open source eSports Management game
+#  Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from ....utils.sampling import AliasSampler
+from .moba_event_type import MobaEventType
+
+
+class MobaEventSchedule:
+    """
+    Event definitions compiled into a table of enabled events for each minute of
+    the match.
+
+    Only INHIB_ASSAULT and NEXUS_ASSAULT depend on the state of the match. They are
+    appended to the minute's events at runtime, and every other event is looked up
+    from the table. After the last minute where an event starts or ends, the
+    enabled events never change, so later minutes use the last row of the table.
+
+    Each row and combination of dynamic events gets an alias table of the event
+    priorities, built the first time it is needed, so the engine draws events in
+    O(1).
+    """
+
+    DYNAMIC_EVENTS = [MobaEventType.INHIB_ASSAULT, MobaEventType.NEXUS_ASSAULT]
+
+    def __init__(self, event_definitions: dict[MobaEventType, dict]):
+        self.event_definitions = event_definitions
+        static_events = [
+            event_type
+            for event_type in event_definitions
+            if event_type not in self.DYNAMIC_EVENTS
+        ]
+        self.last_minute = max(
+            max(
+                event_definitions[event_type]["start_time"]
+                for event_type in static_events
+            ),
+            max(
+                event_definitions[event_type]["end_time"]
+                for event_type in static_events
+            ),
+        )
+        self.events: list[tuple[MobaEventType, ...]] = []
+        self.samplers: dict[
+            tuple[int, bool, bool], tuple[list[MobaEventType], AliasSampler]
+        ] = {}
+        for minute in range(self.last_minute + 1):
+            events = tuple(
+                event_type
+                for event_type in static_events
+                if self.is_event_enabled(event_type, minute)
+            )
+            self.events.append(events)
+
+    def get_priority(self, event_type: MobaEventType) -> int:
+        return self.event_definitions[event_type]["priority"]
+
+    def is_event_enabled(self, event_type: MobaEventType, minute: int) -> bool:
+        definition = self.event_definitions[event_type]
+        if definition["end_time"] != 0:
+            return definition["start_time"] <= minute < definition["end_time"]
+
+        return minute >= definition["start_time"]
+
+    def get_enabled_events(
+        self, minute: int, inhibs_exposed: bool, nexus_exposed: bool
+    ) -> list[MobaEventType]:
+        """
+        Returns the enabled events for that minute, with the dynamic events that are
+        enabled appended to the end.
+        """
+        events = list(self.events[min(minute, self.last_minute)])
+        for event_type, is_enabled in zip(
+            self.DYNAMIC_EVENTS, [inhibs_exposed, nexus_exposed]
+        ):
+            if is_enabled:
+                events.append(event_type)
+
+        return events
+
+    def get_event_sampler(
+        self, minute: int, inhibs_exposed: bool, nexus_exposed: bool
+    ) -> tuple[list[MobaEventType], AliasSampler]:
+        """
+        Returns the enabled events for that minute and a sampler that draws their
+        indexes by priority. Both are shared between calls and must not be modified.
+        """
+        key = (min(minute, self.last_minute), inhibs_exposed, nexus_exposed)
+        if key not in self.samplers:
+            events = self.get_enabled_events(*key)
+            sampler = AliasSampler(self.get_priority(event) for event in events)
+            self.samplers[key] = events, sampler
+
+        return self.samplers[key]
@@ -37,3 +37,4 @@ class MobaEventOutcome(Enum):
     TAKE_INHIB = auto()
     TAKE_TOWER = auto()
     TAKE_NEXUS = auto()
+    TAKE_OBJECTIVE = auto()
@@ -0,0 +1,290 @@
+#  eSports Manager - free and open source eSports Management game
+#  Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import random
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Optional
+
+from ....utils.sampling import AliasSampler
+from ....utils.seed import get_rng
+from ..mobateam import MobaTeamSimulation
+from .events import get_event_schedule
+from .events.moba_event_inhib import INHIBITOR_RESPAWN_TIME
+from .moba_event_base import get_win_probability
+from .moba_event_type import MobaEventType
+
+LANES = range(3)  # top, mid and bot
+
+
+class MobaSimBatchError(Exception):
+    pass
+
+
+@dataclass
+class MobaSimBatchResult:
+    """
+    Aggregated results of a batch of simulations of the same matchup.
+
+    Objectives are summed over all runs and indexed by team: 0 for team1 and
+    1 for team2. FIGHT counts kills and NEXUS_ASSAULT counts wins.
+    """
+
+    runs: int
+    team1_wins: int = 0
+    team2_wins: int = 0
+    game_lengths: list[int] = field(default_factory=list)
+    objectives: dict[MobaEventType, list[int]] = field(
+        default_factory=lambda: {event_type: [0, 0] for event_type in MobaEventType}
+    )
+
+    @property
+    def team1_win_rate(self) -> float:
+        return self.team1_wins / self.runs
+
+    @property
+    def team2_win_rate(self) -> float:
+        return self.team2_wins / self.runs
+
+    @property
+    def average_game_length(self) -> timedelta:
+        return timedelta(seconds=sum(self.game_lengths) / len(self.game_lengths))
+
+    def get_game_length_distribution(self, bucket_minutes: int = 5) -> dict[int, int]:
+        """
+        Histogram of game lengths, keyed by the starting minute of each bucket.
+        """
+        distribution = {}
+        for game_length in self.game_lengths:
+            bucket = int(game_length / 60 / bucket_minutes) * bucket_minutes
+            distribution[bucket] = distribution.get(bucket, 0) + 1
+
+        return dict(sorted(distribution.items()))
+
+    def get_objectives_per_game(self, event_type: MobaEventType) -> tuple[float, float]:
+        team1, team2 = self.objectives[event_type]
+        return team1 / self.runs, team2 / self.runs
+
+
+class MobaSimBatchEngine:
+    """
+    Runs many independent matches of the same matchup at once.
+
+    Instead of creating teams and events for every match, the state of each
+    run is stored in arrays indexed by run, and events are resolved with the same
+    rules used by the MobaSimEngine events. Player and champion skill do not change
+    during a match, so they are only calculated once for the whole batch.
+    """
+
+    def __init__(
+        self,
+        team1: MobaTeamSimulation,
+        team2: MobaTeamSimulation,
+        runs: int,
+        rng: Optional[random.Random] = None,
+    ):
+        if runs <= 0:
+            raise MobaSimBatchError("The amount of runs must be greater than zero!")
+
+        self.team1 = team1
+        self.team2 = team2
+        self.runs = runs
+        self.rng = get_rng(rng)
+        self.schedule = get_event_schedule()
+        self.event_definitions = self.schedule.event_definitions
+        self.base_skill = [
+            team.player_overall + team.champion_overall for team in [team1, team2]
+        ]
+
+        # Team state, indexed by [team][run] or [team][lane][run]
+        self.match_time = [0] * runs
+        self.points = [[0] * runs for _ in range(2)]
+        self.nexus = [[1] * runs for _ in range(2)]
+        self.base_towers = [[2] * runs for _ in range(2)]
+        self.towers = [[[3] * runs for _ in LANES] for _ in range(2)]
+        self.inhibs = [[[1] * runs for _ in LANES] for _ in range(2)]
+        self.inhibs_respawn = [[[0] * runs for _ in LANES] for _ in range(2)]
+
+        self.result = MobaSimBatchResult(runs)
+
+    def get_skill(self, team: int, run: int) -> float:
+        return self.base_skill[team] + self.points[team][run]
+
+    def is_successful(self, team: int, run: int) -> bool:
+        prob = get_win_probability(
+            self.get_skill(team, run), self.get_skill(1 - team, run)
+        )
+        return self.rng.random() < prob
+
+    def get_winning_team(self, run: int) -> int:
+        return 0 if self.is_successful(0, run) else 1
+
+    def get_attacking_team(self, attackers: list[int], run: int) -> int:
+        if len(attackers) == 1:
+            return attackers[0]
+
+        return self.get_winning_team(run)
+
+    def are_all_inhibitors_up(self, team: int, run: int) -> bool:
+        return all(self.inhibs[team][lane][run] for lane in LANES)
+
+    def get_exposed_inhibs(self, team: int, run: int) -> list[int]:
+        return [
+            lane
+            for lane in LANES
+            if self.towers[team][lane][run] == 0 and self.inhibs[team][lane][run] == 1
+        ]
+
+    def is_nexus_exposed(self, team: int, run: int) -> bool:
+        return self.base_towers[team][run] == 0 and not self.are_all_inhibitors_up(
+            team, run
+        )
+
+    def get_tower_lanes(self, team: int, run: int) -> list[int]:
+        """
+        Mirrors MobaEventTowerAssault.get_tower_lanes. Base towers use the lane
+        index -1.
+        """
+        if self.base_towers[team][run] and not self.are_all_inhibitors_up(team, run):
+            return [-1]
+
+        towers = {
+            lane: self.towers[team][lane][run]
+            for lane in LANES
+            if self.towers[team][lane][run]
+        }
+        if not towers:
+            return []
+
+        fewest_towers = min(towers.values())
+        return [lane for lane, amount in towers.items() if amount == fewest_towers]
+
+    def update_cooldowns(self, run: int) -> None:
+        for team in range(2):
+            for lane in LANES:
+                respawn = self.inhibs_respawn[team][lane][run]
+                if respawn != 0 and self.match_time[run] >= respawn:
+                    self.inhibs[team][lane][run] = 1
+                    self.inhibs_respawn[team][lane][run] = 0
+
+    def get_enabled_events(self, run: int) -> tuple[list[MobaEventType], AliasSampler]:
+        inhibs_exposed = bool(
+            self.get_exposed_inhibs(0, run) or self.get_exposed_inhibs(1, run)
+        )
+        nexus_exposed = self.is_nexus_exposed(0, run) or self.is_nexus_exposed(1, run)
+        return self.schedule.get_event_sampler(
+            self.match_time[run] // 60, inhibs_exposed, nexus_exposed
+        )
+
+    def add_objective(self, event_type: MobaEventType, team: int, amount: int = 1):
+        self.result.objectives[event_type][team] += amount
+
+    def calculate_fight(self, event_type: MobaEventType, run: int) -> None:
+        team = self.get_winning_team(run)
+        kills = self.rng.randint(1, 3)
+        self.points[team][run] += kills * self.event_definitions[event_type]["points"]
+        self.add_objective(event_type, team, kills)
+
+    def calculate_jungle(self, event_type: MobaEventType, run: int) -> None:
+        team = self.get_winning_team(run)
+        self.points[team][run] += self.event_definitions[event_type]["points"]
+        self.add_objective(event_type, team)
+
+    def calculate_tower_assault(self, event_type: MobaEventType, run: int) -> None:
+        attackers = [team for team in range(2) if self.get_tower_lanes(1 - team, run)]
+        if not attackers:
+            return
+
+        team = self.get_attacking_team(attackers, run)
+        if self.is_successful(team, run):
+            lane = self.rng.choice(self.get_tower_lanes(1 - team, run))
+            if lane == -1:
+                self.base_towers[1 - team][run] -= 1
+            else:
+                self.towers[1 - team][lane][run] -= 1
+            self.points[team][run] += self.event_definitions[event_type]["points"]
+            self.add_objective(event_type, team)
+
+    def calculate_inhib_assault(self, event_type: MobaEventType, run: int) -> None:
+        attackers = [
+            team for team in range(2) if self.get_exposed_inhibs(1 - team, run)
+        ]
+        if not attackers:
+            return
+
+        team = self.get_attacking_team(attackers, run)
+        if self.is_successful(team, run):
+            lane = self.rng.choice(self.get_exposed_inhibs(1 - team, run))
+            self.inhibs[1 - team][lane][run] = 0
+            self.inhibs_respawn[1 - team][lane][run] = (
+                self.match_time[run] + INHIBITOR_RESPAWN_TIME
+            )
+            self.points[team][run] += self.event_definitions[event_type]["points"]
+            self.add_objective(event_type, team)
+
+    def calculate_nexus_assault(self, event_type: MobaEventType, run: int) -> None:
+        attackers = [team for team in range(2) if self.is_nexus_exposed(1 - team, run)]
+        if not attackers:
+            return
+
+        team = self.get_attacking_team(attackers, run)
+        if self.is_successful(team, run):
+            self.nexus[1 - team][run] = 0
+            self.points[team][run] += self.event_definitions[event_type]["points"]
+            self.add_objective(event_type, team)
+
+    def calculate_event(self, event_type: MobaEventType, run: int) -> None:
+        if event_type == MobaEventType.FIGHT:
+            self.calculate_fight(event_type, run)
+        elif event_type in [
+            MobaEventType.JUNGLE_VOIDGRUBS,
+            MobaEventType.JUNGLE_HERALD,
+            MobaEventType.JUNGLE_DRAGON,
+            MobaEventType.JUNGLE_BARON,
+        ]:
+            self.calculate_jungle(event_type, run)
+        elif event_type == MobaEventType.TOWER_ASSAULT:
+            self.calculate_tower_assault(event_type, run)
+        elif event_type == MobaEventType.INHIB_ASSAULT:
+            self.calculate_inhib_assault(event_type, run)
+        elif event_type == MobaEventType.NEXUS_ASSAULT:
+            self.calculate_nexus_assault(event_type, run)
+
+    def step(self, run: int) -> None:
+        self.update_cooldowns(run)
+        enabled_events, event_sampler = self.get_enabled_events(run)
+        event_type = enabled_events[event_sampler.sample(self.rng)]
+        self.calculate_event(event_type, run)
+        self.match_time[run] += self.event_definitions[event_type]["duration"]
+
+    def is_match_over(self, run: int) -> bool:
+        return self.nexus[0][run] == 0 or self.nexus[1][run] == 0
+
+    def run(self) -> MobaSimBatchResult:
+        running = list(range(self.runs))
+        while running:
+            for run in running:
+                self.step(run)
+
+            running = [run for run in running if not self.is_match_over(run)]
+
+        for run in range(self.runs):
+            if self.nexus[1][run] == 0:
+                self.result.team1_wins += 1
+            else:
+                self.result.team2_wins += 1
+            self.result.game_lengths.append(self.match_time[run])
+
+        return self.result
@@ -14,22 +14,59 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import random
+from collections import deque
+from collections.abc import Iterator
 from datetime import timedelta
+from typing import Optional
 
+from ....utils import get_seconds
+from ....utils.sampling import AliasSampler
+from ....utils.seed import get_rng
 from ..mobateam import MobaTeamSimulation
-from .events import MobaEvent, MobaEventFactory, get_event_definitions
+from .events import MobaEvent, MobaEventFactory, get_event_schedule
+from .moba_event_log import MobaEventLog
 from .moba_event_type import MobaEventType
 
 
 class MobaSimEngine:
-    def __init__(self, team1: MobaTeamSimulation, team2: MobaTeamSimulation):
+    """
+    Simulates a match between two teams.
+
+    By default, every event is kept in the event_history while the match is
+    running. A history_size limits it to the latest events, and a history_size of 0
+    does not keep any events. Once the match is over, only the compact event_log
+    is kept.
+
+    All random draws come from the engine's rng, so a match can be replayed by
+    passing an RNG with the same seed.
+    """
+
+    def __init__(
+        self,
+        team1: MobaTeamSimulation,
+        team2: MobaTeamSimulation,
+        history_size: Optional[int] = None,
+        rng: Optional[random.Random] = None,
+    ):
         self.team1 = team1
         self.team2 = team2
-        self.event_definitions = get_event_definitions()
-        self.enabled_events = []
-        self.event_history = []
-        self.event_factory = MobaEventFactory()
-        self.match_time: timedelta = timedelta(0)
+        self.schedule = get_event_schedule()
+        self.event_definitions = self.schedule.event_definitions
+        self.enabled_events: list[MobaEventType] = []
+        self.event_sampler: Optional[AliasSampler] = None
+        self.event_history: deque[MobaEvent] = deque(maxlen=history_size)
+        self.event_log = MobaEventLog()
+        self.rng = get_rng(rng)
+        self.event_factory = MobaEventFactory(self.rng, self.event_definitions)
+        self.clock: int = 0  # match time in seconds
+
+    @property
+    def match_time(self) -> timedelta:
+        return timedelta(seconds=self.clock)
+
+    @match_time.setter
+    def match_time(self, value: int | timedelta) -> None:
+        self.clock = get_seconds(value)
 
     def is_match_over(self) -> bool:
         if self.team1.nexus == 0 or self.team2.nexus == 0:
@@ -38,56 +75,43 @@ class MobaSimEngine:
         return False
 
     def update_cooldowns(self):
-        self.team1.inhibitors.update_cooldown(self.match_time)
-        self.team2.inhibitors.update_cooldown(self.match_time)
+        self.team1.inhibitors.update_cooldown(self.clock)
+        self.team2.inhibitors.update_cooldown(self.clock)
 
     def get_enabled_events(self) -> None:
-        self.enabled_events = []
-
-        for event_type in self.event_definitions:
-            match_time = int(self.match_time.seconds / 60)
-            if event_type == MobaEventType.INHIB_ASSAULT:
-                if self.team1.are_inhibs_exposed() or self.team2.are_inhibs_exposed():
-                    exposed = self.team1.get_exposed_inhibs()
-                    exposed += self.team2.get_exposed_inhibs()
-                    if exposed != []:
-                        self.enabled_events.append(event_type)
-                        continue
-            elif event_type == MobaEventType.NEXUS_ASSAULT:
-                if self.team1.is_nexus_exposed() or self.team2.is_nexus_exposed():
-                    self.enabled_events.append(event_type)
-                    continue
-            elif self.event_definitions[event_type]["end_time"] != 0:
-                if (
-                    self.event_definitions[event_type]["start_time"]
-                    <= match_time
-                    < self.event_definitions[event_type]["end_time"]
-                ):
-                    self.enabled_events.append(event_type)
-            else:
-                if match_time >= self.event_definitions[event_type]["start_time"]:
-                    self.enabled_events.append(event_type)
+        inhibs_exposed = bool(
+            self.team1.get_exposed_inhibs() or self.team2.get_exposed_inhibs()
+        )
+        nexus_exposed = self.team1.is_nexus_exposed() or self.team2.is_nexus_exposed()
+        self.enabled_events, self.event_sampler = self.schedule.get_event_sampler(
+            self.clock // 60, inhibs_exposed, nexus_exposed
+        )
 
     def get_event(self) -> MobaEvent:
-        self.priorities = []
-        for event in self.enabled_events:
-            for ev in self.event_definitions:
-                if event == ev:
-                    self.priorities.append(self.event_definitions[event]["priority"])
-
-        chosen_event_type = random.choices(
-            self.enabled_events, weights=self.priorities
-        )[0]
+        chosen_event_type = self.enabled_events[self.event_sampler.sample(self.rng)]
         event = self.event_factory.create_event(
-            chosen_event_type, self.team1, self.team2, self.match_time
+            chosen_event_type, self.team1, self.team2, self.clock
         )
         self.event_history.append(event)
         return event
 
-    def run(self):
+    def iter_events(self) -> Iterator[MobaEvent]:
+        """
+        Runs the match lazily, yielding each event as soon as it is calculated.
+        """
+        self.team1.cache_aggregates()
+        self.team2.cache_aggregates()
         while not self.is_match_over():
             self.update_cooldowns()
             self.get_enabled_events()
             event = self.get_event()
             event.calculate_event()
-            self.match_time += event.duration
+            self.clock += event.duration
+            self.event_log.append(event)
+            yield event
+
+        self.event_history.clear()
+
+    def run(self):
+        for _ in self.iter_events():
+            pass
@@ -13,8 +13,13 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import random
+from collections.abc import Iterator
+from typing import Optional
+
 from ..mobamatch import MobaMatch
 from ..mobateam import MobaTeamSimulation
+from .moba_event_base import MobaEvent
 from .moba_sim_engine import MobaSimEngine
 
 
@@ -28,17 +33,27 @@ class MobaSimMatch:
         match: MobaMatch,
         team1: MobaTeamSimulation,
         team2: MobaTeamSimulation,
+        history_size: Optional[int] = None,
+        rng: Optional[random.Random] = None,
     ):
         self.team1 = team1
         self.team2 = team2
         self.match = match
         self.teams = [self.team1, self.team2]
-        self.simulation_engine = MobaSimEngine(self.team1, self.team2)
+        self.simulation_engine = MobaSimEngine(
+            self.team1, self.team2, history_size, rng
+        )
 
-    def run(self):
+    def check_champions(self):
         for team in self.teams:
             for player in team.players:
                 if player.champion is None:
                     raise NoChampionError
 
+    def iter_events(self) -> Iterator[MobaEvent]:
+        self.check_champions()
+        yield from self.simulation_engine.iter_events()
+
+    def run(self):
+        self.check_champions()
         self.simulation_engine.run()
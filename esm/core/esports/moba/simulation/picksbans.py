@@ -13,6 +13,7 @@
 #
 #      You should have received a copy of the GNU General Public License
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import asyncio
 import random
 from abc import ABC, abstractmethod
 from enum import Enum, auto
@@ -21,8 +22,16 @@ from typing import Optional
 from uuid import UUID
 
 from esm.core.esports.moba.champion import Champion
-from esm.core.esports.moba.mobaplayer import Lanes
+from esm.core.esports.moba.champion_registry import ChampionRegistry
+from esm.core.esports.moba.mobaplayer import Lanes, MobaPlayerSimulation
 from esm.core.esports.moba.mobateam import MobaTeamSimulation
+from esm.core.esports.moba.simulation.draft_pool import (
+    ChampionSkillMatrix,
+    DraftChampionPool,
+    DraftError,
+)
+from esm.core.utils.sampling import WeightedSampler
+from esm.core.utils.seed import get_rng
 
 
 class PBPhase(Enum):
@@ -33,6 +42,37 @@ class PBPhase(Enum):
     PB_DONE = auto()
 
 
+class PBAction(Enum):
+    PICK = auto()
+    BAN = auto()
+
+
+# Order of the actions in a draft, as run by PicksBans. Each action has the index
+# of the team that performs it: 0 for team1 (blue side) and 1 for team2 (red side).
+DRAFT_ORDER: tuple[tuple[int, PBAction], ...] = (
+    (0, PBAction.BAN),
+    (1, PBAction.BAN),
+    (0, PBAction.BAN),
+    (1, PBAction.BAN),
+    (0, PBAction.BAN),
+    (1, PBAction.BAN),
+    (0, PBAction.PICK),
+    (1, PBAction.PICK),
+    (1, PBAction.PICK),
+    (0, PBAction.PICK),
+    (0, PBAction.PICK),
+    (1, PBAction.PICK),
+    (1, PBAction.BAN),
+    (0, PBAction.BAN),
+    (1, PBAction.BAN),
+    (0, PBAction.BAN),
+    (1, PBAction.PICK),
+    (0, PBAction.PICK),
+    (0, PBAction.PICK),
+    (1, PBAction.PICK),
+)
+
+
 class PickBanInput(ABC):
     @abstractmethod
     def pick(self):
@@ -42,28 +82,55 @@ class PickBanInput(ABC):
     def ban(self):
         pass
 
+    def start(self, picks_bans: "PicksBans") -> None:
+        """
+        Called when the draft is created, so the input can access the draft's
+        champion pool and teams.
+        """
+        pass
+
+    def finalize(self) -> None:
+        """
+        Called when the draft is over.
+        """
+        pass
+
+    async def pick_async(self) -> None:
+        self.pick()
+
+    async def ban_async(self) -> None:
+        self.ban()
+
 
 class PicksBans:
     def __init__(
         self,
-        champions: list[Champion],
+        champions: list[Champion] | ChampionRegistry,
         team1: MobaTeamSimulation,
         team2: MobaTeamSimulation,
         team1_input: Optional[PickBanInput] = None,
         team2_input: Optional[PickBanInput] = None,
+        rng: Optional[random.Random] = None,
     ):
         self.champions = champions
+        if not isinstance(champions, ChampionRegistry):
+            champions = ChampionRegistry(champions)
+        self.pool = DraftChampionPool(champions)
+        self.skill_matrix = ChampionSkillMatrix(
+            champions, team1.players + team2.players
+        )
         self.team1 = team1
         self.team2 = team2
+        self.rng = get_rng(rng)
         if team1_input is None:
             self.team1_input: Optional[PickBanInput] = PicksBansAI(
-                team1, team2, champions
+                team1, team2, self.pool, self.rng, self.skill_matrix
             )
         else:
             self.team1_input = team1_input
         if team2_input is None:
             self.team2_input: Optional[PickBanInput] = PicksBansAI(
-                team2, team1, champions
+                team2, team1, self.pool, self.rng, self.skill_matrix
             )
         else:
             self.team2_input: Optional[PickBanInput] = team2_input
@@ -72,6 +139,8 @@ class PicksBans:
         self.bans_count = 0
         self.picks_count = 0
         self.max_bans = 10
+        self.team1_input.start(self)
+        self.team2_input.start(self)
 
     def bans(self):
         if self.pb_phase == PBPhase.BAN_BLUE_SIDE:
@@ -124,11 +193,34 @@ class PicksBans:
             self.bans()
             self.picks()
 
-        if isinstance(self.team1_input, PicksBansAI):
-            self.team1_input.finalize()
+        self.team1_input.finalize()
+        self.team2_input.finalize()
+
+    async def run_async(self):
+        """
+        Runs the draft in DRAFT_ORDER, awaiting each decision, so one event loop
+        can run many drafts that wait for human inputs at the same time.
+        """
+        phases = {
+            (0, PBAction.BAN): PBPhase.BAN_BLUE_SIDE,
+            (1, PBAction.BAN): PBPhase.BAN_RED_SIDE,
+            (0, PBAction.PICK): PBPhase.PICK_BLUE_SIDE,
+            (1, PBAction.PICK): PBPhase.PICK_RED_SIDE,
+        }
+        inputs = [self.team1_input, self.team2_input]
+        for team, action in DRAFT_ORDER:
+            self.pb_phase = phases[team, action]
+            if action == PBAction.BAN:
+                await inputs[team].ban_async()
+                self.bans_count += 1
+            else:
+                await inputs[team].pick_async()
+                self.picks_count += 1
 
-        if isinstance(self.team2_input, PicksBansAI):
-            self.team2_input.finalize()
+        self.is_over = True
+        self.pb_phase = PBPhase.PB_DONE
+        self.team1_input.finalize()
+        self.team2_input.finalize()
 
 
 class PickBansHumanInput(PickBanInput):
@@ -147,16 +239,26 @@ class PicksBansAI(PickBanInput):
         self,
         team: MobaTeamSimulation,
         opposing_team: MobaTeamSimulation,
-        champions: list[Champion],
+        pool: DraftChampionPool,
+        rng: Optional[random.Random] = None,
+        skill_matrix: Optional[ChampionSkillMatrix] = None,
     ):
         self.team = team
         self.opposing_team = opposing_team
-        self.champions = champions
+        self.pool = pool
+        self.rng = get_rng(rng)
+        if skill_matrix is None:
+            skill_matrix = ChampionSkillMatrix(
+                pool.registry, team.players + opposing_team.players
+            )
+        self.skill_matrix = skill_matrix
         self.picks = {lane: None for lane in list(Lanes)}
         self.opposing_team_champions = self.setup_champions(
-            self.opposing_team, {ch.champion_id: 0 for ch in self.champions}
+            self.opposing_team,
+            {champion_id: 0 for champion_id in pool.registry.indexes},
         )
-        self.champion_ids = {ch.champion_id: ch for ch in self.champions}
+        self.pick_samplers: dict[Lanes, tuple[list[int], WeightedSampler]] = {}
+        self.ban_samplers: dict[Lanes, tuple[list[int], WeightedSampler]] = {}
 
     @staticmethod
     def setup_champions(
@@ -168,43 +270,56 @@ class PicksBansAI(PickBanInput):
 
         return {ch: v for ch, v in champions.items() if v != 0}
 
+    def choose_champion(
+        self,
+        samplers: dict[Lanes, tuple[list[int], WeightedSampler]],
+        lane: Lanes,
+        player: MobaPlayerSimulation,
+    ) -> Champion:
+        """
+        Draws an available champion for the lane, using the player's projected
+        champion skill from the skill matrix as the weight.
+
+        The sampler of a lane is built the first time the lane is drafted. Champions
+        that were picked or banned since then are removed from it once they are
+        drawn, and the sampler is built again when the lane runs out of champions.
+        """
+        champions = self.pool.registry.champions
+        if lane in samplers:
+            indexes, sampler = samplers[lane]
+            while sampler.non_zero:
+                position = sampler.sample(self.rng)
+                if self.pool.is_available(indexes[position]):
+                    return champions[indexes[position]]
+                sampler.remove(position)
+
+        indexes = self.pool.get_lane_indexes(lane)
+        skills = self.skill_matrix.get_row(player)
+        sampler = WeightedSampler(skills[index] for index in indexes)
+        samplers[lane] = indexes, sampler
+        return champions[indexes[sampler.sample(self.rng)]]
+
     def pick(self):
         # Choose lane to pick
         lanes = [lane for lane in list(Lanes) if self.picks[lane] is None]
         if len(lanes) == 1:
             lane = lanes[0]
         else:
-            lane = random.choice(lanes)
+            lane = self.rng.choice(lanes)
 
         # Get the player from the lane
         player = self.team.player_lanes[lane]
 
-        # Filter champions to pick based on lane
-        champions_for_lane = [
-            ch
-            for ch in self.champions
-            if ch.lanes[lane] == 1.0 and ch.champion_id in self.champion_ids
-        ]
-
-        # Then we calculate the skill levels of each champion, and we choose
-        # the champion based on the resulting skill level
-        champions_to_pick = [
-            (champion, player.get_projected_champion_skill(champion))
-            for champion in champions_for_lane
-        ]
-
-        # Now we just use these skill levels as probabilities and we pick the champion
-        champions = [ch[0] for ch in champions_to_pick]
-        probabilities = [ch[1] for ch in champions_to_pick]
-        champion = random.choices(champions, probabilities)[0]
+        # Then we use the player's skill level with each available champion of the
+        # lane as probabilities, and we choose the champion
+        champion = self.choose_champion(self.pick_samplers, lane, player)
 
         # Finally, we pick the champion
         self.picks[lane] = champion
 
         # And we remove the champion from the list of available ones
         # and add it to the list of picks
-        self.champion_ids.pop(champion.champion_id)
-        self.champions.remove(champion)
+        self.pool.pick(champion)
         self.team.picks.append(champion)
 
     def ban(self):
@@ -213,33 +328,17 @@ class PicksBansAI(PickBanInput):
         # But this simplified version should suffice for now
 
         # Choose a lane to ban
-        lane = random.choice(list(Lanes))
+        lane = self.rng.choice(list(Lanes))
 
         # Get the player from the lane
         player = self.opposing_team.player_lanes[lane]
 
-        # Filter champions to ban based on lane
-        champions_for_lane = [
-            ch
-            for ch in self.champions
-            if ch.lanes[lane] == 1.0 and ch.champion_id in self.champion_ids
-        ]
-
-        # Then we calculate the skill levels of each champion, and we choose
-        # the champion based on the resulting skill level
-        champions_to_ban = [
-            (champion, player.get_projected_champion_skill(champion))
-            for champion in champions_for_lane
-        ]
-
-        # Now we just use these skill levels as probabilities and we pick the champion to ban
-        champions = [ch[0] for ch in champions_to_ban]
-        probabilities = [ch[1] for ch in champions_to_ban]
-        champion = random.choices(champions, probabilities)[0]
+        # Then we use the player's skill level with each available champion of the
+        # lane as probabilities, and we choose the champion to ban
+        champion = self.choose_champion(self.ban_samplers, lane, player)
 
         # Finally, we ban the champion
-        self.champion_ids.pop(champion.champion_id)
-        self.champions.remove(champion)
+        self.pool.ban(champion)
         self.team.bans.append(champion)
 
     def finalize(self):
@@ -247,3 +346,100 @@ class PicksBansAI(PickBanInput):
             champion = self.picks[lane]
             if champion is not None:
                 self.team.player_lanes[lane].champion = champion
+
+
+class PickBansAsyncHumanInput(PickBanInput):
+    """
+    Human input for drafts run with PicksBans.run_async.
+
+    Decisions are sent with submit, for example from a request handler, and the
+    draft awaits them without blocking a thread. Champions that are not available
+    and lanes that were already picked are ignored. If no valid decision arrives
+    before the pick or ban timeout (in seconds), the AI decides instead.
+    """
+
+    def __init__(
+        self,
+        pick_timeout: Optional[float] = 30.0,
+        ban_timeout: Optional[float] = 30.0,
+    ):
+        self.pick_timeout = pick_timeout
+        self.ban_timeout = ban_timeout
+        self.queue: asyncio.Queue[tuple[Champion, Optional[Lanes]]] = asyncio.Queue()
+        self.waiting: Optional[PBAction] = None
+        self.ai: Optional[PicksBansAI] = None
+
+    def start(self, picks_bans: PicksBans) -> None:
+        if picks_bans.team1_input is self:
+            team, opposing_team = picks_bans.team1, picks_bans.team2
+        else:
+            team, opposing_team = picks_bans.team2, picks_bans.team1
+        self.ai = PicksBansAI(
+            team,
+            opposing_team,
+            picks_bans.pool,
+            picks_bans.rng,
+            picks_bans.skill_matrix,
+        )
+
+    def submit(self, champion: Champion, lane: Optional[Lanes] = None) -> None:
+        """
+        Sends a decision to the draft. Picks may choose a lane, otherwise the
+        champion goes to the first lane without a pick.
+        """
+        self.queue.put_nowait((champion, lane))
+
+    async def get_decision(
+        self, action: PBAction, timeout: Optional[float]
+    ) -> Optional[tuple[Champion, Optional[Lanes]]]:
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        self.waiting = action
+        try:
+            while True:
+                remaining = None if deadline is None else deadline - loop.time()
+                try:
+                    champion, lane = await asyncio.wait_for(self.queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    return None
+
+                if champion in self.ai.pool and (
+                    action == PBAction.BAN
+                    or lane is None
+                    or self.ai.picks[lane] is None
+                ):
+                    return champion, lane
+        finally:
+            self.waiting = None
+
+    async def pick_async(self) -> None:
+        decision = await self.get_decision(PBAction.PICK, self.pick_timeout)
+        if decision is None:
+            self.ai.pick()
+            return
+
+        champion, lane = decision
+        if lane is None:
+            lane = next(lane for lane in Lanes if self.ai.picks[lane] is None)
+        self.ai.picks[lane] = champion
+        self.ai.pool.pick(champion)
+        self.ai.team.picks.append(champion)
+
+    async def ban_async(self) -> None:
+        decision = await self.get_decision(PBAction.BAN, self.ban_timeout)
+        if decision is None:
+            self.ai.ban()
+            return
+
+        champion, _ = decision
+        self.ai.pool.ban(champion)
+        self.ai.team.bans.append(champion)
+
+    def pick(self):
+        raise DraftError("Async inputs can only be used with PicksBans.run_async!")
+
+    def ban(self):
+        raise DraftError("Async inputs can only be used with PicksBans.run_async!")
+
+    def finalize(self):
+        self.ai.finalize()
@@ -0,0 +1,310 @@
+#  eSports Manager - free and open source eSports Management game
+#  Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import math
+import random
+import time
+from array import array
+from dataclasses import dataclass
+from itertools import permutations
+from typing import Optional
+
+from esm.core.esports.moba.champion import Champion
+from esm.core.esports.moba.mobaplayer import Lanes
+from esm.core.esports.moba.mobateam import MobaTeamSimulation
+from esm.core.esports.moba.simulation.draft_pool import DraftChampionPool, DraftError
+from esm.core.esports.moba.simulation.moba_event_base import get_win_probability
+from esm.core.esports.moba.simulation.picksbans import (
+    DRAFT_ORDER,
+    PBAction,
+    PickBanInput,
+    PicksBans,
+)
+from esm.core.utils.seed import get_rng
+
+LANES = list(Lanes)
+
+
+@dataclass(frozen=True)
+class DraftState:
+    """
+    Hashable state of a draft: the status of every champion ID, as stored by the
+    DraftChampionPool, the sorted champion IDs picked by each team and the index of
+    the next action in DRAFT_ORDER.
+    """
+
+    status: bytes
+    picks: tuple[tuple[int, ...], tuple[int, ...]]
+    step: int
+
+    def is_over(self) -> bool:
+        return self.step >= len(DRAFT_ORDER)
+
+    def apply(self, champion: int) -> "DraftState":
+        team, action = DRAFT_ORDER[self.step]
+        status = bytearray(self.status)
+        picks = list(self.picks)
+        if action == PBAction.PICK:
+            status[champion] = DraftChampionPool.PICKED
+            picks[team] = tuple(sorted(picks[team] + (champion,)))
+        else:
+            status[champion] = DraftChampionPool.BANNED
+
+        return DraftState(bytes(status), (picks[0], picks[1]), self.step + 1)
+
+
+class DraftNode:
+    __slots__ = ("state", "children", "untried", "visits", "value")
+
+    def __init__(self, state: DraftState, actions: list[int]):
+        self.state = state
+        self.children: dict[int, DraftNode] = {}
+        self.untried = actions
+        self.visits = 0
+        self.value = 0.0
+
+
+class PicksBansMCTS(PickBanInput):
+    """
+    Draft AI that searches the pick and ban order with Monte Carlo tree search.
+
+    Every decision runs until the iteration budget or the time budget (in seconds)
+    is used up, whichever comes first, so draft quality scales with the budget and
+    a time budget bounds how long a single pick or ban takes.
+
+    Only the best available champions of each lane are considered as actions. A
+    leaf is scored by filling the empty lanes of both teams with their best
+    available champion, and comparing the total skill of both teams with the same
+    win probability used by the match events. Scores are cached in a transposition
+    table, and nodes are indexed by draft state, so the subtree of the actual draft
+    is reused by the next decision.
+    """
+
+    def __init__(
+        self,
+        team: MobaTeamSimulation,
+        opposing_team: MobaTeamSimulation,
+        iterations: Optional[int] = 500,
+        time_budget: Optional[float] = None,
+        candidates: int = 5,
+        exploration: float = 1.0,
+        rng: Optional[random.Random] = None,
+    ):
+        if iterations is None and time_budget is None:
+            raise DraftError("MCTS needs an iteration budget or a time budget!")
+
+        self.team = team
+        self.opposing_team = opposing_team
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.candidates = candidates
+        self.exploration = exploration
+        self.rng = get_rng(rng)
+        self.pool: Optional[DraftChampionPool] = None
+        self.teams: list[MobaTeamSimulation] = []
+        self.side = 0
+        self.player_skill: list[float] = [0.0, 0.0]
+        self.champion_skill: list[dict[Lanes, array]] = []
+        self.rankings: list[dict[Lanes, list[int]]] = []
+        self.nodes: dict[DraftState, DraftNode] = {}
+        self.evaluations: dict[DraftState, float] = {}
+
+    def start(self, picks_bans: PicksBans) -> None:
+        self.pool = picks_bans.pool
+        self.teams = [picks_bans.team1, picks_bans.team2]
+        self.side = 0 if picks_bans.team1 is self.team else 1
+        champions = self.pool.registry.champions
+        self.player_skill = [
+            sum(player.skill for player in team.players) for team in self.teams
+        ]
+        self.champion_skill = [
+            {
+                lane: picks_bans.skill_matrix.get_row(team.player_lanes[lane])
+                for lane in LANES
+            }
+            for team in self.teams
+        ]
+        self.rankings = [
+            {
+                lane: sorted(
+                    range(len(champions)), key=lambda index: -skill[lane][index]
+                )
+                for lane in LANES
+            }
+            for skill in self.champion_skill
+        ]
+        self.nodes = {}
+        self.evaluations = {}
+
+    def get_state(self) -> DraftState:
+        registry = self.pool.registry
+        picks = tuple(
+            tuple(sorted(registry.get_index(ch.champion_id) for ch in team.picks))
+            for team in self.teams
+        )
+        step = sum(len(team.picks) + len(team.bans) for team in self.teams)
+        return DraftState(self.pool.get_state(), picks, step)
+
+    def get_best_available(self, team: int, lane: Lanes, status: bytes) -> int:
+        for index in self.rankings[team][lane]:
+            if status[index] == DraftChampionPool.AVAILABLE:
+                return index
+
+        return -1
+
+    def get_actions(self, state: DraftState) -> list[int]:
+        if state.is_over():
+            return []
+
+        team, action = DRAFT_ORDER[state.step]
+        if action == PBAction.BAN:
+            team = 1 - team
+
+        actions = {}
+        for lane in LANES:
+            found = 0
+            for index in self.rankings[team][lane]:
+                if found == self.candidates:
+                    break
+                if state.status[index] == DraftChampionPool.AVAILABLE:
+                    actions[index] = None
+                    found += 1
+
+        return list(actions)
+
+    def assign_lanes(
+        self, team: int, picks: tuple[int, ...], status: bytes
+    ) -> tuple[float, dict[Lanes, int]]:
+        """
+        Assigns the picks to the lanes where they add the most skill, filling the
+        remaining lanes with the best available champion. Champions used to fill
+        lanes may repeat, which is good enough to score a draft.
+        """
+        skill = self.champion_skill[team]
+        best_available = {
+            lane: self.get_best_available(team, lane, status) for lane in LANES
+        }
+        best_total = -1.0
+        best_lanes = {}
+        for lanes in permutations(LANES, len(picks)):
+            lane_picks = dict(best_available)
+            lane_picks.update(zip(lanes, picks))
+            total = sum(
+                skill[lane][index] for lane, index in lane_picks.items() if index != -1
+            )
+            if total > best_total:
+                best_total = total
+                best_lanes = lane_picks
+
+        return best_total, best_lanes
+
+    def evaluate(self, state: DraftState) -> float:
+        """
+        Win probability of this AI's team, cached in the transposition table.
+        """
+        if state not in self.evaluations:
+            skill = [
+                self.player_skill[team]
+                + self.assign_lanes(team, state.picks[team], state.status)[0]
+                for team in range(2)
+            ]
+            self.evaluations[state] = get_win_probability(
+                skill[self.side], skill[1 - self.side]
+            )
+
+        return self.evaluations[state]
+
+    def get_node(self, state: DraftState) -> DraftNode:
+        if state not in self.nodes:
+            self.nodes[state] = DraftNode(state, self.get_actions(state))
+
+        return self.nodes[state]
+
+    def select_child(self, node: DraftNode) -> DraftNode:
+        is_own_action = DRAFT_ORDER[node.state.step][0] == self.side
+        log_visits = math.log(node.visits)
+
+        def score(child: DraftNode) -> float:
+            mean = child.value / child.visits
+            if not is_own_action:
+                mean = 1.0 - mean
+            return mean + self.exploration * math.sqrt(log_visits / child.visits)
+
+        return max(node.children.values(), key=score)
+
+    def run_iteration(self, root: DraftNode) -> None:
+        node = root
+        path = [node]
+        while not node.untried and node.children:
+            node = self.select_child(node)
+            path.append(node)
+
+        if node.untried:
+            position = self.rng.randrange(len(node.untried))
+            node.untried[position], node.untried[-1] = (
+                node.untried[-1],
+                node.untried[position],
+            )
+            action = node.untried.pop()
+            child = self.get_node(node.state.apply(action))
+            node.children[action] = child
+            path.append(child)
+            node = child
+
+        value = self.evaluate(node.state)
+        for visited in path:
+            visited.visits += 1
+            visited.value += value
+
+    def search(self) -> Champion:
+        root = self.get_node(self.get_state())
+        if not root.untried and not root.children:
+            raise DraftError("There are no champions left to pick or ban!")
+
+        deadline = None
+        if self.time_budget is not None:
+            deadline = time.perf_counter() + self.time_budget
+
+        iteration = 0
+        while self.iterations is None or iteration < self.iterations:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            self.run_iteration(root)
+            iteration += 1
+
+        if root.children:
+            action = max(root.children, key=lambda index: root.children[index].visits)
+        else:
+            action = root.untried[0]
+
+        return self.pool.registry[action]
+
+    def pick(self):
+        champion = self.search()
+        self.pool.pick(champion)
+        self.team.picks.append(champion)
+
+    def ban(self):
+        champion = self.search()
+        self.pool.ban(champion)
+        self.team.bans.append(champion)
+
+    def finalize(self):
+        registry = self.pool.registry
+        picks = tuple(registry.get_index(ch.champion_id) for ch in self.team.picks)
+        _, lanes = self.assign_lanes(self.side, picks, self.pool.get_state())
+        for lane, index in lanes.items():
+            if index in picks:
+                self.team.player_lanes[lane].champion = registry[index]
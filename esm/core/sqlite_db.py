@@ -0,0 +1,577 @@
+#      eSports Manager - free and open source eSports Management game
+#      Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import json
+import sqlite3
+import uuid
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .esports.moba.champion import Champion
+from .esports.moba.mobamatch import MobaMatch, MobaMatchResult
+from .esports.moba.mobaplayer import Lanes, MobaPlayer
+from .esports.moba.mobaregion import MobaRegion
+from .esports.moba.mobateam import MobaTeam
+
+
+class SQLiteDBError(Exception):
+    pass
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS champions (
+    champion_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    skill INTEGER NOT NULL,
+    scaling_factor REAL NOT NULL,
+    scaling_peak INTEGER NOT NULL,
+    lane TEXT NOT NULL,
+    lanes TEXT NOT NULL,
+    difficulty INTEGER NOT NULL,
+    type1 INTEGER NOT NULL,
+    type2 INTEGER
+);
+CREATE INDEX IF NOT EXISTS champions_lane ON champions (lane);
+
+CREATE TABLE IF NOT EXISTS players (
+    player_id TEXT PRIMARY KEY,
+    nationality TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    birthday TEXT NOT NULL,
+    nick_name TEXT NOT NULL,
+    lane TEXT NOT NULL,
+    lanes TEXT NOT NULL,
+    attributes TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS players_lane ON players (lane);
+CREATE INDEX IF NOT EXISTS players_nationality ON players (nationality);
+
+CREATE TABLE IF NOT EXISTS champion_mastery (
+    player_id TEXT NOT NULL REFERENCES players (player_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    champion_id TEXT NOT NULL REFERENCES champions (champion_id),
+    mastery INTEGER NOT NULL,
+    total_exp REAL NOT NULL,
+    PRIMARY KEY (player_id, position)
+);
+CREATE INDEX IF NOT EXISTS champion_mastery_champion
+    ON champion_mastery (champion_id);
+
+CREATE TABLE IF NOT EXISTS regions (
+    region_id TEXT PRIMARY KEY,
+    region TEXT NOT NULL,
+    name TEXT NOT NULL,
+    short_name TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS teams (
+    team_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    nationality TEXT NOT NULL,
+    region_id TEXT REFERENCES regions (region_id)
+);
+CREATE INDEX IF NOT EXISTS teams_nationality ON teams (nationality);
+CREATE INDEX IF NOT EXISTS teams_region ON teams (region_id);
+
+CREATE TABLE IF NOT EXISTS rosters (
+    team_id TEXT NOT NULL REFERENCES teams (team_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    player_id TEXT NOT NULL REFERENCES players (player_id),
+    PRIMARY KEY (team_id, position)
+);
+CREATE INDEX IF NOT EXISTS rosters_player ON rosters (player_id);
+
+CREATE TABLE IF NOT EXISTS matches (
+    game_id TEXT PRIMARY KEY,
+    championship_id TEXT NOT NULL,
+    team1_id TEXT NOT NULL REFERENCES teams (team_id),
+    team2_id TEXT NOT NULL REFERENCES teams (team_id),
+    date TEXT NOT NULL,
+    victorious_team_id TEXT REFERENCES teams (team_id),
+    match_time INTEGER,
+    event_log BLOB
+);
+CREATE INDEX IF NOT EXISTS matches_championship ON matches (championship_id);
+CREATE INDEX IF NOT EXISTS matches_team1 ON matches (team1_id);
+CREATE INDEX IF NOT EXISTS matches_team2 ON matches (team2_id);
+"""
+
+
+class SQLiteDB:
+    """
+    Game database stored in a SQLite file.
+
+    Values that are searched for, such as IDs, the player's main lane and
+    nationality, have their own indexed columns, and the rest of each entity is
+    stored the same way it is serialized. IDs are stored as hex strings. Player
+    champion pools are kept in the champion_mastery table and team rosters in the
+    rosters table, both in their original order.
+
+    Inserts take iterables and run in a single transaction, so large worlds can be
+    written in bulk without building every row first.
+    """
+
+    def __init__(self, path: Path | str = ":memory:"):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "SQLiteDB":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    # Inserts
+    def _insert_champions(self, champions: Iterable[Champion]) -> None:
+        self.connection.executemany(
+            "INSERT INTO champions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    champion.champion_id.hex,
+                    champion.name,
+                    champion.skill,
+                    champion.scaling_factor,
+                    champion.scaling_peak,
+                    champion.lanes.get_best_attribute().name,
+                    json.dumps(champion.lanes.serialize()),
+                    champion.champion_difficulty.value,
+                    champion.champion_type1.value,
+                    (
+                        champion.champion_type2.value
+                        if champion.champion_type2 is not None
+                        else None
+                    ),
+                )
+                for champion in champions
+            ),
+        )
+
+    def _insert_players(self, players: Iterable[MobaPlayer]) -> None:
+        mastery_rows = []
+        player_rows = []
+        for player in players:
+            player_id = player.player_id.hex
+            player_rows.append(
+                (
+                    player_id,
+                    player.nationality,
+                    player.first_name,
+                    player.last_name,
+                    "{:%Y-%m-%d}".format(player.birthday),
+                    player.nick_name,
+                    player.lanes.get_best_attribute().name,
+                    json.dumps(player.lanes.serialize()),
+                    json.dumps(player.attributes.serialize()),
+                )
+            )
+            mastery_rows.extend(
+                (
+                    player_id,
+                    position,
+                    champion.champion_id.hex,
+                    champion.mastery.value,
+                    champion.total_exp,
+                )
+                for position, champion in enumerate(player.champion_pool)
+            )
+
+        self.connection.executemany(
+            "INSERT INTO players VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", player_rows
+        )
+        self.connection.executemany(
+            "INSERT INTO champion_mastery VALUES (?, ?, ?, ?, ?)", mastery_rows
+        )
+
+    def _insert_teams(
+        self, teams: Iterable[MobaTeam], region_id: Optional[uuid.UUID] = None
+    ) -> None:
+        region = region_id.hex if region_id is not None else None
+        roster_rows = []
+        team_rows = []
+        for team in teams:
+            team_rows.append((team.team_id.hex, team.name, team.nationality, region))
+            roster_rows.extend(
+                (team.team_id.hex, position, player.player_id.hex)
+                for position, player in enumerate(team.roster)
+            )
+
+        self.connection.executemany("INSERT INTO teams VALUES (?, ?, ?, ?)", team_rows)
+        self.connection.executemany("INSERT INTO rosters VALUES (?, ?, ?)", roster_rows)
+
+    def insert_champions(self, champions: Iterable[Champion]) -> None:
+        with self.connection:
+            self._insert_champions(champions)
+
+    def insert_players(self, players: Iterable[MobaPlayer]) -> None:
+        """
+        Inserts the players and their champion pools. Champions must be inserted
+        first.
+        """
+        with self.connection:
+            self._insert_players(players)
+
+    def insert_teams(
+        self, teams: Iterable[MobaTeam], region_id: Optional[uuid.UUID] = None
+    ) -> None:
+        """
+        Inserts the teams and their rosters. Players must be inserted first.
+        """
+        with self.connection:
+            self._insert_teams(teams, region_id)
+
+    def insert_world(
+        self,
+        champions: Iterable[Champion],
+        regions: Iterable[MobaRegion],
+        players: Optional[Iterable[MobaPlayer]] = None,
+    ) -> None:
+        """
+        Inserts the champions and the regions with their teams in one transaction.
+        The players of every roster are inserted too, unless the players are given,
+        e.g. to include free agents.
+        """
+        regions = list(regions)
+        if players is None:
+            players = (
+                player
+                for region in regions
+                for team in region.teams
+                for player in team.roster
+            )
+
+        with self.connection:
+            self._insert_champions(champions)
+            self._insert_players(players)
+            self.connection.executemany(
+                "INSERT INTO regions VALUES (?, ?, ?, ?)",
+                (
+                    (
+                        region.region_id.hex,
+                        region.region,
+                        region.name,
+                        region.short_name,
+                    )
+                    for region in regions
+                ),
+            )
+            for region in regions:
+                self._insert_teams(region.teams, region.region_id)
+
+    def insert_matches(self, matches: Iterable[MobaMatch]) -> None:
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO matches VALUES (?, ?, ?, ?, ?, ?, NULL, NULL)",
+                (
+                    (
+                        match.game_id.hex,
+                        match.championship_id.hex,
+                        match.team1.team_id.hex,
+                        match.team2.team_id.hex,
+                        match.date.strftime("%Y-%m-%d, %H:%M"),
+                        (
+                            match.victorious_team.team_id.hex
+                            if match.victorious_team is not None
+                            else None
+                        ),
+                    )
+                    for match in matches
+                ),
+            )
+
+    def insert_match_results(self, results: Iterable[MobaMatchResult]) -> None:
+        with self.connection:
+            self.connection.executemany(
+                """
+                UPDATE matches
+                SET victorious_team_id = ?, match_time = ?, event_log = ?
+                WHERE game_id = ?
+                """,
+                (
+                    (
+                        result.victorious_team_id.hex,
+                        result.match_time,
+                        result.event_log,
+                        result.game_id.hex,
+                    )
+                    for result in results
+                ),
+            )
+
+    # Lookups
+    @staticmethod
+    def _get_champion_from_row(row: sqlite3.Row) -> Champion:
+        return Champion.get_from_dict(
+            {
+                "id": row["champion_id"],
+                "name": row["name"],
+                "skill": row["skill"],
+                "scaling_factor": row["scaling_factor"],
+                "scaling_peak": row["scaling_peak"],
+                "lanes": json.loads(row["lanes"]),
+                "difficulty": row["difficulty"],
+                "type1": row["type1"],
+                "type2": row["type2"],
+            }
+        )
+
+    def get_champion(self, champion_id: uuid.UUID) -> Optional[Champion]:
+        row = self.connection.execute(
+            "SELECT * FROM champions WHERE champion_id = ?", (champion_id.hex,)
+        ).fetchone()
+        return self._get_champion_from_row(row) if row is not None else None
+
+    def get_champions(self, lane: Optional[Lanes] = None) -> list[Champion]:
+        if lane is None:
+            rows = self.connection.execute("SELECT * FROM champions")
+        else:
+            rows = self.connection.execute(
+                "SELECT * FROM champions WHERE lane = ?", (lane.name,)
+            )
+        return [self._get_champion_from_row(row) for row in rows]
+
+    def _get_players(self, condition: str, parameters: tuple) -> list[MobaPlayer]:
+        """
+        Loads the players that match the condition, along with their champion pools,
+        with one query for each table. The condition refers to the players table,
+        aliased as p.
+        """
+        champion_pools: dict[str, list[dict]] = {}
+        for row in self.connection.execute(
+            f"""
+            SELECT m.* FROM champion_mastery AS m
+            JOIN players AS p ON p.player_id = m.player_id
+            WHERE {condition}
+            ORDER BY m.player_id, m.position
+            """,
+            parameters,
+        ):
+            champion_pools.setdefault(row["player_id"], []).append(
+                {
+                    "champion_id": row["champion_id"],
+                    "mastery": row["mastery"],
+                    "total_exp": row["total_exp"],
+                }
+            )
+
+        return [
+            MobaPlayer.get_from_dict(
+                {
+                    "id": row["player_id"],
+                    "nationality": row["nationality"],
+                    "first_name": row["first_name"],
+                    "last_name": row["last_name"],
+                    "birthday": row["birthday"],
+                    "nick_name": row["nick_name"],
+                    "lanes": json.loads(row["lanes"]),
+                    "attributes": json.loads(row["attributes"]),
+                    "champion_pool": champion_pools.get(row["player_id"], []),
+                }
+            )
+            for row in self.connection.execute(
+                f"SELECT p.* FROM players AS p WHERE {condition}", parameters
+            )
+        ]
+
+    def get_player(self, player_id: uuid.UUID) -> Optional[MobaPlayer]:
+        players = self._get_players("p.player_id = ?", (player_id.hex,))
+        return players[0] if players else None
+
+    def get_players_by_lane(self, lane: Lanes) -> list[MobaPlayer]:
+        return self._get_players("p.lane = ?", (lane.name,))
+
+    def get_players_by_nationality(self, nationality: str) -> list[MobaPlayer]:
+        return self._get_players("p.nationality = ?", (nationality,))
+
+    def get_players_by_team(self, team_id: uuid.UUID) -> list[MobaPlayer]:
+        """
+        Returns the team's roster in order.
+        """
+        roster = [
+            row["player_id"]
+            for row in self.connection.execute(
+                "SELECT player_id FROM rosters WHERE team_id = ? ORDER BY position",
+                (team_id.hex,),
+            )
+        ]
+        players = {
+            player.player_id.hex: player
+            for player in self._get_players(
+                "p.player_id IN (SELECT player_id FROM rosters WHERE team_id = ?)",
+                (team_id.hex,),
+            )
+        }
+        return [players[player_id] for player_id in roster]
+
+    def get_free_agents(self) -> list[MobaPlayer]:
+        return self._get_players(
+            "p.player_id NOT IN (SELECT player_id FROM rosters)", ()
+        )
+
+    def _get_teams(self, condition: str, parameters: tuple) -> list[MobaTeam]:
+        """
+        Loads the teams that match the condition, along with their rosters, with one
+        query for the teams, one for the rosters and the player queries. The
+        condition refers to the teams table, aliased as t.
+        """
+        team_rows = self.connection.execute(
+            f"SELECT t.* FROM teams AS t WHERE {condition}", parameters
+        ).fetchall()
+        rosters: dict[str, list[str]] = {}
+        for row in self.connection.execute(
+            f"""
+            SELECT r.team_id, r.player_id FROM rosters AS r
+            JOIN teams AS t ON t.team_id = r.team_id
+            WHERE {condition}
+            ORDER BY r.team_id, r.position
+            """,
+            parameters,
+        ):
+            rosters.setdefault(row["team_id"], []).append(row["player_id"])
+
+        players = {
+            player.player_id.hex: player
+            for player in self._get_players(
+                f"""
+                p.player_id IN (
+                    SELECT r.player_id FROM rosters AS r
+                    JOIN teams AS t ON t.team_id = r.team_id
+                    WHERE {condition}
+                )
+                """,
+                parameters,
+            )
+        }
+        return [
+            MobaTeam(
+                uuid.UUID(hex=row["team_id"]),
+                row["name"],
+                row["nationality"],
+                [players[player_id] for player_id in rosters.get(row["team_id"], [])],
+            )
+            for row in team_rows
+        ]
+
+    def get_team(self, team_id: uuid.UUID) -> Optional[MobaTeam]:
+        teams = self._get_teams("t.team_id = ?", (team_id.hex,))
+        return teams[0] if teams else None
+
+    def get_team_by_player(self, player_id: uuid.UUID) -> Optional[MobaTeam]:
+        teams = self._get_teams(
+            "t.team_id IN (SELECT team_id FROM rosters WHERE player_id = ?)",
+            (player_id.hex,),
+        )
+        return teams[0] if teams else None
+
+    def get_teams(self) -> list[MobaTeam]:
+        return self._get_teams("1", ())
+
+    def get_teams_by_nationality(self, nationality: str) -> list[MobaTeam]:
+        return self._get_teams("t.nationality = ?", (nationality,))
+
+    def get_region(self, region_id: uuid.UUID) -> Optional[MobaRegion]:
+        row = self.connection.execute(
+            "SELECT * FROM regions WHERE region_id = ?", (region_id.hex,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        return MobaRegion(
+            region_id,
+            row["region"],
+            row["name"],
+            row["short_name"],
+            self._get_teams("t.region_id = ?", (region_id.hex,)),
+        )
+
+    def _get_matches(self, condition: str, parameters: tuple) -> list[MobaMatch]:
+        """
+        Loads the matches that match the condition, ordered by date, and every team
+        that plays in them with a fixed number of queries. The condition refers to
+        the matches table, aliased as m.
+        """
+        rows = self.connection.execute(
+            f"SELECT m.* FROM matches AS m WHERE {condition} ORDER BY m.date",
+            parameters,
+        ).fetchall()
+        if not rows:
+            return []
+
+        teams = {
+            team.team_id.hex: team
+            for team in self._get_teams(
+                f"""
+                t.team_id IN (
+                    SELECT m.team1_id FROM matches AS m WHERE {condition}
+                    UNION
+                    SELECT m.team2_id FROM matches AS m WHERE {condition}
+                )
+                """,
+                parameters + parameters,
+            )
+        }
+        matches = []
+        for row in rows:
+            team1 = teams.get(row["team1_id"])
+            team2 = teams.get(row["team2_id"])
+            if team1 is None or team2 is None:
+                raise SQLiteDBError(
+                    f"Match {row['game_id']} has a team that does not exist!"
+                )
+
+            matches.append(
+                MobaMatch.get_from_dict(
+                    {
+                        "game_id": row["game_id"],
+                        "championship_id": row["championship_id"],
+                        "date": row["date"],
+                        "victorious_team": row["victorious_team_id"],
+                    },
+                    team1,
+                    team2,
+                )
+            )
+
+        return matches
+
+    def get_match(self, game_id: uuid.UUID) -> Optional[MobaMatch]:
+        matches = self._get_matches("m.game_id = ?", (game_id.hex,))
+        return matches[0] if matches else None
+
+    def get_match_result(self, game_id: uuid.UUID) -> Optional[MobaMatchResult]:
+        row = self.connection.execute(
+            "SELECT * FROM matches WHERE game_id = ? AND event_log IS NOT NULL",
+            (game_id.hex,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        return MobaMatchResult(
+            game_id,
+            uuid.UUID(hex=row["victorious_team_id"]),
+            row["match_time"],
+            row["event_log"],
+        )
+
+    def get_matches_by_team(self, team_id: uuid.UUID) -> list[MobaMatch]:
+        return self._get_matches(
+            "m.team1_id = ? OR m.team2_id = ?", (team_id.hex, team_id.hex)
+        )
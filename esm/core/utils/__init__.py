@@ -17,6 +17,7 @@
 import json
 import os
 import re
+from datetime import timedelta
 from pathlib import Path
 from typing import Union
 from unicodedata import normalize
@@ -95,6 +96,17 @@ def normalize_filename(filename, delim="_") -> str:
     return f"{filename}.cbor"
 
 
+def get_seconds(value: Union[int, timedelta]) -> int:
+    """
+    Converts a match time to seconds. The simulation keeps its clock as an integer
+    amount of seconds, and timedelta is only used when results are shown.
+    """
+    if isinstance(value, timedelta):
+        return int(value.total_seconds())
+
+    return value
+
+
 def get_nations(
     names: list[dict[str, dict[str, str | int]]]
 ) -> list[dict[str, str | int]]:
@@ -103,3 +115,7 @@ def get_nations(
 
 def get_default_names_file() -> Path:
     return ROOT_DIR / "res" / "definitions" / "names.json"
+
+
+def get_default_nick_names_file() -> Path:
+    return ROOT_DIR / "res" / "definitions" / "nick_names.txt"
@@ -0,0 +1,67 @@
+#      eSports Manager - free and open source eSports Management game
+#      Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+# Read-only data shared by every task of a worker process, e.g. the champions. It
+# is sent once to each worker instead of with every task.
+_worker_context: Any = None
+
+
+def _init_worker(context: Any) -> None:
+    global _worker_context
+    _worker_context = context
+
+
+def get_worker_context() -> Any:
+    return _worker_context
+
+
+def create_process_pool(
+    context: Any, max_workers: Optional[int] = None
+) -> ProcessPoolExecutor:
+    """
+    Creates a process pool whose workers can read the context with
+    get_worker_context.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(context,)
+    )
+
+
+def map_bounded(
+    executor: ProcessPoolExecutor,
+    function: Callable,
+    tasks: Iterable[tuple],
+    max_workers: Optional[int] = None,
+) -> Iterator:
+    """
+    Same as executor.map, but tasks are only submitted a few at a time ahead of the
+    result being consumed, so finished results do not pile up in memory when the
+    consumer is slower than the workers. Results are yielded in the order of the
+    tasks.
+    """
+    max_pending = 2 * (max_workers or os.cpu_count() or 1)
+    pending: deque[Future] = deque()
+    for task in tasks:
+        pending.append(executor.submit(function, *task))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
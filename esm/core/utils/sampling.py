@@ -0,0 +1,163 @@
+#      eSports Manager - free and open source eSports Management game
+#      Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import random
+from collections.abc import Iterable
+
+
+class SamplerError(Exception):
+    pass
+
+
+def check_weights(weights: list[float]) -> None:
+    if any(weight < 0 for weight in weights):
+        raise SamplerError("Weights cannot be negative!")
+
+
+class WeightedSampler:
+    """
+    Draws indexes with probability proportional to their weights.
+
+    Weights are stored in a Fenwick tree, so drawing an index and updating a weight
+    are both O(log n) and the cumulative weights never need to be rebuilt. Setting
+    a weight to 0 removes its index from the draws.
+    """
+
+    def __init__(self, weights: Iterable[float]):
+        self.weights = [float(weight) for weight in weights]
+        check_weights(self.weights)
+        self.size = len(self.weights)
+        self.top_bit = 1 << (self.size.bit_length() - 1) if self.size else 0
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        self.tree = [0.0] + self.weights
+        for i in range(1, self.size + 1):
+            parent = i + (i & -i)
+            if parent <= self.size:
+                self.tree[parent] += self.tree[i]
+
+        self.non_zero = sum(1 for weight in self.weights if weight > 0)
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def total(self) -> float:
+        if self.non_zero == 0:
+            return 0.0
+
+        total = 0.0
+        i = self.size
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def get_weight(self, index: int) -> float:
+        return self.weights[index]
+
+    def update(self, index: int, weight: float) -> None:
+        if weight < 0:
+            raise SamplerError("Weights cannot be negative!")
+
+        old_weight = self.weights[index]
+        self.non_zero += (weight > 0) - (old_weight > 0)
+        self.weights[index] = weight
+        delta = weight - old_weight
+        i = index + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def remove(self, index: int) -> None:
+        self.update(index, 0.0)
+
+    def find(self, target: float) -> int:
+        """
+        Returns the index where the cumulative weight goes over the target.
+        """
+        position = 0
+        bit = self.top_bit
+        while bit:
+            next_position = position + bit
+            if next_position <= self.size and self.tree[next_position] <= target:
+                position = next_position
+                target -= self.tree[next_position]
+            bit >>= 1
+
+        return min(position, self.size - 1)
+
+    def sample(self, rng: random.Random) -> int:
+        if self.non_zero == 0:
+            raise SamplerError("Cannot sample when every weight is zero!")
+
+        index = self.find(rng.random() * self.total)
+        rebuilt = False
+        while self.weights[index] == 0:
+            # Many updates can accumulate rounding errors in the tree, which may
+            # point a draw at a removed index
+            if not rebuilt:
+                self.rebuild()
+                rebuilt = True
+            index = self.find(rng.random() * self.total)
+
+        return index
+
+
+class AliasSampler:
+    """
+    Draws indexes with probability proportional to static weights.
+
+    Uses Vose's alias method: building the tables is O(n), and each draw is O(1)
+    with a single random number.
+    """
+
+    def __init__(self, weights: Iterable[float]):
+        weights = [float(weight) for weight in weights]
+        check_weights(weights)
+        total = sum(weights)
+        if total <= 0:
+            raise SamplerError("The total weight must be greater than zero!")
+
+        self.size = len(weights)
+        self.probabilities = [weight * self.size / total for weight in weights]
+        self.aliases = list(range(self.size))
+        small = [i for i, prob in enumerate(self.probabilities) if prob < 1.0]
+        large = [i for i, prob in enumerate(self.probabilities) if prob >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.aliases[less] = more
+            self.probabilities[more] -= 1.0 - self.probabilities[less]
+            if self.probabilities[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # Leftovers only differ from 1.0 by rounding errors
+        for i in small + large:
+            self.probabilities[i] = 1.0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def sample(self, rng: random.Random) -> int:
+        value = rng.random() * self.size
+        index = int(value)
+        if value - index < self.probabilities[index]:
+            return index
+
+        return self.aliases[index]
@@ -0,0 +1,67 @@
+#      eSports Manager - free and open source eSports Management game
+#      Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import hashlib
+import random
+import uuid
+from typing import Optional, Union
+
+SeedKey = Union[int, str]
+
+
+class SeedTree:
+    """
+    Splittable tree of seeds derived from a master seed.
+
+    Each node is identified by the master seed and the path of keys used to reach
+    it, so spawning the same path always gives the same seed, no matter the order
+    in which nodes are spawned or which process spawns them. This lets every match,
+    draft or generator get its own independent random stream, e.g.:
+
+        tree = SeedTree(1234)
+        rng = tree.spawn("season", 2024, "match", 17).get_rng()
+    """
+
+    def __init__(self, master_seed: int, path: tuple[SeedKey, ...] = ()):
+        self.master_seed = master_seed
+        self.path = path
+
+    @property
+    def seed(self) -> int:
+        key = repr((self.master_seed, self.path)).encode("utf-8")
+        return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+    def spawn(self, *keys: SeedKey) -> "SeedTree":
+        return SeedTree(self.master_seed, self.path + keys)
+
+    def get_rng(self) -> random.Random:
+        return random.Random(self.seed)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.master_seed}, {self.path})"
+
+
+def get_rng(rng: Optional[random.Random] = None) -> random.Random:
+    """
+    Returns the RNG passed to a component, or a new unseeded one if there is none.
+    """
+    return rng if rng is not None else random.Random()
+
+
+def generate_uuid(rng: random.Random) -> uuid.UUID:
+    """
+    Generates a random (version 4) UUID from the RNG, so IDs can be reproduced.
+    """
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
@@ -0,0 +1,92 @@
+#      eSports Manager - free and open source eSports Management game
+#      Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import random
+import uuid
+
+import pytest
+
+from esm.core.esports.moba.champion import Champion
+from esm.core.esports.moba.championship import Championship
+from esm.core.esports.moba.championship_executor import ChampionshipExecutor
+from esm.core.esports.moba.mobamatch import InvalidTeamId
+from esm.core.esports.moba.mobateam import MobaTeam
+from esm.core.utils.seed import SeedTree
+
+
+@pytest.fixture
+def championship(mock_moba_teams: list[MobaTeam]) -> Championship:
+    championship = Championship(
+        "Championship", uuid.UUID(int=1), "Korea", mock_moba_teams, random.Random(1)
+    )
+    championship.schedule_matches()
+    return championship
+
+
+def test_schedule_matches(championship: Championship):
+    teams = championship.teams
+    assert len(championship.matches) == len(teams) * (len(teams) - 1)
+    for _, count in championship.count_matches_per_team():
+        assert count == 2 * (len(teams) - 1)
+
+
+def test_get_rounds(championship: Championship):
+    rounds = championship.get_rounds()
+    assert sum(len(matches) for matches in rounds) == len(championship.matches)
+    for matches in rounds:
+        teams = [
+            team.team_id for match in matches for team in [match.team1, match.team2]
+        ]
+        assert len(teams) == len(set(teams))
+
+
+def test_get_match(championship: Championship):
+    for match in championship.matches:
+        assert championship.get_match(match.game_id) is match
+
+    championship.schedule_matches()
+    assert len(championship.matches_by_id) == len(championship.matches)
+    assert championship.get_match(championship.matches[0].game_id) is (
+        championship.matches[0]
+    )
+    with pytest.raises(KeyError):
+        championship.get_match(uuid.uuid4())
+
+
+def test_apply_invalid_result(championship: Championship):
+    with pytest.raises(InvalidTeamId):
+        championship.apply_result(championship.matches[0].game_id, uuid.uuid4())
+
+
+def test_championship_executor(
+    championship: Championship, mock_champions: list[Champion]
+):
+    executor = ChampionshipExecutor(
+        championship, mock_champions, SeedTree(1234), max_workers=2
+    )
+    results = executor.run()
+    assert len(results) == len(championship.matches)
+    assert all(match.victorious_team is not None for match in championship.matches)
+    assert sum(championship.points.values()) == (
+        len(championship.matches) * championship.points_per_win
+    )
+    assert championship.get_rounds() == []
+
+    points = dict(championship.points)
+    championship.reset_championship()
+    ChampionshipExecutor(
+        championship, mock_champions, SeedTree(1234), max_workers=1
+    ).run()
+    assert championship.points == points
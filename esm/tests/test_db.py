@@ -18,10 +18,11 @@ from pathlib import Path
 
 import pytest
 
-from esm.core.db import DB
+from esm.core.db import DB, StreamFileError, generate_region, read_entity_stream
 from esm.core.esports.moba.mobaregion import MobaRegion
 from esm.core.esports.moba.mobateam import MobaPlayer, MobaTeam
 from esm.core.utils import get_default_names_file, load_list_from_file
+from esm.core.utils.seed import SeedTree
 
 
 def test_generate_champion_files(
@@ -257,6 +258,168 @@ def test_extract_regions_from_region_file(
         assert len(region.teams) == len(mock_moba_team_definitions)
 
 
+def test_generate_moba_world_is_independent_of_workers(
+    db: DB,
+    mock_champion_defs: list[dict[str, str | int | float]],
+    mock_moba_team_definitions,
+    tmp_path: Path,
+) -> None:
+    regions_def = []
+    for region_id in ["testregion", "testregion2", "testregion3"]:
+        team_file = tmp_path / region_id / "teams.json"
+        team_file.parent.mkdir(parents=True)
+        with team_file.open("w", encoding="utf-8") as fp:
+            json.dump(mock_moba_team_definitions, fp)
+        regions_def.append(
+            {
+                "id": region_id,
+                "name": region_id,
+                "short_name": region_id.upper(),
+                "filename": team_file.absolute().as_posix(),
+            }
+        )
+
+    player_names = load_list_from_file(get_default_names_file())
+    worlds = [
+        db.generate_moba_world(
+            mock_champion_defs,
+            regions_def,
+            player_names,
+            seed_tree=SeedTree(1234),
+            max_workers=max_workers,
+        )
+        for max_workers in [1, 3]
+    ]
+
+    assert [region.region_id for region in worlds[0].regions] == [
+        region.region_id for region in worlds[1].regions
+    ]
+    assert db.serialize_champions(worlds[0].champions) == db.serialize_champions(
+        worlds[1].champions
+    )
+    assert db.serialize_regions(worlds[0].regions) == db.serialize_regions(
+        worlds[1].regions
+    )
+    assert db.serialize_players(worlds[0].players) == db.serialize_players(
+        worlds[1].players
+    )
+    assert len(worlds[0].teams) == 3 * len(mock_moba_team_definitions)
+    champion_ids = {champion.champion_id for champion in worlds[0].champions}
+    for player in worlds[0].players:
+        for champion in player.champion_pool:
+            assert champion.champion_id in champion_ids
+
+
+@pytest.mark.parametrize("extension", [".ndjson", ".cbor"])
+def test_generate_moba_world_streams(
+    db: DB,
+    mock_champion_defs: list[dict[str, str | int | float]],
+    mock_moba_team_definitions,
+    tmp_path: Path,
+    extension: str,
+) -> None:
+    regions_def = []
+    for region_id in ["testregion", "testregion2"]:
+        team_file = tmp_path / region_id / "teams.json"
+        team_file.parent.mkdir(parents=True)
+        with team_file.open("w", encoding="utf-8") as fp:
+            json.dump(mock_moba_team_definitions, fp)
+        regions_def.append(
+            {
+                "id": region_id,
+                "name": region_id,
+                "short_name": region_id.upper(),
+                "filename": team_file.absolute().as_posix(),
+            }
+        )
+
+    player_names = load_list_from_file(get_default_names_file())
+    files = [
+        tmp_path / "world" / f"{name}{extension}"
+        for name in ["champions", "teams", "players", "regions"]
+    ]
+    db.generate_moba_world_streams(
+        mock_champion_defs,
+        regions_def,
+        player_names,
+        *files,
+        seed_tree=SeedTree(1234),
+        max_workers=2,
+    )
+    world = db.generate_moba_world(
+        mock_champion_defs, regions_def, player_names, seed_tree=SeedTree(1234)
+    )
+
+    champions, teams, players, regions = [
+        list(read_entity_stream(file)) for file in files
+    ]
+    assert champions == [champion.serialize() for champion in world.champions]
+    assert teams == [team.serialize() for team in world.teams]
+    assert players == [player.serialize() for player in world.players]
+    assert regions == [region.serialize() for region in world.regions]
+
+
+def test_generate_moba_world_with_free_agents(
+    db: DB,
+    mock_champion_defs: list[dict[str, str | int | float]],
+    mock_moba_team_definitions,
+) -> None:
+    regions_def = [
+        {
+            "id": "testregion",
+            "name": "TestRegion",
+            "short_name": "TR",
+            "nationality": "Brazil",
+            "teams": mock_moba_team_definitions,
+            "free_agents": 7,
+        }
+    ]
+    player_names = load_list_from_file(get_default_names_file())
+    world = db.generate_moba_world(
+        mock_champion_defs, regions_def, player_names, seed_tree=SeedTree(1234)
+    )
+
+    assert len(world.teams) == len(mock_moba_team_definitions)
+    assert len(world.free_agents) == 7
+    assert world.players[-7:] == world.free_agents
+    for player in world.free_agents:
+        assert player.nationality == "Brazil"
+
+
+def test_nick_names_are_unique_in_each_region(
+    db: DB,
+    mock_champion_defs: list[dict[str, str | int | float]],
+    mock_moba_team_definitions,
+) -> None:
+    regions_def = [
+        {
+            "id": region_id,
+            "name": region_id,
+            "short_name": region_id.upper(),
+            "teams": mock_moba_team_definitions,
+            "free_agents": 50,
+        }
+        for region_id in ["testregion", "testregion2"]
+    ]
+    player_names = load_list_from_file(get_default_names_file())
+    regions = db.map_regions(
+        generate_region,
+        regions_def,
+        db.generate_moba_champions(mock_champion_defs),
+        player_names,
+        SeedTree(1234),
+        2,
+    )
+    for region, free_agents in regions:
+        players = db.get_moba_players_from_teams(region.teams) + free_agents
+        assert len({player.nick_name for player in players}) == len(players)
+
+
+def test_write_moba_stream_unsupported_file(db: DB, tmp_path: Path) -> None:
+    with pytest.raises(StreamFileError):
+        db.write_moba_stream(tmp_path / "champions.json", [])
+
+
 def test_generate_regions_file(
     db: DB,
     mock_champion_defs: list[dict[str, str | int | float]],
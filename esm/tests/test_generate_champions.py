@@ -124,6 +124,13 @@ def asserts_for_champions_from_champion_def(
         assert obtained_champion.champion_type2 != obtained_champion.champion_type1
 
 
+def test_generate_more_random_champions_than_default_names(
+    champion_gen: ChampionGenerator,
+):
+    champions = [champion_gen.generate() for _ in range(400)]
+    assert len({champion.name for champion in champions}) == 400
+
+
 def test_generate_champions_from_default_champion_defs(champion_gen: ChampionGenerator):
     champ_defs = get_default_champion_defs()
     asserts_for_champions_from_champion_def(champion_gen, champ_defs)
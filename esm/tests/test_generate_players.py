@@ -13,8 +13,17 @@
 #
 #      You should have received a copy of the GNU General Public License
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import random
+
+import pytest
+
 from esm.core.esports.moba.champion import Champion
-from esm.core.esports.moba.generator.generate_players import Lanes, MobaPlayerGenerator
+from esm.core.esports.moba.generator import get_default_player_nick_names
+from esm.core.esports.moba.generator.generate_players import (
+    Lanes,
+    MobaPlayerGenerator,
+    MobaPlayerGeneratorError,
+)
 from esm.core.esports.moba.mobaplayer import MobaPlayer
 from esm.core.utils import get_default_names_file, load_list_from_file
 
@@ -34,3 +43,122 @@ def test_generate_rand_moba_player(mock_champions: list[Champion]):
     assert len(players) == 5
     for player in players:
         assert isinstance(player, MobaPlayer)
+
+
+def test_generate_many_moba_players(mock_champions: list[Champion]):
+    names = load_list_from_file(get_default_names_file())
+    moba_player_gen = MobaPlayerGenerator(
+        champions_list=mock_champions, names=names, rng=random.Random(1)
+    )
+    lanes = [Lanes.TOP, Lanes.JNG, Lanes.MID, Lanes.ADC, Lanes.SUP] * 4
+    players = moba_player_gen.generate_many(20, lanes, nationality="Korea")
+    assert len(players) == 20
+    assert len({player.player_id for player in players}) == 20
+    for player, lane in zip(players, lanes):
+        assert isinstance(player, MobaPlayer)
+        assert player.nationality == "Korea"
+        assert player.lanes[lane] == 1
+        assert (
+            moba_player_gen.min_age - 1 <= player.get_age() <= moba_player_gen.max_age
+        )
+
+    other_gen = MobaPlayerGenerator(
+        champions_list=mock_champions, names=names, rng=random.Random(1)
+    )
+    assert [
+        player.serialize() for player in other_gen.generate_many(20, lanes, "Korea")
+    ] == [player.serialize() for player in players]
+
+
+def test_generate_many_with_wrong_amount_of_lanes(mock_champions: list[Champion]):
+    names = load_list_from_file(get_default_names_file())
+    moba_player_gen = MobaPlayerGenerator(champions_list=mock_champions, names=names)
+    with pytest.raises(MobaPlayerGeneratorError):
+        moba_player_gen.generate_many(3, [Lanes.TOP])
+
+
+def test_player_region_index(mock_champions: list[Champion]):
+    names = load_list_from_file(get_default_names_file())
+    moba_player_gen = MobaPlayerGenerator(champions_list=mock_champions, names=names)
+    for region in names:
+        player_region = moba_player_gen.get_region(region["region"])
+        assert player_region.first_names == tuple(region["male"])
+        assert player_region.surnames == tuple(region["surnames"])
+        assert moba_player_gen.get_nationality_skill(region["region"]) == (
+            region["mu"],
+            region["sigma"],
+        )
+
+    with pytest.raises(MobaPlayerGeneratorError):
+        moba_player_gen.generate_first_name("Atlantis")
+
+
+def test_generate_champion_pool(mock_champions: list[Champion]):
+    names = load_list_from_file(get_default_names_file())
+    moba_player_gen = MobaPlayerGenerator(champions_list=mock_champions, names=names)
+    for lane in Lanes:
+        lane_champions = moba_player_gen.lane_champions[lane]
+        champion_pool = moba_player_gen.generate_champions(lane, 3)
+        assert len(champion_pool) == 3
+        assert len({champion.champion_id for champion in champion_pool}) == 3
+        assert all(
+            any(champion.champion_id == ch.champion_id for ch in lane_champions)
+            for champion in champion_pool
+        )
+        assert len(moba_player_gen.generate_champions(lane, 1000)) == len(
+            lane_champions
+        )
+
+
+def test_generate_unique_nick_names(mock_champions: list[Champion]):
+    names = load_list_from_file(get_default_names_file())
+    moba_player_gen = MobaPlayerGenerator(
+        champions_list=mock_champions, names=names, rng=random.Random(1)
+    )
+    moba_player_gen.nick_names = ("Faker", "Faker2", "Doublelift")
+    moba_player_gen.available_nick_names = list(moba_player_gen.nick_names)
+    nick_names = [moba_player_gen.generate_nick() for _ in range(10)]
+    assert len(set(nick_names)) == 10
+    assert set(moba_player_gen.nick_names) <= set(nick_names)
+    assert moba_player_gen.used_nick_names == set(nick_names)
+
+
+def test_default_nick_names_are_cached():
+    nick_names = get_default_player_nick_names()
+    assert nick_names is get_default_player_nick_names()
+    assert len(nick_names) == len(set(nick_names))
+    assert all(nick_name and nick_name == nick_name.strip() for nick_name in nick_names)
+
+
+def test_choose_many_champion_pools(mock_champions: list[Champion]):
+    names = load_list_from_file(get_default_names_file())
+    moba_player_gen = MobaPlayerGenerator(
+        champions_list=mock_champions, names=names, rng=random.Random(1)
+    )
+    lanes = list(Lanes) * 20
+    for amount in [0, 3, 1000]:
+        pools = moba_player_gen.choose_many_champions(lanes, amount)
+        assert len(pools) == len(lanes)
+        for pool, lane in zip(pools, lanes):
+            lane_champions = moba_player_gen.lane_champions[lane]
+            assert len({champion.champion_id for champion in pool}) == len(pool)
+            assert all(champion in lane_champions for champion in pool)
+            if amount == 0:
+                assert 1 <= len(pool) <= len(lane_champions)
+            else:
+                assert len(pool) == min(amount, len(lane_champions))
+
+
+def test_generate_many_unique_nick_names(mock_champions: list[Champion]):
+    names = load_list_from_file(get_default_names_file())
+    moba_player_gen = MobaPlayerGenerator(
+        champions_list=mock_champions, names=names, rng=random.Random(1)
+    )
+    moba_player_gen.nick_names = ("Faker", "Faker2", "Doublelift", "Rookie")
+    moba_player_gen.available_nick_names = list(moba_player_gen.nick_names)
+    nick_names = moba_player_gen.generate_many_nicks(3)
+    nick_names += moba_player_gen.generate_many_nicks(7)
+    assert len(set(nick_names)) == 10
+    assert set(moba_player_gen.nick_names) <= set(nick_names)
+    assert moba_player_gen.used_nick_names == set(nick_names)
+    assert moba_player_gen.available_nick_names == []
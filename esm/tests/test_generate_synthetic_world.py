@@ -0,0 +1,81 @@
+#      eSports Manager - free and open source eSports Management game
+#      Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import sys
+from pathlib import Path
+
+import pytest
+
+from esm.core.db import read_entity_stream
+from esm.core.esports.moba.generator.generate_synthetic_world import (
+    SyntheticWorldGenerator,
+    SyntheticWorldGeneratorError,
+    SyntheticWorldSettings,
+)
+from esm.core.utils.seed import SeedTree
+
+
+@pytest.fixture
+def settings() -> SyntheticWorldSettings:
+    return SyntheticWorldSettings(
+        regions=3, teams=7, players=50, champions=200, champion_pool=3
+    )
+
+
+def test_generate_synthetic_world(
+    settings: SyntheticWorldSettings, tmp_path: Path
+) -> None:
+    world_gen = SyntheticWorldGenerator(settings, SeedTree(1), max_workers=2)
+    report = world_gen.generate(tmp_path, ".ndjson")
+    champions, teams, players, regions = [
+        list(read_entity_stream(file))
+        for file in world_gen.get_files(tmp_path, ".ndjson")
+    ]
+
+    assert len(champions) == 200
+    assert len({champion["name"] for champion in champions}) == 200
+    assert len(teams) == 7
+    assert len(players) == 50
+    assert len(regions) == 3
+    assert sum(len(region["teams"]) for region in regions) == 7
+    champion_ids = {champion["id"] for champion in champions}
+    for player in players:
+        assert len(player["champion_pool"]) <= 3
+        for champion in player["champion_pool"]:
+            assert champion["champion_id"] in champion_ids
+
+    assert report.generation_time > 0
+    if sys.platform != "win32":
+        assert report.peak_memory > 0
+        assert report.worker_peak_memory > 0
+    assert report.output_size == sum(file.stat().st_size for file in tmp_path.iterdir())
+
+
+def test_synthetic_world_is_independent_of_workers(
+    settings: SyntheticWorldSettings, tmp_path: Path
+) -> None:
+    for max_workers in [1, 3]:
+        world_gen = SyntheticWorldGenerator(settings, SeedTree(1), max_workers)
+        world_gen.generate(tmp_path / str(max_workers))
+
+    for name in ["champions", "teams", "players", "regions"]:
+        assert (tmp_path / "1" / f"{name}.cbor").read_bytes() == (
+            tmp_path / "3" / f"{name}.cbor"
+        ).read_bytes()
+
+
+def test_synthetic_world_without_enough_players() -> None:
+    with pytest.raises(SyntheticWorldGeneratorError):
+        SyntheticWorldGenerator(SyntheticWorldSettings(teams=10, players=49))
@@ -14,19 +14,33 @@
 #      You should have received a copy of the GNU General Public License
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 from datetime import timedelta
+from typing import Optional
 
 import pytest
 
+from esm.core.esports.moba.simulation.events import (
+    get_event_definitions,
+    get_event_schedule,
+)
+from esm.core.esports.moba.simulation.moba_event_log import (
+    MobaEventLog,
+    MobaEventLogError,
+)
+from esm.core.esports.moba.simulation.moba_event_schedule import MobaEventSchedule
+from esm.core.esports.moba.simulation.moba_sim_batch import (
+    MobaSimBatchEngine,
+    MobaSimBatchError,
+)
 from esm.core.esports.moba.simulation.moba_sim_engine import (
     MobaEventFactory,
     MobaEventType,
     MobaSimEngine,
-    get_event_definitions,
 )
 from esm.core.esports.moba.simulation.moba_sim_match import (
     MobaSimMatch,
     NoChampionError,
 )
+from esm.core.esports.moba.simulation.picksbans import PicksBans
 
 
 def test_try_start_simulation_without_picking_champions(
@@ -185,3 +199,211 @@ def test_get_enabled_events_after_inhibitor_cooldown(
     ]
     sim_engine.get_enabled_events()
     assert sim_engine.enabled_events == expected_enabled_events
+
+
+def test_event_schedule_after_last_minute() -> None:
+    schedule = MobaEventSchedule(get_event_definitions())
+    events = schedule.get_enabled_events(schedule.last_minute, False, False)
+    assert schedule.get_enabled_events(90, False, False) == events
+    assert MobaEventType.JUNGLE_HERALD not in events
+    assert schedule.get_event_sampler(90, False, False) is (
+        schedule.get_event_sampler(schedule.last_minute, False, False)
+    )
+
+
+def test_event_schedule_with_dynamic_events() -> None:
+    definitions = get_event_definitions()
+    schedule = MobaEventSchedule(definitions)
+    events = schedule.get_enabled_events(30, False, False)
+    dynamic_events, sampler = schedule.get_event_sampler(30, True, True)
+    assert dynamic_events == events + [
+        MobaEventType.INHIB_ASSAULT,
+        MobaEventType.NEXUS_ASSAULT,
+    ]
+    assert len(sampler) == len(dynamic_events)
+    priorities = [definitions[event]["priority"] for event in dynamic_events]
+    chances = list(sampler.probabilities)
+    for index, alias in enumerate(sampler.aliases):
+        if alias != index:
+            chances[alias] += 1.0 - sampler.probabilities[index]
+    for chance, priority in zip(chances, priorities):
+        assert chance / len(sampler) == pytest.approx(priority / sum(priorities))
+
+
+def test_event_factory_uses_given_definitions(
+    moba_match_simulation: MobaSimMatch,
+) -> None:
+    definitions = get_event_definitions()
+    definitions[MobaEventType.FIGHT]["points"] = 7
+    definitions[MobaEventType.FIGHT]["duration"] = 33
+    factory = MobaEventFactory(event_definitions=definitions)
+    event = factory.create_event(
+        MobaEventType.FIGHT,
+        moba_match_simulation.team1,
+        moba_match_simulation.team2,
+        0,
+    )
+    assert factory.get_points(MobaEventType.FIGHT) == 7
+    assert event.duration == 33
+
+
+def test_run_simulation(
+    moba_match_simulation: MobaSimMatch, moba_picks_bans: PicksBans
+) -> None:
+    moba_picks_bans.run()
+    moba_match_simulation.run()
+    assert moba_match_simulation.simulation_engine.is_match_over()
+    assert moba_match_simulation.simulation_engine.match_time > timedelta(0)
+
+
+def test_cached_aggregates_match_player_totals(
+    moba_match_simulation: MobaSimMatch, moba_picks_bans: PicksBans
+) -> None:
+    moba_picks_bans.run()
+    moba_match_simulation.run()
+    for team in [moba_match_simulation.team1, moba_match_simulation.team2]:
+        assert team.cached_aggregates
+        cached = (team.points, team.kills, team.deaths, team.player_overall)
+        team.clear_aggregates_cache()
+        assert cached == (team.points, team.kills, team.deaths, team.player_overall)
+
+
+def test_reset_values_clears_cached_aggregates(
+    moba_match_simulation: MobaSimMatch, moba_picks_bans: PicksBans
+) -> None:
+    moba_picks_bans.run()
+    team = moba_match_simulation.team1
+    team.cache_aggregates()
+    team.add_points(team.players[0], 10)
+    team.add_kill(team.players[0])
+    assert team.points == 10
+    assert team.kills == 1
+    team.reset_values()
+    assert not team.cached_aggregates
+    assert team.points == 0
+    assert team.kills == 0
+
+
+def test_batch_simulation(moba_match_simulation: MobaSimMatch) -> None:
+    runs = 50
+    engine = MobaSimBatchEngine(
+        moba_match_simulation.team1, moba_match_simulation.team2, runs
+    )
+    result = engine.run()
+    assert result.team1_wins + result.team2_wins == runs
+    assert result.team1_win_rate + result.team2_win_rate == pytest.approx(1.0)
+    assert len(result.game_lengths) == runs
+    assert sum(result.get_game_length_distribution().values()) == runs
+    assert sum(result.objectives[MobaEventType.NEXUS_ASSAULT]) == runs
+    assert result.average_game_length > timedelta(0)
+
+
+def test_engines_share_event_schedule(moba_match_simulation: MobaSimMatch) -> None:
+    team1 = moba_match_simulation.team1
+    team2 = moba_match_simulation.team2
+    schedule = get_event_schedule()
+    assert MobaSimEngine(team1, team2).schedule is schedule
+    assert MobaSimEngine(team1, team2).schedule is schedule
+    assert MobaSimBatchEngine(team1, team2, 1).schedule is schedule
+    assert moba_match_simulation.simulation_engine.event_definitions is (
+        schedule.event_definitions
+    )
+
+
+def test_batch_simulation_without_runs(moba_match_simulation: MobaSimMatch) -> None:
+    with pytest.raises(MobaSimBatchError):
+        MobaSimBatchEngine(moba_match_simulation.team1, moba_match_simulation.team2, 0)
+
+
+def test_inhibitor_respawn_uses_seconds(moba_match_simulation: MobaSimMatch) -> None:
+    inhibitors = moba_match_simulation.team1.inhibitors
+    inhibitors.take_down_inhib("mid", 600, timedelta(minutes=5))
+    assert inhibitors.mid_respawn == 900
+    inhibitors.update_cooldown(899)
+    assert not inhibitors.is_inhibitor_up("mid")
+    inhibitors.update_cooldown(900)
+    assert inhibitors.is_inhibitor_up("mid")
+    assert inhibitors.mid_respawn == 0
+
+
+def test_match_time_is_stored_in_seconds(
+    moba_match_simulation: MobaSimMatch,
+) -> None:
+    sim_engine = moba_match_simulation.simulation_engine
+    sim_engine.match_time = timedelta(minutes=14, seconds=30)
+    assert sim_engine.clock == 870
+    sim_engine.get_enabled_events()
+    event = sim_engine.get_event()
+    assert event.event_time == 870
+    assert event.get_event_time() == timedelta(minutes=14, seconds=30)
+
+
+def test_iter_events(
+    moba_match_simulation: MobaSimMatch, moba_picks_bans: PicksBans
+) -> None:
+    moba_picks_bans.run()
+    events = list(moba_match_simulation.iter_events())
+    sim_engine = moba_match_simulation.simulation_engine
+    assert sim_engine.is_match_over()
+    assert len(sim_engine.event_log) == len(events)
+    assert sim_engine.clock == sum(event.duration for event in events)
+
+
+def test_iter_events_without_champions(moba_match_simulation: MobaSimMatch) -> None:
+    with pytest.raises(NoChampionError):
+        next(moba_match_simulation.iter_events())
+
+
+@pytest.mark.parametrize("history_size", [None, 0, 5])
+def test_bounded_event_history(
+    moba_match_simulation: MobaSimMatch,
+    moba_picks_bans: PicksBans,
+    history_size: Optional[int],
+) -> None:
+    moba_picks_bans.run()
+    moba_match = MobaSimMatch(
+        moba_match_simulation.match,
+        moba_match_simulation.team1,
+        moba_match_simulation.team2,
+        history_size=history_size,
+    )
+    event_history = moba_match.simulation_engine.event_history
+    for amount, event in enumerate(moba_match.iter_events(), start=1):
+        if history_size is None:
+            assert len(event_history) == amount
+        else:
+            assert len(event_history) == min(history_size, amount)
+        if event_history:
+            assert event_history[-1] is event
+
+    # Finished matches only keep the event log
+    assert len(event_history) == 0
+
+
+def test_event_log_rebuild(
+    moba_match_simulation: MobaSimMatch, moba_picks_bans: PicksBans
+) -> None:
+    moba_picks_bans.run()
+    team1 = moba_match_simulation.team1
+    team2 = moba_match_simulation.team2
+    events = list(moba_match_simulation.iter_events())
+    event_log = MobaEventLog.from_bytes(
+        moba_match_simulation.simulation_engine.event_log.to_bytes()
+    )
+    rebuilt_events = event_log.rebuild(team1, team2)
+    assert len(rebuilt_events) == len(events)
+    for event, rebuilt_event in zip(events, rebuilt_events):
+        assert rebuilt_event.event_type == event.event_type
+        assert rebuilt_event.event_time == event.event_time
+        assert rebuilt_event.duration == event.duration
+        assert rebuilt_event.outcome == event.outcome
+        assert rebuilt_event.acting_team is event.acting_team
+        assert rebuilt_event.points == event.points
+
+
+def test_event_log_from_invalid_bytes() -> None:
+    data = MobaEventLog().to_bytes()
+    with pytest.raises(MobaEventLogError):
+        MobaEventLog.from_bytes(data[:2])
+    with pytest.raises(MobaEventLogError):
+        MobaEventLog.from_bytes(data + b"\x00")
@@ -13,7 +13,35 @@
 #
 #      You should have received a copy of the GNU General Public License
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
-from esm.core.esports.moba.simulation.picksbans import PBPhase, PicksBans
+import asyncio
+import random
+import time
+
+import pytest
+
+from esm.core.esports.moba.champion import Champion
+from esm.core.esports.moba.champion_registry import (
+    ChampionRegistry,
+    ChampionRegistryError,
+)
+from esm.core.esports.moba.draft_executor import (
+    DraftExecutor,
+    DraftExecutorError,
+    DraftStatistics,
+)
+from esm.core.esports.moba.moba_definitions import Lanes
+from esm.core.esports.moba.mobateam import MobaTeam
+from esm.core.esports.moba.simulation.draft_pool import DraftChampionPool, DraftError
+from esm.core.esports.moba.simulation.picksbans import (
+    DRAFT_ORDER,
+    PBAction,
+    PBPhase,
+    PickBanInput,
+    PickBansAsyncHumanInput,
+    PicksBans,
+)
+from esm.core.esports.moba.simulation.picksbans_mcts import PicksBansMCTS
+from esm.core.utils.seed import SeedTree
 
 
 def test_first_ban_phase(moba_picks_bans: PicksBans):
@@ -87,3 +115,226 @@ def test_picks_and_bans_run(moba_picks_bans: PicksBans):
     assert moba_picks_bans.bans_count == 10
     assert moba_picks_bans.picks_count == 10
     assert moba_picks_bans.pb_phase == PBPhase.PB_DONE
+
+
+def test_picks_and_bans_do_not_change_champion_list(moba_picks_bans: PicksBans):
+    champions = moba_picks_bans.champions.copy()
+    moba_picks_bans.run()
+    assert moba_picks_bans.champions == champions
+    assert len(moba_picks_bans.pool) == len(champions) - 20
+
+
+def test_draft_pool_picks_and_bans(mock_champions: list[Champion]):
+    registry = ChampionRegistry(mock_champions)
+    pool = DraftChampionPool(registry)
+    other_pool = DraftChampionPool(registry)
+    for champion in mock_champions[:3]:
+        pool.ban(champion)
+    pool.pick(mock_champions[3])
+
+    assert len(pool) == len(mock_champions) - 4
+    assert len(other_pool) == len(mock_champions)
+    assert pool.get_state() != other_pool.get_state()
+    for lane in Lanes:
+        lane_champions = pool.get_lane_champions(lane)
+        assert all(champion in pool for champion in lane_champions)
+        assert all(champion not in lane_champions for champion in mock_champions[:4])
+
+    with pytest.raises(DraftError):
+        pool.pick(mock_champions[0])
+
+
+def test_draft_state_is_hashable(mock_champions: list[Champion]):
+    registry = ChampionRegistry(mock_champions)
+    pool1 = DraftChampionPool(registry)
+    pool2 = DraftChampionPool(registry)
+    pool1.ban(mock_champions[0])
+    pool2.ban(mock_champions[0])
+    assert {pool1.get_state(), pool2.get_state()} == {pool1.get_state()}
+
+
+def test_champion_registry_is_read_only(mock_champions: list[Champion]):
+    registry = ChampionRegistry(mock_champions)
+    assert registry[registry.get_index(mock_champions[5].champion_id)] is (
+        mock_champions[5]
+    )
+    with pytest.raises(AttributeError):
+        registry.champions = ()
+    with pytest.raises(TypeError):
+        registry.indexes[mock_champions[0].champion_id] = 1
+    with pytest.raises(ChampionRegistryError):
+        ChampionRegistry(mock_champions + mock_champions[:1])
+
+
+def test_draft_order(moba_picks_bans: PicksBans):
+    actions = []
+
+    class RecordingInput(PickBanInput):
+        def __init__(self, team: int):
+            self.team = team
+
+        def pick(self):
+            actions.append((self.team, PBAction.PICK))
+
+        def ban(self):
+            actions.append((self.team, PBAction.BAN))
+
+    PicksBans(
+        [],
+        moba_picks_bans.team1,
+        moba_picks_bans.team2,
+        RecordingInput(0),
+        RecordingInput(1),
+    ).run()
+    assert tuple(actions) == DRAFT_ORDER
+
+
+def test_mcts_draft(moba_picks_bans: PicksBans, mock_champions: list[Champion]):
+    team1 = moba_picks_bans.team1
+    team2 = moba_picks_bans.team2
+    mcts = PicksBansMCTS(team1, team2, iterations=50, rng=random.Random(1))
+    picks_bans = PicksBans(mock_champions, team1, team2, team1_input=mcts)
+    picks_bans.run()
+    assert len(team1.picks) == len(team2.picks) == 5
+    assert len(team1.bans) == len(team2.bans) == 5
+    assert len(picks_bans.pool) == len(mock_champions) - 20
+    assert {player.champion.champion_id for player in team1.players} == {
+        champion.champion_id for champion in team1.picks
+    }
+
+
+def test_mcts_reuses_search_tree(
+    moba_picks_bans: PicksBans, mock_champions: list[Champion]
+):
+    team1 = moba_picks_bans.team1
+    team2 = moba_picks_bans.team2
+    mcts = PicksBansMCTS(team1, team2, iterations=50, rng=random.Random(1))
+    PicksBans(mock_champions, team1, team2, team1_input=mcts)
+    mcts.search()
+    root = mcts.nodes[mcts.get_state()]
+    assert root.visits == 50
+    mcts.search()
+    assert root.visits == 100
+    mcts.ban()
+    assert len(team1.bans) == 1
+    assert mcts.nodes[mcts.get_state()].visits > 0
+    assert mcts.evaluations
+
+
+def test_mcts_time_budget(moba_picks_bans: PicksBans, mock_champions: list[Champion]):
+    team1 = moba_picks_bans.team1
+    team2 = moba_picks_bans.team2
+    mcts = PicksBansMCTS(team1, team2, iterations=None, time_budget=0.01)
+    picks_bans = PicksBans(mock_champions, team1, team2, team1_input=mcts)
+    start = time.perf_counter()
+    picks_bans.run()
+    assert time.perf_counter() - start < 1.0
+    assert len(team1.picks) == 5
+
+
+def test_mcts_without_budget(moba_picks_bans: PicksBans):
+    with pytest.raises(DraftError):
+        PicksBansMCTS(
+            moba_picks_bans.team1,
+            moba_picks_bans.team2,
+            iterations=None,
+            time_budget=None,
+        )
+
+
+def test_draft_executor(
+    mock_moba_teams: list[MobaTeam], mock_champions: list[Champion]
+):
+    matchups = [(mock_moba_teams[0], mock_moba_teams[1])]
+    statistics = DraftExecutor(
+        mock_champions, matchups, 20, SeedTree(1234), max_workers=2, chunk_size=8
+    ).run()
+    assert statistics.drafts == 20
+    assert sum(statistics.picks.values()) == 20 * 10
+    assert sum(statistics.bans.values()) == 20 * 10
+    champion_id = statistics.picks.most_common(1)[0][0]
+    assert 0.0 < statistics.get_pick_rate(champion_id) <= 1.0
+    assert sum(statistics.get_lane_distribution(champion_id).values()) == (
+        pytest.approx(1.0)
+    )
+
+    other_statistics = DraftExecutor(
+        mock_champions, matchups, 20, SeedTree(1234), max_workers=1, chunk_size=20
+    ).run()
+    assert other_statistics == statistics
+
+
+def test_draft_executor_without_matchups(mock_champions: list[Champion]):
+    with pytest.raises(DraftExecutorError):
+        DraftExecutor(mock_champions, [], 10)
+
+
+def test_empty_draft_statistics(mock_champions: list[Champion]):
+    statistics = DraftStatistics()
+    champion_id = mock_champions[0].champion_id
+    assert statistics.get_pick_rate(champion_id) == 0.0
+    assert statistics.get_ban_rate(champion_id) == 0.0
+    assert statistics.get_lane_distribution(champion_id) == {
+        lane: 0.0 for lane in Lanes
+    }
+
+
+def test_run_async_with_ai(moba_picks_bans: PicksBans):
+    asyncio.run(moba_picks_bans.run_async())
+    assert moba_picks_bans.is_over
+    assert moba_picks_bans.pb_phase == PBPhase.PB_DONE
+    assert len(moba_picks_bans.team1.picks) == len(moba_picks_bans.team2.picks) == 5
+    assert all(player.champion is not None for player in moba_picks_bans.team1.players)
+
+
+def test_run_async_with_human_input(
+    moba_picks_bans: PicksBans, mock_champions: list[Champion]
+):
+    team1 = moba_picks_bans.team1
+    team2 = moba_picks_bans.team2
+    human = PickBansAsyncHumanInput()
+    picks_bans = PicksBans(mock_champions, team1, team2, team1_input=human)
+
+    async def play():
+        while not picks_bans.is_over:
+            if human.waiting is not None and human.queue.empty():
+                lane = next(lane for lane in Lanes if human.ai.picks[lane] is None)
+                human.submit(picks_bans.pool.get_lane_champions(lane)[0], lane)
+            await asyncio.sleep(0)
+
+    async def run():
+        await asyncio.gather(picks_bans.run_async(), play())
+
+    asyncio.run(run())
+    assert len(team1.picks) == len(team1.bans) == 5
+    for player in team1.players:
+        assert player.champion.lanes[player.lane] == 1.0
+
+
+def test_run_async_timeout_falls_back_to_ai(
+    moba_picks_bans: PicksBans, mock_champions: list[Champion]
+):
+    team1 = moba_picks_bans.team1
+    team2 = moba_picks_bans.team2
+    picks_bans = PicksBans(
+        mock_champions,
+        team1,
+        team2,
+        team1_input=PickBansAsyncHumanInput(0.001, 0.001),
+        team2_input=PickBansAsyncHumanInput(0.001, 0.001),
+    )
+    asyncio.run(picks_bans.run_async())
+    assert picks_bans.is_over
+    assert len(team1.picks) == len(team2.picks) == 5
+    assert all(player.champion is not None for player in team2.players)
+
+
+def test_champion_skill_matrix(moba_picks_bans: PicksBans):
+    skill_matrix = moba_picks_bans.skill_matrix
+    for player in moba_picks_bans.team1.players + moba_picks_bans.team2.players:
+        row = skill_matrix.get_row(player)
+        assert len(row) == len(moba_picks_bans.champions)
+        for champion in moba_picks_bans.champions[:10]:
+            assert skill_matrix.get_skill(player, champion) == pytest.approx(
+                player.get_projected_champion_skill(champion)
+            )
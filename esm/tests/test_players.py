@@ -17,7 +17,13 @@ import uuid
 
 import pytest
 
-from esm.core.esports.moba.mobaplayer import MobaPlayer
+from esm.core.esports.moba.moba_definitions import Lanes
+from esm.core.esports.moba.mobaplayer import (
+    ChampionMastery,
+    MobaPlayer,
+    MobaPlayerChampion,
+    UtilityAttributes,
+)
 
 
 @pytest.fixture
@@ -45,3 +51,65 @@ def test_player_get_from_dict(player, player_dict):
 
 def test_player_str(player):
     assert player.__str__() == "NickName"
+
+
+def test_player_overall_is_updated_when_attributes_change(player):
+    attributes = player.attributes
+    overalls = {lane: attributes.get_overall(lane) for lane in Lanes}
+    assert overalls == {
+        Lanes.TOP: 85,
+        Lanes.JNG: 84,
+        Lanes.MID: 85,
+        Lanes.ADC: 85,
+        Lanes.SUP: 84,
+    }
+
+    attributes.mechanics.reflexes += 50
+    overalls = {lane: attributes.get_overall(lane) for lane in Lanes}
+    assert overalls == {
+        Lanes.TOP: 86,
+        Lanes.JNG: 84,
+        Lanes.MID: 86,
+        Lanes.ADC: 88,
+        Lanes.SUP: 84,
+    }
+
+    attributes.utility = UtilityAttributes(99, 99, 99)
+    overalls = {lane: attributes.get_overall(lane) for lane in Lanes}
+    assert overalls == {
+        Lanes.TOP: 88,
+        Lanes.JNG: 91,
+        Lanes.MID: 88,
+        Lanes.ADC: 89,
+        Lanes.SUP: 91,
+    }
+
+
+def test_player_champion_mastery_index(player, moba_player_champions):
+    champion = moba_player_champions[1]
+    assert player.get_champion_mastery(champion.champion_id) == ChampionMastery.DIAMOND
+    assert player.get_champion_mastery(uuid.UUID(int=2)) is None
+
+    new_champion = MobaPlayerChampion(uuid.UUID(int=2), ChampionMastery.SILVER, 0.0)
+    player.champion_pool.append(new_champion)
+    assert player.get_champion_mastery(uuid.UUID(int=2)) == ChampionMastery.SILVER
+
+    player.champion_pool = [new_champion]
+    assert player.get_champion_mastery(champion.champion_id) is None
+
+
+def test_player_champion_mastery_index_after_in_place_changes(
+    player, moba_player_champions
+):
+    removed = moba_player_champions[0]
+    assert player.get_champion_mastery(removed.champion_id) == ChampionMastery.GOLD
+
+    other = MobaPlayerChampion(uuid.UUID(int=3), ChampionMastery.BRONZE, 0.0)
+    player.champion_pool[0] = other
+    assert player.get_champion_mastery(other.champion_id) == ChampionMastery.BRONZE
+    assert player.get_champion_mastery(removed.champion_id) is None
+
+    player.champion_pool.remove(other)
+    player.champion_pool.append(removed)
+    assert player.get_champion_mastery(other.champion_id) is None
+    assert player.get_champion_mastery(removed.champion_id) == ChampionMastery.GOLD
@@ -0,0 +1,53 @@
+#      eSports Manager - free and open source eSports Management game
+#      Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from concurrent.futures import Future
+
+from esm.core.utils.process_pool import (
+    create_process_pool,
+    get_worker_context,
+    map_bounded,
+)
+
+
+def add_context(value: int) -> int:
+    return value + get_worker_context()
+
+
+class RecordingExecutor:
+    def __init__(self):
+        self.submitted = 0
+
+    def submit(self, function, *args) -> Future:
+        self.submitted += 1
+        future = Future()
+        future.set_result(function(*args))
+        return future
+
+
+def test_map_bounded_keeps_order_with_context() -> None:
+    with create_process_pool(100, max_workers=2) as executor:
+        results = list(map_bounded(executor, add_context, ((i,) for i in range(20)), 2))
+
+    assert results == [i + 100 for i in range(20)]
+
+
+def test_map_bounded_limits_tasks_in_flight() -> None:
+    executor = RecordingExecutor()
+    results = map_bounded(executor, abs, ((-i,) for i in range(10)), max_workers=1)
+    assert next(results) == 0
+    assert executor.submitted == 2
+    assert list(results) == list(range(1, 10))
+    assert executor.submitted == 10
@@ -0,0 +1,87 @@
+#      eSports Manager - free and open source eSports Management game
+#      Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import random
+from collections import Counter
+
+import pytest
+
+from esm.core.utils.sampling import AliasSampler, SamplerError, WeightedSampler
+
+
+@pytest.mark.parametrize("sampler_class", [WeightedSampler, AliasSampler])
+def test_sampler_distribution(sampler_class) -> None:
+    rng = random.Random(42)
+    sampler = sampler_class([1.0, 0.0, 3.0, 6.0])
+    draws = Counter(sampler.sample(rng) for _ in range(20000))
+    assert draws[1] == 0
+    assert draws[0] / 20000 == pytest.approx(0.1, abs=0.02)
+    assert draws[2] / 20000 == pytest.approx(0.3, abs=0.02)
+    assert draws[3] / 20000 == pytest.approx(0.6, abs=0.02)
+
+
+def test_weighted_sampler_update() -> None:
+    rng = random.Random(42)
+    sampler = WeightedSampler([1.0, 2.0, 3.0, 4.0, 5.0])
+    assert sampler.total == pytest.approx(15.0)
+    sampler.update(0, 10.0)
+    sampler.remove(4)
+    assert sampler.total == pytest.approx(19.0)
+    assert sampler.get_weight(4) == 0.0
+    assert 4 not in {sampler.sample(rng) for _ in range(1000)}
+
+
+def test_weighted_sampler_remove_all() -> None:
+    rng = random.Random(42)
+    sampler = WeightedSampler([0.1, 0.2, 0.3])
+    sampler.remove(0)
+    sampler.remove(2)
+    assert {sampler.sample(rng) for _ in range(100)} == {1}
+    sampler.remove(1)
+    assert sampler.total == 0.0
+    with pytest.raises(SamplerError):
+        sampler.sample(rng)
+
+
+def test_weighted_sampler_after_removing_most_weights() -> None:
+    rng = random.Random(42)
+    sampler = WeightedSampler(rng.random() * 1e6 for _ in range(1000))
+    for _ in range(10):
+        for index in range(1000):
+            sampler.update(index, rng.random() * 1e-3)
+
+    kept = set(rng.sample(range(1000), 10))
+    for index in range(1000):
+        if index not in kept:
+            sampler.remove(index)
+
+    assert {sampler.sample(rng) for _ in range(10000)} <= kept
+
+
+def test_weighted_sampler_with_rounding_errors() -> None:
+    rng = random.Random(42)
+    sampler = WeightedSampler([1.0, 1.0, 1.0, 1.0])
+    sampler.remove(1)
+    # Simulates rounding errors that make the tree point draws at a removed index
+    sampler.tree[2] += 0.5
+    sampler.tree[4] += 0.5
+    assert 1 not in {sampler.sample(rng) for _ in range(1000)}
+
+
+def test_sampler_invalid_weights() -> None:
+    with pytest.raises(SamplerError):
+        WeightedSampler([1.0, -1.0])
+    with pytest.raises(SamplerError):
+        AliasSampler([0.0, 0.0])
@@ -0,0 +1,87 @@
+#      eSports Manager - free and open source eSports Management game
+#      Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import random
+
+from esm.core.esports.moba.champion import Champion
+from esm.core.esports.moba.generator import ChampionGenerator, MobaTeamGenerator
+from esm.core.esports.moba.mobaplayer import Lanes, MobaPlayerSimulation
+from esm.core.esports.moba.mobateam import MobaTeam, MobaTeamSimulation
+from esm.core.esports.moba.simulation.moba_sim_match import MobaSimMatch
+from esm.core.esports.moba.simulation.picksbans import PicksBans
+from esm.core.utils.seed import SeedTree
+
+
+def get_team_simulation(team: MobaTeam) -> MobaTeamSimulation:
+    players = [
+        MobaPlayerSimulation(player, lane) for lane, player in zip(Lanes, team.roster)
+    ]
+    return MobaTeamSimulation(team, players, False)
+
+
+def simulate_match(
+    teams: list[MobaTeam], champions: list[Champion], seed_tree: SeedTree
+) -> bytes:
+    team1 = get_team_simulation(teams[0])
+    team2 = get_team_simulation(teams[1])
+    PicksBans(
+        champions.copy(), team1, team2, rng=seed_tree.spawn("draft").get_rng()
+    ).run()
+    match = MobaSimMatch(None, team1, team2, rng=seed_tree.spawn("match").get_rng())
+    match.run()
+    return match.simulation_engine.event_log.to_bytes()
+
+
+def test_seed_tree_is_deterministic():
+    tree = SeedTree(1234)
+    assert tree.spawn("match", 1).seed == SeedTree(1234).spawn("match", 1).seed
+    assert tree.spawn("match", 1).seed == tree.spawn("match").spawn(1).seed
+    assert tree.spawn("match", 1).seed != tree.spawn("match", 2).seed
+    assert tree.spawn("match", 1).seed != SeedTree(4321).spawn("match", 1).seed
+
+
+def test_generate_champions_with_same_seed(mock_champion_defs):
+    champions = [
+        [
+            champion.serialize()
+            for champion in map(
+                ChampionGenerator(random.Random(42)).generate, mock_champion_defs
+            )
+        ]
+        for _ in range(2)
+    ]
+    assert champions[0] == champions[1]
+
+
+def test_generate_teams_with_same_seed(
+    mock_champions, names_file, mock_moba_team_definitions
+):
+    teams = []
+    for _ in range(2):
+        team_gen = MobaTeamGenerator(mock_champions, names_file, rng=random.Random(42))
+        teams.append(
+            [
+                [player.serialize() for player in team_gen.generate(team_def).roster]
+                for team_def in mock_moba_team_definitions
+            ]
+        )
+
+    assert teams[0] == teams[1]
+
+
+def test_simulate_match_with_same_seed(mock_moba_teams, mock_champions):
+    tree = SeedTree(1234)
+    event_log = simulate_match(mock_moba_teams, mock_champions, tree)
+    assert event_log == simulate_match(mock_moba_teams, mock_champions, tree)
@@ -0,0 +1,235 @@
+#      eSports Manager - free and open source eSports Management game
+#      Copyright (C) 2020-2024  Pedrenrique G. Guimarães
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from esm.core.db import DB
+from esm.core.esports.moba.champion import Champion
+from esm.core.esports.moba.mobamatch import MobaMatch, MobaMatchResult
+from esm.core.esports.moba.mobaplayer import Lanes
+from esm.core.esports.moba.mobaregion import MobaRegion
+from esm.core.esports.moba.mobateam import MobaTeam
+from esm.core.gamestate import GameState
+from esm.core.sqlite_db import SQLiteDB
+
+
+@pytest.fixture
+def database() -> SQLiteDB:
+    with SQLiteDB() as database:
+        yield database
+
+
+@pytest.fixture
+def region(mock_moba_teams: list[MobaTeam]) -> MobaRegion:
+    return MobaRegion(uuid.uuid4(), "testregion", "TestRegion", "TR", mock_moba_teams)
+
+
+def test_get_world_from_database(
+    database: SQLiteDB,
+    mock_champions: list[Champion],
+    region: MobaRegion,
+) -> None:
+    database.insert_world(mock_champions, [region])
+
+    for champion in mock_champions:
+        assert (
+            database.get_champion(champion.champion_id).serialize()
+            == champion.serialize()
+        )
+    assert len(database.get_champions()) == len(mock_champions)
+
+    for team in region.teams:
+        assert database.get_team(team.team_id).serialize() == team.serialize()
+        assert [
+            player.serialize() for player in database.get_players_by_team(team.team_id)
+        ] == [player.serialize() for player in team.roster]
+        for player in team.roster:
+            assert database.get_player(player.player_id).serialize() == (
+                player.serialize()
+            )
+            assert database.get_team_by_player(player.player_id).team_id == (
+                team.team_id
+            )
+
+    assert database.get_region(region.region_id).serialize() == region.serialize()
+    assert database.get_team(uuid.uuid4()) is None
+    assert database.get_player(uuid.uuid4()) is None
+    assert database.get_region(uuid.uuid4()) is None
+
+
+def test_get_players_by_lane_and_nationality(
+    database: SQLiteDB,
+    mock_champions: list[Champion],
+    region: MobaRegion,
+) -> None:
+    database.insert_world(mock_champions, [region])
+    players = [player for team in region.teams for player in team.roster]
+
+    for lane in Lanes:
+        expected = {
+            player.player_id
+            for player in players
+            if player.lanes.get_best_attribute() == lane
+        }
+        assert {
+            player.player_id for player in database.get_players_by_lane(lane)
+        } == expected
+        assert all(
+            champion.lanes.get_best_attribute() == lane
+            for champion in database.get_champions(lane)
+        )
+
+    for team in region.teams:
+        assert {
+            player.player_id
+            for player in database.get_players_by_nationality(team.nationality)
+        } == {player.player_id for player in team.roster}
+        assert [
+            nationality_team.team_id
+            for nationality_team in database.get_teams_by_nationality(team.nationality)
+        ] == [team.team_id]
+
+
+def test_get_teams_in_bulk(
+    database: SQLiteDB,
+    mock_champions: list[Champion],
+    region: MobaRegion,
+) -> None:
+    database.insert_world(mock_champions, [region])
+    statements = []
+    database.connection.set_trace_callback(statements.append)
+
+    teams = database.get_teams()
+
+    assert [team.serialize() for team in teams] == [
+        team.serialize() for team in region.teams
+    ]
+    # Teams, rosters, champion pools and players, regardless of the amount of teams
+    assert len(statements) == 4
+
+
+def test_free_agents(
+    database: SQLiteDB,
+    mock_champions: list[Champion],
+    mock_moba_teams: list[MobaTeam],
+) -> None:
+    database.insert_champions(mock_champions)
+    database.insert_players(
+        player for team in mock_moba_teams for player in team.roster
+    )
+    database.insert_teams(mock_moba_teams[:2])
+
+    assert {player.player_id for player in database.get_free_agents()} == {
+        player.player_id for player in mock_moba_teams[2].roster
+    }
+    assert len(database.get_teams()) == 2
+
+
+def test_matches(
+    database: SQLiteDB,
+    mock_champions: list[Champion],
+    region: MobaRegion,
+    moba_match: MobaMatch,
+) -> None:
+    database.insert_world(mock_champions, [region])
+    database.insert_matches([moba_match])
+    assert database.get_match(moba_match.game_id).serialize() == (
+        moba_match.serialize()
+    )
+    assert database.get_match_result(moba_match.game_id) is None
+
+    result = MobaMatchResult(
+        moba_match.game_id, moba_match.team2.team_id, 1800, b"event log"
+    )
+    database.insert_match_results([result])
+    assert database.get_match_result(moba_match.game_id) == result
+    match = database.get_match(moba_match.game_id)
+    assert match.victorious_team.team_id == moba_match.team2.team_id
+    assert [
+        match.game_id
+        for match in database.get_matches_by_team(moba_match.team1.team_id)
+    ] == [moba_match.game_id]
+
+
+def test_get_matches_by_team_in_bulk(
+    database: SQLiteDB,
+    mock_champions: list[Champion],
+    region: MobaRegion,
+) -> None:
+    database.insert_world(mock_champions, [region])
+    team1, team2, team3 = region.teams[:3]
+    matches = [
+        MobaMatch(
+            uuid.uuid4(),
+            uuid.uuid4(),
+            team1,
+            opponent,
+            datetime(2020, 1, day, 10, 0),
+        )
+        for day, opponent in enumerate([team2, team3, team2, team3], start=1)
+    ]
+    database.insert_matches(matches)
+    statements = []
+    database.connection.set_trace_callback(statements.append)
+
+    assert [
+        match.serialize() for match in database.get_matches_by_team(team1.team_id)
+    ] == [match.serialize() for match in matches]
+    # Matches, teams, rosters, champion pools and players, regardless of the amount
+    # of matches
+    assert len(statements) == 5
+
+
+def test_database_file(
+    mock_champions: list[Champion], region: MobaRegion, tmp_path: Path
+) -> None:
+    path = tmp_path / "esm.db"
+    with SQLiteDB(path) as database:
+        database.insert_world(mock_champions, [region])
+
+    with SQLiteDB(path) as database:
+        for team in region.teams:
+            assert database.get_team(team.team_id).serialize() == team.serialize()
+
+
+def test_load_from_gamestate(
+    mock_champions: list[Champion], region: MobaRegion
+) -> None:
+    teams = region.teams
+    players = DB.get_moba_players_from_teams(teams)
+    gamestate = GameState(
+        "gamename",
+        "filename",
+        {},
+        "2024",
+        "moba",
+        DB.serialize_regions([region]),
+        DB.serialize_teams(teams),
+        DB.serialize_players(players),
+        DB.serialize_champions(mock_champions),
+    )
+
+    assert DB().load_moba_teams() == []
+    with SQLiteDB() as database:
+        db = DB(database)
+        db.load_from_gamestate(gamestate)
+        assert [team.serialize() for team in db.load_moba_teams()] == [
+            team.serialize() for team in teams
+        ]
+        assert database.get_region(region.region_id).serialize() == region.serialize()